@@ -0,0 +1,75 @@
+"""
+Microbenchmark for the ``ACCEPT_HANDLERS`` response encoders.
+
+Compares responses per second (and response sizes) of Flask's ``jsonify`` against
+the orjson, MessagePack and CBOR encoders from
+:mod:`flask_unchained.bundles.api.encoders`, for a list of dumped model instances
+like the ones returned by ``ModelResource.list``. Encoders whose libraries are not
+installed get skipped.
+
+USAGE:
+python benchmarks/bench_encoders.py [--number=N] [--rows=N]
+"""
+
+import argparse
+import datetime as dt
+import timeit
+
+from flask import Flask, jsonify
+
+from flask_unchained.bundles.api import encoders
+
+
+def make_payload(rows: int) -> list:
+    created_at = dt.datetime(2020, 1, 1, 12, 30)
+    return [
+        {
+            "id": i,
+            "title": f"Article {i}",
+            "body": "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 4,
+            "version": 1,
+            "authorId": i % 10,
+            "createdAt": created_at,
+            "updatedAt": created_at,
+            "tags": ["python", "flask", "api"],
+        }
+        for i in range(rows)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--number", type=int, default=100)
+    parser.add_argument("--rows", type=int, default=1000)
+    args = parser.parse_args()
+
+    candidates = [
+        ("jsonify", jsonify, True),
+        ("orjson", encoders.orjson_response, encoders.orjson is not None),
+        ("msgpack", encoders.msgpack_response, encoders.msgpack is not None),
+        ("cbor", encoders.cbor_response, encoders.cbor2 is not None),
+    ]
+    payload = make_payload(args.rows)
+
+    app = Flask(__name__)
+    with app.app_context():
+        baseline = None
+        print(f"{'encoder':>8}  {'responses/s':>12}  {'bytes':>9}  speedup")
+        for name, encode, installed in candidates:
+            if not installed:
+                print(f"{name:>8}  {'(not installed)':>12}")
+                continue
+            seconds = min(
+                timeit.repeat(lambda: encode(payload), number=args.number, repeat=5)
+            )
+            per_second = args.number / seconds
+            baseline = baseline or per_second
+            size = len(encode(payload).get_data())
+            print(
+                f"{name:>8}  {per_second:>12,.0f}  {size:>9,}  "
+                f"{per_second / baseline:.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Microbenchmark for constructors wrapped by ``unchained.inject()``.
+
+Compares calls per second of the precompiled injection plan (the fast path) against
+binding the full signature on every call (the fallback path, which is how every call
+was handled before injection plans existed), for constructors with 0, 3 and 10
+injectable parameters.
+
+USAGE:
+python benchmarks/bench_inject.py [--number=N]
+"""
+
+import argparse
+import timeit
+
+from unittest import mock
+
+from flask_unchained import injectable, unchained
+from flask_unchained.di import _InjectionPlan
+
+
+def make_class(num_injectables: int) -> type:
+    names = [f"dependency_{i}" for i in range(num_injectables)]
+    params = ", ".join(f"{name}=injectable" for name in names)
+    namespace = {"injectable": injectable}
+    exec(
+        (
+            f"def __init__(self, {params}):\n    pass\n"
+            if params
+            else "def __init__(self):\n    pass\n"
+        ),
+        namespace,
+    )
+    cls = type(f"Constructor{num_injectables}", (), {"__init__": namespace["__init__"]})
+    for name in names:
+        unchained.services[name] = object()
+    return unchained.inject()(cls)
+
+
+def calls_per_second(cls: type, number: int) -> float:
+    return number / min(timeit.repeat(cls, number=number, repeat=5))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--number", type=int, default=100_000)
+    args = parser.parse_args()
+
+    print(f"{'injectables':>11}  {'bind (calls/s)':>15}  {'plan (calls/s)':>15}  speedup")
+    for num_injectables in (0, 3, 10):
+        cls = make_class(num_injectables)
+        with mock.patch.object(_InjectionPlan, "is_fast_path", return_value=False):
+            before = calls_per_second(cls, args.number)
+        after = calls_per_second(cls, args.number)
+        print(
+            f"{num_injectables:>11}  {before:>15,.0f}  {after:>15,.0f}  "
+            f"{after / before:.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -56,6 +56,7 @@ from .bundles.babel import gettext, lazy_gettext, lazy_ngettext, ngettext  # iso
 from .views import (  # isort: skip
     Controller,
     Resource,
+    cached_view,
     no_route,
     param_converter,
     redirect,
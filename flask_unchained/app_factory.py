@@ -1,3 +1,4 @@
+import gc
 import importlib
 import inspect
 import os
@@ -6,11 +7,10 @@ import sys
 from types import ModuleType
 from typing import *
 
-import networkx as nx
-
 from py_meta_utils import Singleton
 
-from .bundles import AppBundle, Bundle
+from .boot_profiler import boot_profiler
+from .bundles import AppBundle, Bundle, BundleGraph
 from .constants import DEV, ENV_ALIASES, PROD, STAGING, TEST, VALID_ENVS
 from .exceptions import (
     BundleNotFoundError,
@@ -18,8 +18,9 @@ from .exceptions import (
     UnchainedConfigNotFoundError,
 )
 from .flask_unchained import FlaskUnchained
+from .graph import DependencyGraph
 from .unchained import unchained
-from .utils import cwd_import
+from .utils import FrozenConfig, bind_config_properties, cwd_import, get_boolean_env
 
 
 def maybe_set_app_factory_from_env():
@@ -84,42 +85,132 @@ class AppFactory(metaclass=Singleton):
             valid_envs = [f"{x!r}" for x in VALID_ENVS]
             raise ValueError(f"env must be one of {', '.join(valid_envs)}")
 
-        unchained_config = {}
-        unchained_config_module = None
-        if _load_unchained_config:
-            unchained_config_module = self.load_unchained_config(env)
-            unchained_config = {
-                k: v
-                for k, v in vars(unchained_config_module).items()
-                if not k.startswith("_") and k.isupper()
-            }
-        unchained_config["_CONFIG_OVERRIDES"] = _config_overrides
-
-        _, bundles = self.load_bundles(
-            bundle_package_names=bundles or unchained_config.get("BUNDLES", []),
-            unchained_config_module=unchained_config_module,
-        )
+        profile_boot = get_boolean_env("UNCHAINED_BOOT_PROFILE", False)
+        if profile_boot:
+            boot_profiler.enable()
 
-        app_import_name = (
-            bundles[-1].module_name.split(".")[0]
-            if bundles
-            else ("tests" if env == TEST else "dev_app")
-        )
-        app = self.APP_CLASS(
-            app_import_name,
-            **self.get_app_kwargs(app_kwargs, bundles, env, unchained_config),
-        )
-        app.env = env
+        try:
+            return self._create_app(
+                env, bundles, app_kwargs, _config_overrides, _load_unchained_config
+            )
+        finally:
+            # stop tracing allocations and recording the services instantiated
+            # after booting (eg per request), but keep the boot timings
+            if profile_boot:
+                boot_profiler.disable()
+
+    def _create_app(
+        self,
+        env: str,
+        bundles: Optional[List[str]],
+        app_kwargs: Optional[Dict[str, Any]],
+        _config_overrides: Optional[Dict[str, Any]],
+        _load_unchained_config: bool,
+    ) -> FlaskUnchained:
+        with boot_profiler.profile("app", "create_app"):
+            unchained_config = {}
+            unchained_config_module = None
+            if _load_unchained_config:
+                unchained_config_module = self.load_unchained_config(env)
+                unchained_config = {
+                    k: v
+                    for k, v in vars(unchained_config_module).items()
+                    if not k.startswith("_") and k.isupper()
+                }
+            unchained_config["_CONFIG_OVERRIDES"] = _config_overrides
+
+            _, bundles = self.load_bundles(
+                bundle_package_names=bundles or unchained_config.get("BUNDLES", []),
+                unchained_config_module=unchained_config_module,
+            )
+
+            app_import_name = (
+                bundles[-1].module_name.split(".")[0]
+                if bundles
+                else ("tests" if env == TEST else "dev_app")
+            )
+            app = self.APP_CLASS(
+                app_import_name,
+                **self.get_app_kwargs(app_kwargs, bundles, env, unchained_config),
+            )
+            app.env = env
+
+            for bundle in bundles:
+                with boot_profiler.profile("bundle", f"{bundle.name}.before_init_app"):
+                    bundle.before_init_app(app)
 
-        for bundle in bundles:
-            bundle.before_init_app(app)
+            unchained.init_app(app, bundles, unchained_config)
 
-        unchained.init_app(app, bundles, unchained_config)
+            for bundle in bundles:
+                with boot_profiler.profile("bundle", f"{bundle.name}.after_init_app"):
+                    bundle.after_init_app(app)
 
-        for bundle in bundles:
-            bundle.after_init_app(app)
+            if app.config.get("FREEZE_CONFIG"):
+                self.freeze_config(app)
 
-        return app
+            if app.config.get("WARMUP"):
+                self.warmup(app)
+
+            return app
+
+    def freeze_config(self, app: FlaskUnchained) -> FrozenConfig:
+        """
+        Freeze the app's config into an immutable snapshot (called automatically
+        at the end of :meth:`create_app` when ``FREEZE_CONFIG`` is set to ``True``
+        in your config). Extensions and services with
+        :class:`~flask_unchained.utils.ConfigProperty` attributes get bound to the
+        snapshot, so reading them no longer goes through ``current_app`` (services
+        that haven't been instantiated yet get bound when they are).
+
+        Writing to the config afterwards raises
+        :class:`~flask_unchained.exceptions.FrozenConfigError` in production and
+        staging, while in development and testing it issues a warning (and the
+        change gets applied).
+        """
+        frozen_config = app.config.freeze(raise_on_write=app.env in {PROD, STAGING})
+
+        # only the services built so far (lazy and scoped services get bound
+        # when they're instantiated)
+        services = app.unchained.services
+        built_services = [services[name] for name in services if services.is_built(name)]
+        for obj in [*app.unchained.extensions.values(), *built_services]:
+            bind_config_properties(obj, frozen_config)
+        return frozen_config
+
+    def warmup(self, app: FlaskUnchained) -> Dict[str, int]:
+        """
+        Preload everything the app's bundles would otherwise build lazily while
+        handling the first requests (by calling :meth:`Bundle.warmup` on each of
+        them). Meant to be called in the master process of pre-forking servers (or
+        automatically at the end of :meth:`create_app` by setting ``WARMUP`` to
+        ``True`` in your config), so that the preloaded objects get shared with the
+        worker processes, instead of each of them building their own copies::
+
+            # wsgi.py
+            app = AppFactory().create_app(PROD)
+            AppFactory().warmup(app)
+
+        :return: The number of preloaded objects by kind.
+        """
+        report = {}
+        with app.app_context():
+            for bundle in app.unchained.bundles.values():
+                with boot_profiler.profile("warmup", bundle.name):
+                    for kind, count in bundle.warmup(app).items():
+                        report[kind] = report.get(kind, 0) + count
+
+        if app.config.get("WARMUP_GC_FREEZE", True):
+            # move everything allocated so far into the permanent generation, so
+            # the garbage collector of forked workers doesn't touch (and thereby
+            # copy) the memory pages shared with the master process
+            gc.collect()
+            gc.freeze()
+
+        app.logger.info(
+            "Warmed up: "
+            + ", ".join(f"{count} {kind}" for kind, count in sorted(report.items()))
+        )
+        return report
 
     @staticmethod
     def load_unchained_config(env: Union[DEV, PROD, STAGING, TEST]) -> ModuleType:
@@ -264,13 +355,14 @@ class AppFactory(metaclass=Singleton):
         )
 
         bundles = cls.resolve_bundle_order(bundle_package_names, bundle_modules)
+        unchained.bundle_graph = BundleGraph(bundles)
         return app_bundle, bundles
 
     @classmethod
     def resolve_bundle_order(
         cls, bundle_names, bundle_modules: Dict[str, Bundle]
     ) -> List[Bundle]:
-        dag = nx.DiGraph()
+        dag = DependencyGraph("bundles")
         reverse_deps = {}
         for bundle_name in bundle_names:
             dag.add_node(bundle_name)
@@ -278,15 +370,8 @@ class AppFactory(metaclass=Singleton):
                 dag.add_edge(bundle_name, dep_name)
                 reverse_deps.setdefault(dep_name, []).append(f"- {bundle_name}")
 
-        try:
-            order = list(reversed(list(nx.topological_sort(dag))))
-        except nx.NetworkXUnfeasible:
-            msg = "Circular dependency detected between bundles"
-            problem_graph = ", ".join(f"{a} -> {b}" for a, b in nx.find_cycle(dag))
-            raise Exception(f"{msg}: {problem_graph}")
-
         rv = []
-        for bundle_name in order:
+        for bundle_name in dag.resolve_order():
             bundle = bundle_modules.get(bundle_name)
             if not bundle or (
                 bundle_name not in bundle_names
@@ -1,12 +1,12 @@
 import importlib
-import inspect
-import pkgutil
 
 from types import FunctionType, ModuleType
 from typing import *
 
 from ._compat import is_local_proxy
+from .boot_profiler import boot_profiler
 from .bundles import AppBundle, Bundle
+from .discovery import discovery_index
 from .exceptions import NameCollisionError
 from .flask_unchained import FlaskUnchained
 from .string_utils import snake_case
@@ -237,13 +237,12 @@ class AppFactoryHook:
             return members
 
         # if the passed module is a package, also get members from child modules
-        if importlib.util.find_spec(module.__name__).submodule_search_locations:
-            for _, name, _ in pkgutil.walk_packages(module.__path__):
-                child_module_name = f"{module.__package__}.{name}"
+        for child_module_name in discovery_index.get_child_module_names(module):
+            with boot_profiler.profile("import", child_module_name):
                 child_module = importlib.import_module(child_module_name)
-                for key, obj in self._get_members(child_module, type_check_wrapper):
-                    if key not in members:
-                        members[key] = obj
+            for key, obj in self._get_members(child_module, type_check_wrapper):
+                if key not in members:
+                    members[key] = obj
 
         return members
 
@@ -252,7 +251,7 @@ class AppFactoryHook:
         module: ModuleType,
         type_checker: Callable[[Any], bool],
     ) -> List[Tuple[str, Any]]:
-        for name, obj in inspect.getmembers(module, type_checker):
+        for name, obj in discovery_index.get_members(module, type_checker):
             # FIXME
             # currently, no hooks depend on this working correctly, however
             # ``obj.__module__.startswith(module.__name__)`` isn't right for
@@ -0,0 +1,162 @@
+import os
+import threading
+import time
+import tracemalloc
+
+from collections import namedtuple
+from contextlib import contextmanager
+from typing import *
+
+
+BootProfileRecord = namedtuple(
+    "BootProfileRecord",
+    ("category", "name", "start", "wall_time", "import_time", "allocated", "depth"),
+)
+"""
+A ``namedtuple`` of timings recorded by the :class:`BootProfiler`. Times are in
+seconds (``start`` is relative to when profiling was enabled), ``allocated`` is the
+net number of bytes allocated (only when tracing allocations), and ``depth`` is how
+deeply nested the record was within other records.
+"""
+
+
+class BootProfiler:
+    """
+    Records how long the steps of booting the app take: running each hook, the
+    bundles' ``before_init_app`` and ``after_init_app`` methods, importing bundle
+    modules, and instantiating services.
+
+    Profiling is disabled by default; set the ``UNCHAINED_BOOT_PROFILE``
+    environment variable to enable it (the ``flask unchained boot-profile``
+    command does so automatically). It then gets disabled again (keeping the
+    recorded timings) once :meth:`~flask_unchained.AppFactory.create_app` returns.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.records: List[BootProfileRecord] = []
+        self._origin = None
+        self._stack = []
+        self._trace_allocations = False
+        self._started_tracing = False
+        self._thread_id = None
+
+    def enable(self, trace_allocations: bool = True) -> None:
+        """
+        Start recording (and optionally tracing allocations with :mod:`tracemalloc`).
+        """
+        self.reset()
+        self.enabled = True
+        self._origin = time.perf_counter()
+        self._thread_id = threading.get_ident()
+        self._trace_allocations = trace_allocations
+        if trace_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+    def disable(self) -> None:
+        """
+        Stop recording. Already recorded timings are kept. Allocation tracing is
+        only stopped if it was started by :meth:`enable`.
+        """
+        self.enabled = False
+        if self._started_tracing and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self._started_tracing = False
+        self._trace_allocations = False
+
+    def reset(self) -> None:
+        """
+        Discard all recorded timings.
+        """
+        self.records = []
+        self._stack = []
+
+    @contextmanager
+    def profile(self, category: str, name: str):
+        """
+        Context manager to record the time spent in its block. Yields a dictionary
+        in which the name of the record can be changed (by setting ``"name"``).
+        """
+        if not self.enabled or threading.get_ident() != self._thread_id:
+            yield {}
+            return
+
+        is_import = category == "import"
+        is_nested_import = is_import and any(f["is_import"] for f in self._stack)
+        frame = dict(name=name, is_import=is_import, import_time=0.0)
+        self._stack.append(frame)
+        allocated = tracemalloc.get_traced_memory()[0] if self._trace_allocations else 0
+        start = time.perf_counter()
+        try:
+            yield frame
+        finally:
+            wall_time = time.perf_counter() - start
+            if self._trace_allocations and tracemalloc.is_tracing():
+                allocated = tracemalloc.get_traced_memory()[0] - allocated
+            self._stack.pop()
+
+            # the time spent importing gets attributed to every enclosing record
+            # (nested imports are already included in the outer-most import)
+            if is_import:
+                frame["import_time"] = wall_time
+                if not is_nested_import:
+                    for parent in self._stack:
+                        parent["import_time"] += wall_time
+
+            self.records.append(
+                BootProfileRecord(
+                    category,
+                    frame["name"],
+                    start - self._origin,
+                    wall_time,
+                    frame["import_time"],
+                    allocated,
+                    len(self._stack),
+                )
+            )
+
+    def to_dict(self) -> List[Dict[str, Any]]:
+        """
+        Returns the recorded timings as a list of (JSON-serializable) dictionaries.
+        """
+        return [record._asdict() for record in self.records]
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """
+        Returns the recorded timings in the Chrome trace-event format (viewable
+        with ``chrome://tracing`` or https://ui.perfetto.dev).
+        """
+        pid = os.getpid()
+        return {
+            "traceEvents": [
+                {
+                    "name": record.name,
+                    "cat": record.category,
+                    "ph": "X",
+                    "ts": record.start * 1e6,
+                    "dur": record.wall_time * 1e6,
+                    "pid": pid,
+                    "tid": self._thread_id,
+                    "args": {
+                        "import_time_ms": record.import_time * 1e3,
+                        "allocated_bytes": record.allocated,
+                    },
+                }
+                for record in self.records
+            ],
+            "displayTimeUnit": "ms",
+        }
+
+
+boot_profiler = BootProfiler()
+"""
+The :class:`BootProfiler` instance used by Flask Unchained.
+"""
+
+
+__all__ = [
+    "BootProfileRecord",
+    "BootProfiler",
+    "boot_profiler",
+]
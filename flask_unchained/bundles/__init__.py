@@ -188,6 +188,17 @@ class Bundle(metaclass=BundleMetaclass):
         """
         pass
 
+    def warmup(self, app: FlaskUnchained) -> Dict[str, int]:
+        """
+        Override this method to preload anything this bundle would otherwise
+        (lazily) build when handling the first requests, so that it gets shared by
+        the worker processes of pre-forking servers. Called with an app context
+        pushed by :meth:`~flask_unchained.AppFactory.warmup`.
+
+        :return: The number of preloaded objects by kind (eg ``{"templates": 3}``).
+        """
+        return {}
+
     def _iter_class_hierarchy(self, include_self: bool = True, mro: bool = False):
         """
         Iterate over the bundle classes in the hierarchy. Yields base-most
@@ -198,13 +209,7 @@ class Bundle(metaclass=BundleMetaclass):
         :param include_self: Whether or not to yield the top-level bundle.
         :param mro: Pass True to yield bundles in Method Resolution Order.
         """
-        supers = self.__class__.__mro__[(0 if include_self else 1) :]
-        for bundle_cls in supers if mro else reversed(supers):
-            if bundle_cls not in {object, AppBundle, Bundle}:
-                if bundle_cls == self.__class__:
-                    yield self
-                else:
-                    yield bundle_cls()
+        return self._bundle_graph.iter_class_hierarchy(self, include_self, mro)
 
     @property
     def _has_views(self) -> bool:
@@ -213,15 +218,7 @@ class Bundle(metaclass=BundleMetaclass):
 
         For internal use only.
         """
-        if self.is_single_module and isinstance(self, AppBundle):
-            return True
-
-        from ..hooks.views_hook import ViewsHook
-
-        for bundle in self._iter_class_hierarchy():
-            if ViewsHook.import_bundle_modules(bundle):
-                return True
-        return False
+        return self._bundle_graph.has_views(self)
 
     @property
     def _blueprint_name(self) -> str:
@@ -230,12 +227,7 @@ class Bundle(metaclass=BundleMetaclass):
 
         For internal use only.
         """
-        if self._is_top_bundle or not self._has_hierarchy_name_conflicts:
-            return self.name
-
-        for i, bundle in enumerate(self._iter_class_hierarchy()):
-            if bundle.__class__ == self.__class__:
-                return f"{self.name}_{i}"
+        return self._bundle_graph.blueprint_name(self)
 
     @property
     def _static_folders(self) -> List[str]:
@@ -244,16 +236,7 @@ class Bundle(metaclass=BundleMetaclass):
 
         For internal use only.
         """
-        if not self._has_hierarchy_name_conflicts:
-            return [self.static_folder] if self.static_folder else []
-        elif not self._is_top_bundle:
-            return []
-
-        return [
-            b.static_folder
-            for b in self._iter_class_hierarchy(mro=True)
-            if b.static_folder and b.name == self.name
-        ]
+        return self._bundle_graph.static_folders(self)
 
     @property
     def _is_top_bundle(self) -> bool:
@@ -262,7 +245,7 @@ class Bundle(metaclass=BundleMetaclass):
 
         For internal use only.
         """
-        return not self.__class__.__subclasses__()
+        return self._bundle_graph.is_top_bundle(self)
 
     @property
     def _has_hierarchy_name_conflicts(self) -> bool:
@@ -271,16 +254,20 @@ class Bundle(metaclass=BundleMetaclass):
 
         For internal use only.
         """
-        top_bundle = self.__class__
-        subclasses = top_bundle.__subclasses__()
-        while subclasses:
-            top_bundle = subclasses[0]
-            subclasses = top_bundle.__subclasses__()
-
-        return any(
-            b.name == self.name and b.__class__ != self.__class__
-            for b in top_bundle()._iter_class_hierarchy()
-        )
+        return self._bundle_graph.has_hierarchy_name_conflicts(self)
+
+    @property
+    def _bundle_graph(self) -> "BundleGraph":
+        """
+        The :class:`BundleGraph` of the loaded bundles if this bundle is part of
+        it, otherwise a new one for just this bundle.
+
+        For internal use only.
+        """
+        bundle_graph = unchained.bundle_graph
+        if bundle_graph is not None and self.__class__ in bundle_graph:
+            return bundle_graph
+        return BundleGraph([self])
 
     def __getattr__(self, name):
         if name in {
@@ -344,9 +331,142 @@ class AppBundle(Bundle, metaclass=AppBundleMetaclass):
     """
 
 
+class BundleGraph:
+    """
+    The loaded bundles and their class hierarchies. Created by
+    :meth:`~flask_unchained.AppFactory.load_bundles` (and available as
+    ``unchained.bundle_graph``), it instantiates the superclasses of each bundle
+    once, and memoizes the properties of bundles that depend on their hierarchy
+    (which hooks query repeatedly while the app gets initialized).
+
+    For internal use only.
+    """
+
+    def __init__(self, bundles: List[Bundle]):
+        self._bundles = tuple(bundles)
+        self._instances: Dict[Type[Bundle], Bundle] = {b.__class__: b for b in bundles}
+        self._hierarchies: Dict[Type[Bundle], Tuple[Bundle, ...]] = {}
+        self._memo: Dict[Tuple[str, Type[Bundle]], Any] = {}
+        for bundle in bundles:
+            self._get_hierarchy(bundle.__class__)
+
+    @property
+    def bundles(self) -> Tuple[Bundle, ...]:
+        """
+        The loaded bundles, in the order they were loaded.
+        """
+        return self._bundles
+
+    def iter_class_hierarchy(
+        self,
+        bundle: Bundle,
+        include_self: bool = True,
+        mro: bool = False,
+    ) -> Iterator[Bundle]:
+        """
+        Like :meth:`Bundle._iter_class_hierarchy`, except the same instances of
+        superclasses get yielded every time.
+        """
+        hierarchy = self._get_hierarchy(bundle.__class__)
+        if not include_self:
+            hierarchy = hierarchy[:-1]
+        for b in reversed(hierarchy) if mro else hierarchy:
+            yield bundle if b.__class__ == bundle.__class__ else b
+
+    def has_views(self, bundle: Bundle) -> bool:
+        def has_views():
+            if bundle.is_single_module and isinstance(bundle, AppBundle):
+                return True
+
+            from ..hooks.views_hook import ViewsHook
+
+            return any(
+                ViewsHook.import_bundle_modules(b)
+                for b in self.iter_class_hierarchy(bundle)
+            )
+
+        return self._memoize("has_views", bundle, has_views)
+
+    def blueprint_name(self, bundle: Bundle) -> str:
+        def blueprint_name():
+            if self.is_top_bundle(bundle) or not self.has_hierarchy_name_conflicts(
+                bundle
+            ):
+                return bundle.name
+
+            for i, b in enumerate(self.iter_class_hierarchy(bundle)):
+                if b.__class__ == bundle.__class__:
+                    return f"{bundle.name}_{i}"
+
+        return self._memoize("blueprint_name", bundle, blueprint_name)
+
+    def static_folders(self, bundle: Bundle) -> List[str]:
+        def static_folders():
+            if not self.has_hierarchy_name_conflicts(bundle):
+                return [bundle.static_folder] if bundle.static_folder else []
+            elif not self.is_top_bundle(bundle):
+                return []
+
+            return [
+                b.static_folder
+                for b in self.iter_class_hierarchy(bundle, mro=True)
+                if b.static_folder and b.name == bundle.name
+            ]
+
+        return list(self._memoize("static_folders", bundle, static_folders))
+
+    def is_top_bundle(self, bundle: Bundle) -> bool:
+        return self._memoize(
+            "is_top_bundle", bundle, lambda: not bundle.__class__.__subclasses__()
+        )
+
+    def has_hierarchy_name_conflicts(self, bundle: Bundle) -> bool:
+        def has_hierarchy_name_conflicts():
+            top_bundle_cls = bundle.__class__
+            subclasses = top_bundle_cls.__subclasses__()
+            while subclasses:
+                top_bundle_cls = subclasses[0]
+                subclasses = top_bundle_cls.__subclasses__()
+
+            return any(
+                b.name == bundle.name and b.__class__ != bundle.__class__
+                for b in self._get_hierarchy(top_bundle_cls)
+            )
+
+        return self._memoize(
+            "has_hierarchy_name_conflicts", bundle, has_hierarchy_name_conflicts
+        )
+
+    def _get_hierarchy(self, bundle_cls: Type[Bundle]) -> Tuple[Bundle, ...]:
+        """
+        Returns instances of the bundle classes in the hierarchy of ``bundle_cls``
+        (itself included), base-most first.
+        """
+        if bundle_cls not in self._hierarchies:
+            hierarchy = []
+            for cls in reversed(bundle_cls.__mro__):
+                if cls in {object, AppBundle, Bundle}:
+                    continue
+                if cls not in self._instances:
+                    self._instances[cls] = cls()
+                hierarchy.append(self._instances[cls])
+            self._hierarchies[bundle_cls] = tuple(hierarchy)
+        return self._hierarchies[bundle_cls]
+
+    def _memoize(self, key: str, bundle: Bundle, fn: Callable[[], Any]) -> Any:
+        memo_key = (key, bundle.__class__)
+        if memo_key not in self._memo:
+            self._memo[memo_key] = fn()
+        return self._memo[memo_key]
+
+    def __contains__(self, bundle_cls: Type[Bundle]) -> bool:
+        return bundle_cls in self._instances
+
+
 __all__ = [
     "AppBundle",
     "AppBundleMetaclass",
     "Bundle",
+    "BundleGraph",
     "BundleMetaclass",
 ]
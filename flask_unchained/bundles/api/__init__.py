@@ -1,15 +1,12 @@
-import enum
+from marshmallow.fields import Nested
 
-from datetime import date, datetime
-
-from speaklater import _LazyString
-
-from flask_unchained import Bundle, FlaskUnchained, unchained
-from flask_unchained._compat import is_local_proxy
+from flask_unchained import Bundle, FlaskUnchained
 
+from .encoders import default
 from .extensions import Api, Marshmallow, api, ma
 from .model_resource import ModelResource
 from .model_serializer import ModelSerializer
+from .pagination import Page, Pagination
 from .views import OpenAPIController
 
 
@@ -59,44 +56,15 @@ class ApiBundle(Bundle):
     def after_init_app(self, app: FlaskUnchained):
         """
         Configure the JSON encoder for Flask to be able to serialize Enums,
-        LocalProxy objects, and SQLAlchemy models.
+        LocalProxy objects, and SQLAlchemy models (see
+        :func:`~flask_unchained.bundles.api.encoders.default`).
         """
-        from flask_unchained.bundles.sqlalchemy import BaseModel
-
-        def _default(obj):
-            if is_local_proxy(obj):
-                obj = obj._get_current_object()
-
-            if isinstance(obj, (date, datetime)):
-                return obj.isoformat()
-            elif isinstance(obj, enum.Enum):
-                return obj.name
-            elif isinstance(obj, _LazyString):
-                return str(obj)
-
-            api_bundle = unchained.api_bundle
-            if isinstance(obj, BaseModel):
-                model_name = obj.__class__.__name__
-                serializer_cls = api_bundle.serializers_by_model.get(model_name)
-                if serializer_cls:
-                    return serializer_cls().dump(obj)
-
-            elif obj and isinstance(obj, (list, tuple)) and isinstance(obj[0], BaseModel):
-                model_name = obj[0].__class__.__name__
-                serializer_cls = api_bundle.many_by_model.get(
-                    model_name, api_bundle.serializers_by_model.get(model_name)
-                )
-                if serializer_cls:
-                    return serializer_cls(many=True).dump(obj)
-
-            raise TypeError(f"Unable to serialize {obj!r} ({type(obj)} to JSON")
-
         if hasattr(app, "json_encoder"):
 
             class JSONEncoder(app.json_encoder):
                 def default(self, obj):
                     try:
-                        return _default(obj)
+                        return default(obj)
                     except TypeError:
                         return super().default(obj)
 
@@ -105,7 +73,24 @@ class ApiBundle(Bundle):
             from flask.json.provider import DefaultJSONProvider
 
             class JSONProvider(DefaultJSONProvider):
-                default = staticmethod(_default)
+                default = staticmethod(default)
 
             app.json_provider_class = JSONProvider
             app.json = JSONProvider(app)
+
+    def warmup(self, app: FlaskUnchained):
+        """
+        Instantiate every serializer once, so that the SQLAlchemy mappers get
+        configured and the serializer classes referenced by nested fields get
+        imported and resolved.
+        """
+        serializers = {
+            *self.serializers.values(),
+            *self.create_by_model.values(),
+            *self.many_by_model.values(),
+        }
+        for serializer_cls in serializers:
+            for field in serializer_cls().fields.values():
+                if isinstance(field, Nested):
+                    field.schema
+        return {"serializers": len(serializers)}
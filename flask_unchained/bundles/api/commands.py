@@ -0,0 +1,48 @@
+from flask.cli import with_appcontext
+
+from flask_unchained import unchained
+from flask_unchained.cli import cli, click
+
+from .extensions import Api
+
+
+api_ext: Api = unchained.get_local_proxy("api")
+
+
+FILE_EXTENSIONS = {"gzip": "gz", "br": "br"}
+
+
+@cli.group()
+def api():
+    """
+    API commands.
+    """
+
+
+@api.command("spec")
+@click.option("--out", "-o", default="openapi.json", help="The filename to write to.")
+@click.option(
+    "--indent", type=int, default=None, help="How many spaces to indent the output by."
+)
+@click.option(
+    "--compress",
+    is_flag=True,
+    default=False,
+    help="Also write gzip (and brotli) compressed copies, to serve statically.",
+)
+@with_appcontext
+def spec(out, indent, compress):
+    """
+    Write the OpenAPI spec to a file.
+    """
+    data = api_ext.render_spec(indent=indent)
+    with open(out, "wb") as f:
+        f.write(data)
+    click.echo(f"Successfully wrote the OpenAPI spec to {out}")
+
+    if compress:
+        for encoding, compressed in api_ext.compress(data).items():
+            filename = f"{out}.{FILE_EXTENSIONS[encoding]}"
+            with open(filename, "wb") as f:
+                f.write(compressed)
+            click.echo(f"Successfully wrote the {encoding} compressed spec to {filename}")
@@ -20,6 +20,13 @@ class Config(BundleConfig):
 
     API_APISPEC_PLUGINS = None
 
+    API_SPEC_AUTO_RELOAD = False
+    """
+    Whether or not to re-render the OpenAPI spec on every request to
+    ``/docs/openapi.json`` (it's recompressed only when it changed). By default,
+    the spec gets rendered and compressed once, when the app starts.
+    """
+
     DUMP_KEY_FN = camel_case
     """
     An optional function to use for converting keys when dumping data to send over
@@ -34,5 +41,29 @@ class Config(BundleConfig):
 
     ACCEPT_HANDLERS = {"application/json": jsonify}
     """
-    Functions to use for converting response data for Accept headers.
+    Functions to use for converting response data, by mimetype. The handler used
+    for a request gets negotiated from its ``Accept`` header (taking quality
+    values into account, and preferring handlers in the order listed here when
+    the client has no preference). Defaults to Flask's ``jsonify`` for
+    ``application/json`` only. The faster ``orjson`` for JSON, MessagePack and
+    CBOR are opt-in (install them with the ``api-fast`` extra)::
+
+        from flask_unchained.bundles.api.encoders import (
+            cbor_response,
+            msgpack_response,
+            orjson_response,
+        )
+
+        ACCEPT_HANDLERS = {
+            'application/json': orjson_response,
+            'application/msgpack': msgpack_response,
+            'application/cbor': cbor_response,
+        }
+    """
+
+
+class DevConfig(Config):
+    API_SPEC_AUTO_RELOAD = True
+    """
+    Re-render the OpenAPI spec on every request in development.
     """
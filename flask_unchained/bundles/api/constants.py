@@ -0,0 +1,9 @@
+from flask_unchained.bundles.controller.constants import ALL_RESOURCE_METHODS
+
+
+BULK_CREATE = "bulk_create"
+BULK_DELETE = "bulk_delete"
+BULK_PATCH = "bulk_patch"
+
+BULK_METHODS = (BULK_CREATE, BULK_PATCH, BULK_DELETE)
+ALL_MODEL_RESOURCE_METHODS = ALL_RESOURCE_METHODS + BULK_METHODS
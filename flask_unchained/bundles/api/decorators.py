@@ -3,6 +3,10 @@ from http import HTTPStatus
 
 from flask import abort, request
 
+from flask_unchained.string_utils import title_case
+
+from .utils import unpack
+
 
 try:
     from marshmallow import ValidationError
@@ -10,17 +14,64 @@ except ImportError:
     ValidationError = Exception
 
 
-def list_loader(*decorator_args, model):
+def list_loader(*decorator_args, model, pagination=None, stream=False, serializer=None):
     """
     Decorator to automatically query the database for all records of a model.
 
     :param model: The model class to query
+    :param pagination: An optional
+                       :class:`~flask_unchained.bundles.api.pagination.Pagination`
+                       instance to only query the requested page of records
+    :param stream: Whether to pass the query (instead of all the records) to the
+                   decorated function, so that the records can be streamed
+    :param serializer: An optional ModelSerializer whose loader options to eager
+                       load the relationships it dumps with (or a function
+                       returning one, called for every request)
+    """
+
+    def wrapped(fn):
+        @wraps(fn)
+        def decorated(*args, **kwargs):
+            query = model.query
+            list_serializer = serializer() if callable(serializer) else serializer
+            if list_serializer is not None:
+                query = query.options(*list_serializer.get_loader_options())
+
+            if not pagination:
+                return fn(query if stream else query.all())
+
+            page = pagination.paginate(query, model)
+            rv, code, headers = unpack(fn(page.items))
+            return rv, code, {**page.get_headers(), **headers}
+
+        return decorated
+
+    if decorator_args and callable(decorator_args[0]):
+        return wrapped(decorator_args[0])
+    return wrapped
+
+
+def if_match(*decorator_args, etag_fn, kw_name="instance"):
+    """
+    Decorator to check the ``If-Match`` precondition of requests against the
+    current ETag of the model instance, aborting with HTTP 412 if it doesn't match.
+    (ETags are compared using the weak comparison function, because the ETags
+    :class:`~flask_unchained.bundles.api.ModelResource` generates are weak. ETags
+    of the form ``<state>.<variant>`` get compared by their state part, so that
+    the ETag of any representation of the instance matches.)
+
+    :param etag_fn: A function returning the current ETag for a model instance
+    :param kw_name: The name of the keyword argument holding the model instance
     """
 
     def wrapped(fn):
         @wraps(fn)
         def decorated(*args, **kwargs):
-            return fn(model.query.all())
+            if request.if_match and not _if_match_contains(
+                request.if_match, etag_fn(kwargs[kw_name])
+            ):
+                abort(HTTPStatus.PRECONDITION_FAILED)
+            return fn(*args, **kwargs)
 
         return decorated
 
@@ -115,3 +166,152 @@ def post_loader(*decorator_args, serializer):
     if decorator_args and callable(decorator_args[0]):
         return wrapped(decorator_args[0])
     return wrapped
+
+
+def bulk_create_loader(*decorator_args, serializer):
+    """
+    Decorator to automatically instantiate a list of models from a json array in
+    the request data (errors are keyed by the index of the invalid items)
+
+    :param serializer: The ModelSerializer to use to load data from the request
+    """
+
+    def wrapped(fn):
+        @wraps(fn)
+        def decorated(*args, **kwargs):
+            items = request.get_json()
+            if not isinstance(items, list):
+                return fn([], {"_schema": ["Invalid input type."]})
+
+            errors = {}
+            try:
+                data = serializer.load(items, many=True)
+            except ValidationError as e:
+                errors = e.normalized_messages()
+                data = []
+            return fn(data, errors)
+
+        return decorated
+
+    if decorator_args and callable(decorator_args[0]):
+        return wrapped(decorator_args[0])
+    return wrapped
+
+
+def bulk_patch_loader(*decorator_args, serializer, model):
+    """
+    Decorator to automatically load and (partially) update a list of models from
+    a json array in the request data. Each item must include the primary key of
+    the model instance to update, and all of the instances get queried at once.
+    (Errors are keyed by the index of the invalid items, and when there are any,
+    the session gets rolled back so that none of the instances stay modified.)
+
+    :param serializer: The ModelSerializer to use to load data from the request
+    :param model: The model class to query
+    """
+
+    def wrapped(fn):
+        @wraps(fn)
+        def decorated(*args, **kwargs):
+            items = request.get_json()
+            if not isinstance(items, list):
+                return fn([], {"_schema": ["Invalid input type."]})
+
+            pk = model.Meta.pk
+            pk_key = serializer._dump_keys[pk]
+            ids = [item.get(pk_key) for item in items if isinstance(item, dict)]
+            instances = _get_instances_by_id(model, ids)
+
+            data, errors, seen = [], {}, set()
+            for i, item in enumerate(items):
+                if not isinstance(item, dict):
+                    errors[i] = {"_schema": ["Invalid input type."]}
+                    continue
+
+                item = item.copy()
+                ident = item.pop(pk_key, None)
+                if ident is None:
+                    errors[i] = {pk_key: [f"{title_case(pk)} is required."]}
+                elif not _is_hashable(ident) or ident not in instances:
+                    errors[i] = {pk_key: ["Not found."]}
+                elif ident in seen:
+                    errors[i] = {pk_key: [f"Duplicate {title_case(pk).lower()}."]}
+                else:
+                    seen.add(ident)
+                    try:
+                        instance = instances[ident]
+                        data.append(
+                            serializer.load(item, instance=instance, partial=True)
+                        )
+                    except ValidationError as e:
+                        errors[i] = e.normalized_messages()
+
+            if errors and instances:
+                # discard the changes loaded onto the instances of the valid items
+                model.query.session.rollback()
+            return fn(data, errors)
+
+        return decorated
+
+    if decorator_args and callable(decorator_args[0]):
+        return wrapped(decorator_args[0])
+    return wrapped
+
+
+def bulk_delete_loader(*decorator_args, serializer, model):
+    """
+    Decorator to automatically query the database for the model instances whose
+    primary keys are listed in a json array in the request data. (Errors are
+    keyed by the index of the invalid items.)
+
+    :param serializer: The ModelSerializer naming the primary key in errors
+    :param model: The model class to query
+    """
+
+    def wrapped(fn):
+        @wraps(fn)
+        def decorated(*args, **kwargs):
+            ids = request.get_json()
+            if not isinstance(ids, list):
+                return fn([], {"_schema": ["Invalid input type."]})
+
+            pk = model.Meta.pk
+            pk_key = serializer._dump_keys[pk]
+            instances = _get_instances_by_id(model, ids)
+            errors = {}
+            seen = set()
+            for i, ident in enumerate(ids):
+                if not _is_hashable(ident) or ident not in instances:
+                    errors[i] = {pk_key: ["Not found."]}
+                elif ident in seen:
+                    errors[i] = {pk_key: [f"Duplicate {title_case(pk).lower()}."]}
+                else:
+                    seen.add(ident)
+            if errors:
+                return fn([], errors)
+            return fn([instances[ident] for ident in ids], errors)
+
+        return decorated
+
+    if decorator_args and callable(decorator_args[0]):
+        return wrapped(decorator_args[0])
+    return wrapped
+
+
+def _get_instances_by_id(model, ids):
+    pk = model.Meta.pk
+    ids = {ident for ident in ids if ident is not None and _is_hashable(ident)}
+    if not ids:
+        return {}
+    query = model.query.filter(getattr(model, pk).in_(ids))
+    return {getattr(instance, pk): instance for instance in query}
+
+
+def _if_match_contains(if_match, etag):
+    if if_match.star_tag:
+        return True
+    return any(tag.split(".", 1)[0] == etag for tag in if_match.as_set(include_weak=True))
+
+
+def _is_hashable(value):
+    return not isinstance(value, (dict, list))
@@ -0,0 +1,123 @@
+import dataclasses
+import decimal
+import enum
+import uuid
+
+from datetime import date, datetime, timezone
+from typing import *
+
+from flask import current_app
+from speaklater import _LazyString
+
+from flask_unchained import unchained
+from flask_unchained._compat import is_local_proxy
+
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import cbor2
+except ImportError:
+    cbor2 = None
+
+
+def default(obj: Any) -> Any:
+    """
+    Converts objects the encoders don't natively support: LocalProxy objects,
+    dates and datetimes, Enums, lazy strings, Decimals, UUIDs, dataclasses, and
+    SQLAlchemy models (using their registered serializers).
+    """
+    from flask_unchained.bundles.sqlalchemy import BaseModel
+
+    if is_local_proxy(obj):
+        obj = obj._get_current_object()
+
+    if isinstance(obj, (date, datetime)):
+        return obj.isoformat()
+    elif isinstance(obj, enum.Enum):
+        return obj.name
+    elif isinstance(obj, (_LazyString, decimal.Decimal, uuid.UUID)):
+        return str(obj)
+    elif dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+
+    api_bundle = unchained.api_bundle
+    if isinstance(obj, BaseModel):
+        model_name = obj.__class__.__name__
+        serializer_cls = api_bundle.serializers_by_model.get(model_name)
+        if serializer_cls:
+            return serializer_cls().dump(obj)
+
+    elif obj and isinstance(obj, (list, tuple)) and isinstance(obj[0], BaseModel):
+        model_name = obj[0].__class__.__name__
+        serializer_cls = api_bundle.many_by_model.get(
+            model_name, api_bundle.serializers_by_model.get(model_name)
+        )
+        if serializer_cls:
+            return serializer_cls(many=True).dump(obj)
+
+    raise TypeError(f"Unable to serialize {obj!r} ({type(obj)})")
+
+
+def orjson_response(data: Any):
+    """
+    Returns an ``application/json`` response encoded with
+    `orjson <https://github.com/ijl/orjson>`_, which natively (and quickly)
+    handles datetimes, UUIDs and dataclasses. Requires ``orjson`` to be installed.
+    """
+    if orjson is None:
+        raise RuntimeError("orjson must be installed to use orjson_response")
+
+    return current_app.response_class(
+        orjson.dumps(data, default=default, option=orjson.OPT_NON_STR_KEYS),
+        mimetype="application/json",
+    )
+
+
+def msgpack_response(data: Any):
+    """
+    Returns an ``application/msgpack`` response encoded with
+    `MessagePack <https://msgpack.org>`_. Requires ``msgpack`` to be installed.
+    """
+    if msgpack is None:
+        raise RuntimeError("msgpack must be installed to use msgpack_response")
+
+    return current_app.response_class(
+        msgpack.packb(data, default=default, use_bin_type=True),
+        mimetype="application/msgpack",
+    )
+
+
+def cbor_response(data: Any):
+    """
+    Returns an ``application/cbor`` response encoded with
+    `CBOR <https://cbor.io>`_, which natively handles datetimes (naive ones are
+    assumed to be in UTC), Decimals and UUIDs. Requires ``cbor2`` to be installed.
+    """
+    if cbor2 is None:
+        raise RuntimeError("cbor2 must be installed to use cbor_response")
+
+    return current_app.response_class(
+        cbor2.dumps(
+            data,
+            timezone=timezone.utc,
+            default=lambda encoder, obj: encoder.encode(default(obj)),
+        ),
+        mimetype="application/cbor",
+    )
+
+
+__all__ = [
+    "cbor_response",
+    "default",
+    "msgpack_response",
+    "orjson_response",
+]
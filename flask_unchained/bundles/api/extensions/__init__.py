@@ -1,4 +1,4 @@
-from .api import Api
+from .api import Api, OpenAPIDocument
 from .marshmallow import Marshmallow
 
 
@@ -17,4 +17,5 @@ __all__ = [
     "Api",
     "ma",
     "Marshmallow",
+    "OpenAPIDocument",
 ]
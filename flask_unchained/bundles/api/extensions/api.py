@@ -1,3 +1,10 @@
+import gzip
+import hashlib
+import json
+
+from collections import namedtuple
+from typing import *
+
 from apispec import APISpec
 from apispec.ext.marshmallow import MarshmallowPlugin
 from apispec.ext.marshmallow.openapi import __location_map__
@@ -14,9 +21,35 @@ from flask_unchained.bundles.controller.constants import (
 )
 from flask_unchained.string_utils import pluralize, title_case
 
+from ..constants import BULK_CREATE, BULK_DELETE, BULK_PATCH
+from ..encoders import default
 from ..model_resource import ModelResource
 
 
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+OpenAPIDocument = namedtuple("OpenAPIDocument", ("data", "etag", "encodings"))
+"""
+A ``namedtuple`` of the rendered OpenAPI spec: its JSON ``data`` (bytes), its
+strong ``etag``, and a dictionary of its compressed variants by content encoding
+(``gzip``, plus ``br`` when ``brotli`` is installed).
+"""
+
+
+def _get_fields_parameter():
+    return {
+        "in": "query",
+        "name": "fields",
+        "required": False,
+        "description": "A comma-separated list of the fields to include.",
+        "schema": {"type": "string"},
+    }
+
+
 class Api:
     """
     The `Api` extension::
@@ -32,9 +65,11 @@ class Api:
         self.ma_plugin: MarshmallowPlugin = None
         self.spec: APISpec = None
         self.ModelResource = ModelResource
+        self._document: Optional[OpenAPIDocument] = None
 
     def init_app(self, app: FlaskUnchained):
         self.app = app
+        self._document = None
         app.extensions["api"] = self
 
         plugins = app.config.API_APISPEC_PLUGINS
@@ -62,6 +97,7 @@ class Api:
         name = name or serializer.__name__
         if name not in self.spec.components.schemas:
             self.spec.components.schema(name, schema=serializer, **kwargs)
+            self._document = None
 
     # FIXME need to be able to create 'fake' schemas for the query parameter
     def register_model_resource(self, resource: ModelResource):
@@ -70,6 +106,7 @@ class Api:
 
         :param resource:
         """
+        self._document = None
         model_name = resource.Meta.model.__name__
         self.spec.tag(
             {
@@ -112,7 +149,7 @@ class Api:
                 )
             elif method == GET:
                 docs[http_method] = dict(
-                    parameters=[],
+                    parameters=[_get_fields_parameter()],
                     responses={
                         "200": dict(
                             description=getattr(resource, GET).__doc__,
@@ -122,8 +159,12 @@ class Api:
                 )
             elif method == LIST:
                 http_method = "get"
+                pagination = resource.Meta.pagination
                 docs[http_method] = dict(
-                    parameters=[],
+                    parameters=[
+                        _get_fields_parameter(),
+                        *(pagination and pagination.get_query_parameters() or []),
+                    ],
                     responses={
                         "200": dict(
                             description=getattr(resource, LIST).__doc__,
@@ -164,9 +205,60 @@ class Api:
                     },
                 )
 
+            elif method == BULK_CREATE:
+                http_method = "post"
+                docs[http_method] = dict(
+                    parameters=[
+                        {
+                            "in": __location_map__["json"],
+                            "required": True,
+                            "schema": type(resource.Meta.serializer_create)(many=True),
+                        }
+                    ],
+                    responses={
+                        "201": dict(
+                            description=getattr(resource, BULK_CREATE).__doc__,
+                            schema=resource.Meta.serializer_many,
+                        ),
+                    },
+                )
+            elif method == BULK_PATCH:
+                http_method = "patch"
+                docs[http_method] = dict(
+                    parameters=[
+                        {
+                            "in": __location_map__["json"],
+                            "required": True,
+                            "schema": type(resource.Meta.serializer)(many=True),
+                        }
+                    ],
+                    responses={
+                        "200": dict(
+                            description=getattr(resource, BULK_PATCH).__doc__,
+                            schema=resource.Meta.serializer_many,
+                        ),
+                    },
+                )
+            elif method == BULK_DELETE:
+                http_method = "delete"
+                docs[http_method] = dict(
+                    parameters=[
+                        {
+                            "in": __location_map__["json"],
+                            "name": "body",
+                            "required": True,
+                            "description": "The primary keys to delete.",
+                            "schema": {"type": "array", "items": {}},
+                        }
+                    ],
+                    responses={
+                        "204": dict(description=getattr(resource, BULK_DELETE).__doc__),
+                    },
+                )
+
             docs[http_method]["tags"] = [model_name]
             display_name = title_case(model_name)
-            if method == LIST:
+            if method in {LIST, BULK_CREATE, BULK_DELETE, BULK_PATCH}:
                 display_name = pluralize(display_name)
             docs[http_method]["summary"] = f"{http_method.upper()} {display_name}"
 
@@ -199,3 +291,43 @@ class Api:
             api.register_field(CustomIntegerField, ma.fields.Integer)
         """
         self.ma_plugin.map_to_openapi_type(*args)(field)
+        self._document = None
+
+    def get_document(self) -> OpenAPIDocument:
+        """
+        Returns the OpenAPI spec, rendered to JSON and compressed once (and again
+        after serializers, resources or fields get registered). When the
+        ``API_SPEC_AUTO_RELOAD`` config option is enabled, the spec gets
+        re-rendered on every call, and recompressed if it changed.
+        """
+        if self._document is not None and not self.app.config.API_SPEC_AUTO_RELOAD:
+            return self._document
+
+        data = self.render_spec()
+        etag = hashlib.sha256(data).hexdigest()
+        if self._document is None or self._document.etag != etag:
+            self._document = OpenAPIDocument(data, etag, self.compress(data))
+        return self._document
+
+    def render_spec(self, indent: Optional[int] = None) -> bytes:
+        """
+        Renders the OpenAPI spec to JSON.
+
+        :param indent: How many spaces to indent the output by (compact if
+                       ``None``).
+        """
+        return json.dumps(
+            self.spec.to_dict(),
+            default=default,
+            indent=indent,
+            separators=(",", ": ") if indent is not None else (",", ":"),
+        ).encode()
+
+    def compress(self, data: bytes) -> Dict[str, bytes]:
+        """
+        Returns the compressed variants of ``data``, by content encoding.
+        """
+        encodings = {"gzip": gzip.compress(data, compresslevel=9, mtime=0)}
+        if brotli is not None:
+            encodings["br"] = brotli.compress(data, quality=11)
+        return encodings
@@ -29,7 +29,9 @@ class RegisterModelResourcesHook(AppFactoryHook):
 
     def process_objects(self, app, objects):
         """
-        Configures ModelSerializers on ModelResources.
+        Configures ModelSerializers on ModelResources, registers them with the
+        :class:`~flask_unchained.bundles.api.Api` extension, and renders its
+        OpenAPI spec.
         """
         api: Api = app.extensions["api"]
 
@@ -44,6 +46,9 @@ class RegisterModelResourcesHook(AppFactoryHook):
             self.bundle.resources_by_model[model_name] = resource_cls
             api.register_model_resource(resource_cls)
 
+        # render the spec once at startup, instead of on the first request for it
+        api.get_document()
+
     def attach_serializers_to_resource_cls(self, model_name, resource_cls):
         try:
             serializer_cls = self.bundle.serializers_by_model[model_name]
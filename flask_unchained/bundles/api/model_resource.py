@@ -1,10 +1,15 @@
 import inspect
+import json
 
+from collections.abc import Iterator
+from datetime import datetime
 from functools import partial
 from http import HTTPStatus
+from itertools import islice
 from typing import *
 
-from flask import current_app, make_response, request
+from flask import abort, current_app, make_response, request, stream_with_context
+from werkzeug.http import generate_etag, is_resource_modified
 from werkzeug.wrappers import Response
 
 from flask_unchained import Resource, injectable, param_converter, route, unchained
@@ -35,12 +40,43 @@ from flask_unchained.bundles.sqlalchemy.meta_options import ModelMetaOption
 from flask_unchained.string_utils import kebab_case, pluralize
 from py_meta_utils import McsArgs, MetaOption, _missing
 
-from .decorators import list_loader, patch_loader, post_loader, put_loader
+
+try:
+    from sqlalchemy.orm import Query
+except ImportError:
+    from py_meta_utils import OptionalClass as Query
+
+from .constants import (
+    ALL_MODEL_RESOURCE_METHODS,
+    BULK_CREATE,
+    BULK_DELETE,
+    BULK_METHODS,
+    BULK_PATCH,
+)
+from .decorators import (
+    bulk_create_loader,
+    bulk_delete_loader,
+    bulk_patch_loader,
+    if_match,
+    list_loader,
+    patch_loader,
+    post_loader,
+    put_loader,
+)
+from .encoders import default
 from .model_serializer import ModelSerializer
+from .pagination import Pagination
 from .utils import unpack
 
 
 class ModelResourceMetaclass(ResourceMetaclass):
+    resource_methods = {
+        **ResourceMetaclass.resource_methods,
+        BULK_CREATE: ["POST"],
+        BULK_PATCH: ["PATCH"],
+        BULK_DELETE: ["DELETE"],
+    }
+
     def __new__(mcs, name, bases, clsdict):
         mcs_args = McsArgs(mcs, name, bases, clsdict)
         cls = super().__new__(*mcs_args)
@@ -50,7 +86,7 @@ class ModelResourceMetaclass(ResourceMetaclass):
         routes: Dict[str, List[Route]] = getattr(cls, CONTROLLER_ROUTES_ATTR)
         include_methods = set(cls.Meta.include_methods)
         exclude_methods = set(cls.Meta.exclude_methods)
-        for method_name in ALL_RESOURCE_METHODS:
+        for method_name in ALL_MODEL_RESOURCE_METHODS:
             if method_name in exclude_methods or method_name not in include_methods:
                 routes.pop(method_name, None)
                 continue
@@ -61,6 +97,8 @@ class ModelResourceMetaclass(ResourceMetaclass):
 
             if method_name in RESOURCE_INDEX_METHODS:
                 rule = "/"
+            elif method_name in BULK_METHODS:
+                rule = "/bulk"
             else:
                 rule = cls.Meta.member_param
             route.rule = rule
@@ -151,7 +189,12 @@ class ModelResourceSerializerManyMetaOption(MetaOption):
 class ModelResourceIncludeMethodsMetaOption(MetaOption):
     """
     A list of resource methods to automatically include. Defaults to
-    ``('list', 'create', 'get', 'patch', 'put', 'delete')``.
+    ``('list', 'create', 'get', 'patch', 'put', 'delete')``. The bulk methods,
+    ``'bulk_create'``, ``'bulk_patch'`` and ``'bulk_delete'``, must be included
+    explicitly. They respond to POST, PATCH and DELETE requests to ``/bulk``
+    (relative to the resource's url prefix) with JSON arrays of items (or of
+    primary keys, for ``bulk_delete``), and commit each request's changes at
+    once (or none of them, if any item is invalid).
     """
 
     def __init__(self):
@@ -172,10 +215,10 @@ class ModelResourceIncludeMethodsMetaOption(MetaOption):
         if not value:
             return
 
-        if not all(x in ALL_RESOURCE_METHODS for x in value):
+        if not all(x in ALL_MODEL_RESOURCE_METHODS for x in value):
             raise ValueError(
                 f"Invalid values for the {self.name} meta option. The "
-                f"valid values are " + ", ".join(ALL_RESOURCE_METHODS)
+                f"valid values are " + ", ".join(ALL_MODEL_RESOURCE_METHODS)
             )
 
 
@@ -195,10 +238,10 @@ class ModelResourceExcludeMethodsMetaOption(MetaOption):
         if not value:
             return
 
-        if not all(x in ALL_RESOURCE_METHODS for x in value):
+        if not all(x in ALL_MODEL_RESOURCE_METHODS for x in value):
             raise ValueError(
                 f"Invalid values for the {self.name} meta option. The "
-                f"valid values are " + ", ".join(ALL_RESOURCE_METHODS)
+                f"valid values are " + ", ".join(ALL_MODEL_RESOURCE_METHODS)
             )
 
 
@@ -215,18 +258,29 @@ class ModelResourceIncludeDecoratorsMetaOption(MetaOption):
           - Decorator(s)
         * - list
           - :func:`~flask_unchained.bundles.api.decorators.list_loader`
+            (paginated if the ``pagination`` meta option is set, or streamed if
+            the ``stream`` meta option is set)
         * - create
           - :func:`~flask_unchained.bundles.api.decorators.post_loader`
         * - get
           - :func:`~flask_unchained.decorators.param_converter`
         * - patch
           - :func:`~flask_unchained.decorators.param_converter`,
+            :func:`~flask_unchained.bundles.api.decorators.if_match`,
             :func:`~flask_unchained.bundles.api.decorators.patch_loader`
         * - put
           - :func:`~flask_unchained.decorators.param_converter`,
+            :func:`~flask_unchained.bundles.api.decorators.if_match`,
             :func:`~flask_unchained.bundles.api.decorators.put_loader`
         * - delete
-          - :func:`~flask_unchained.decorators.param_converter`
+          - :func:`~flask_unchained.decorators.param_converter`,
+            :func:`~flask_unchained.bundles.api.decorators.if_match`
+        * - bulk_create
+          - :func:`~flask_unchained.bundles.api.decorators.bulk_create_loader`
+        * - bulk_patch
+          - :func:`~flask_unchained.bundles.api.decorators.bulk_patch_loader`
+        * - bulk_delete
+          - :func:`~flask_unchained.bundles.api.decorators.bulk_delete_loader`
     """
 
     def __init__(self):
@@ -237,7 +291,7 @@ class ModelResourceIncludeDecoratorsMetaOption(MetaOption):
         if value is not _missing:
             return value
 
-        return ALL_RESOURCE_METHODS
+        return ALL_MODEL_RESOURCE_METHODS
 
     def check_value(
         self,
@@ -247,10 +301,10 @@ class ModelResourceIncludeDecoratorsMetaOption(MetaOption):
         if not value:
             return
 
-        if not all(x in ALL_RESOURCE_METHODS for x in value):
+        if not all(x in ALL_MODEL_RESOURCE_METHODS for x in value):
             raise ValueError(
                 f"Invalid values for the {self.name} meta option. The "
-                f"valid values are " + ", ".join(ALL_RESOURCE_METHODS)
+                f"valid values are " + ", ".join(ALL_MODEL_RESOURCE_METHODS)
             )
 
 
@@ -271,10 +325,10 @@ class ModelResourceExcludeDecoratorsMetaOption(MetaOption):
         if not value:
             return
 
-        if not all(x in ALL_RESOURCE_METHODS for x in value):
+        if not all(x in ALL_MODEL_RESOURCE_METHODS for x in value):
             raise ValueError(
                 f"Invalid values for the {self.name} meta option. The "
-                f"valid values are " + ", ".join(ALL_RESOURCE_METHODS)
+                f"valid values are " + ", ".join(ALL_MODEL_RESOURCE_METHODS)
             )
 
 
@@ -312,6 +366,96 @@ class ModelResourceMethodDecoratorsMetaOption(MetaOption):
                     )
 
 
+class ModelResourceEtagColumnsMetaOption(MetaOption):
+    """
+    An optional list of model column names (eg a version counter, or the
+    ``updated_at`` timestamp) to compute ETags from, together with the primary
+    key. This makes it possible to answer conditional requests without serializing
+    the model instance(s). Defaults to ``None``, in which case ETags are computed
+    from the serialized response body.
+    """
+
+    def __init__(self):
+        super().__init__("etag_columns", default=None, inherit=True)
+
+    def check_value(
+        self,
+        value,
+        mcs_args: McsArgs,
+    ) -> None:
+        if not value:
+            return
+
+        if not isinstance(value, (list, tuple)) or not all(
+            isinstance(x, str) for x in value
+        ):
+            raise ValueError(
+                f"The {self.name} meta option must be a list or tuple of column names"
+            )
+
+
+class ModelResourcePaginationMetaOption(MetaOption):
+    """
+    Whether or not to paginate lists of model instances. Can be set to ``True`` (to
+    use offset pagination with the default settings), a pagination mode (``"offset"``
+    or ``"keyset"``), a dictionary of keyword arguments, or a
+    :class:`~flask_unchained.bundles.api.pagination.Pagination` instance. Defaults
+    to ``None`` (no pagination).
+    """
+
+    def __init__(self):
+        super().__init__("pagination", default=None, inherit=True)
+
+    def get_value(self, meta, base_classes_meta, mcs_args: McsArgs):
+        value = super().get_value(meta, base_classes_meta, mcs_args)
+        if value is True:
+            return Pagination()
+        elif isinstance(value, str):
+            return Pagination(value)
+        elif isinstance(value, dict):
+            return Pagination(**value)
+        return value
+
+    def check_value(
+        self,
+        value,
+        mcs_args: McsArgs,
+    ) -> None:
+        if not value or isinstance(value, Pagination):
+            return
+
+        raise ValueError(
+            f"The {self.name} meta option must be a pagination mode, a dict of "
+            f"Pagination keyword arguments, or a Pagination instance"
+        )
+
+
+class ModelResourceStreamMetaOption(MetaOption):
+    """
+    Whether or not to stream lists of model instances. When enabled, the
+    :meth:`~ModelResource.list` method receives the query instead of the list of
+    all model instances, and the response gets streamed (see
+    :meth:`~ModelResource.stream_response`). Can also be set to the number of
+    rows to fetch and serialize per batch (defaults to 1000 when set to ``True``).
+    Has no effect when the ``pagination`` meta option is set.
+    """
+
+    def __init__(self):
+        super().__init__("stream", default=False, inherit=True)
+
+    def check_value(
+        self,
+        value,
+        mcs_args: McsArgs,
+    ) -> None:
+        if isinstance(value, bool) or (isinstance(value, int) and value > 0):
+            return
+
+        raise ValueError(
+            f"The {self.name} meta option must be a boolean or a positive integer"
+        )
+
+
 class ModelResourceUrlPrefixMetaOption(MetaOption):
     """
     The url prefix to use for all routes from this resource. Defaults to the
@@ -357,6 +501,9 @@ class ModelResourceMetaOptionsFactory(ResourceMetaOptionsFactory):
         ModelResourceIncludeDecoratorsMetaOption,
         ModelResourceExcludeDecoratorsMetaOption,
         ModelResourceMethodDecoratorsMetaOption,
+        ModelResourceEtagColumnsMetaOption,
+        ModelResourcePaginationMetaOption,
+        ModelResourceStreamMetaOption,
     ]
 
     def __init__(self):
@@ -390,7 +537,7 @@ class ModelResource(Resource, metaclass=ModelResourceMetaclass):
 
     @classmethod
     def methods(cls):
-        for method in ALL_RESOURCE_METHODS:
+        for method in ALL_MODEL_RESOURCE_METHODS:
             if (
                 method in cls.Meta.exclude_methods
                 or method not in cls.Meta.include_methods
@@ -467,6 +614,45 @@ class ModelResource(Resource, metaclass=ModelResourceMetaclass):
         """
         return self.deleted(instance)
 
+    @route
+    def bulk_create(self, instances, errors):
+        """
+        Create instances of a model.
+
+        :param instances: The created model instances.
+        :param errors: Any errors, keyed by the index of the invalid items.
+        :return: The created model instances, or a dictionary of errors.
+        """
+        if errors:
+            return self.errors(errors)
+        return self.bulk_created(instances)
+
+    @route
+    def bulk_patch(self, instances, errors):
+        """
+        Partially update model instances.
+
+        :param instances: The model instances.
+        :param errors: Any errors, keyed by the index of the invalid items.
+        :return: The updated model instances, or a dictionary of errors.
+        """
+        if errors:
+            return self.errors(errors)
+        return self.bulk_updated(instances)
+
+    @route
+    def bulk_delete(self, instances, errors):
+        """
+        Delete model instances.
+
+        :param instances: The model instances.
+        :param errors: Any errors, keyed by the index of the invalid items.
+        :return: HTTPStatus.NO_CONTENT, or a dictionary of errors.
+        """
+        if errors:
+            return self.errors(errors)
+        return self.bulk_deleted(instances)
+
     def created(self, instance, commit=True):
         """
         Convenience method for saving a model (automatically commits it to
@@ -492,48 +678,283 @@ class ModelResource(Resource, metaclass=ModelResourceMetaclass):
         self.session_manager.save(instance, commit=True)
         return instance
 
+    def bulk_created(self, instances):
+        """
+        Convenience method for saving models (automatically commits them to the
+        database in one transaction and returns the objects with an HTTP 201
+        status code)
+        """
+        self.session_manager.save_all(instances, commit=True)
+        return instances, HTTPStatus.CREATED
+
+    def bulk_deleted(self, instances):
+        """
+        Convenience method for deleting models (automatically commits the
+        deletes to the database in one transaction and returns with an HTTP 204
+        status code)
+        """
+        self.session_manager.delete_all(instances, commit=True)
+        return "", HTTPStatus.NO_CONTENT
+
+    def bulk_updated(self, instances):
+        """
+        Convenience method for updating models (automatically commits them to the
+        database in one transaction and returns the objects with an HTTP 200
+        status code)
+        """
+        self.session_manager.save_all(instances, commit=True)
+        return instances
+
+    @classmethod
+    def _get_cache_options(cls) -> Dict[str, Any]:
+        # cached responses get invalidated when instances of the model get committed
+        options = super()._get_cache_options()
+        options["tags"] = (cls.Meta.model.__name__, *options.get("tags", ()))
+        return options
+
     def dispatch_request(self, method_name, *view_args, **view_kwargs):
         resp = super().dispatch_request(method_name, *view_args, **view_kwargs)
+        if isinstance(resp, Response):
+            # eg cached responses (answered conditionally, so keep their status)
+            return resp
+
         rv, code, headers = unpack(resp)
         if isinstance(rv, Response):
             return self.make_response(rv, code, headers)
+        elif method_name == LIST and isinstance(rv, (Query, Iterator)):
+            return self.stream_response(rv, code, headers)
+
+        conditional = method_name in {GET, LIST} and code == HTTPStatus.OK
+        etag = last_modified = None
+        if conditional and self._is_model_data(rv):
+            etag = self.get_etag(rv)
+            last_modified = self.get_last_modified(rv)
+
+            # if possible, answer conditional requests before serializing
+            if (etag or (last_modified and not request.if_none_match)) and not (
+                is_resource_modified(
+                    request.environ, etag=etag, last_modified=last_modified
+                )
+            ):
+                resp = make_response("", HTTPStatus.NOT_MODIFIED, headers)
+                return self._set_validators(resp, etag, last_modified)
 
+        read = method_name in {GET, LIST}
+        instance = full_data = None
         if isinstance(rv, list) and rv and isinstance(rv[0], self.Meta.model):
-            rv = self.Meta.serializer_many.dump(rv)
+            serializer = self.Meta.serializer_many
+            rv = (self.get_projection(serializer) if read else serializer).dump(rv)
         elif isinstance(rv, self.Meta.model):
-            rv = self.Meta.serializer.dump(rv)
-
-        return self.make_response(rv, code, headers)
+            instance, serializer = rv, self.Meta.serializer
+            projection = self.get_projection(serializer) if read else serializer
+            rv = projection.dump(instance)
+            if projection is serializer:
+                full_data = rv
+
+        resp = self.make_response(rv, code, headers)
+        if not conditional:
+            return resp
+
+        if not etag and not resp.get_etag()[0]:
+            if instance is not None:
+                etag = self._get_variant_etag(self.get_state_etag(instance, full_data))
+            else:
+                etag = generate_etag(resp.get_data())
+        return self._set_validators(resp, etag, last_modified).make_conditional(request)
 
     def make_response(self, data, code=200, headers=None):
         headers = headers or {}
         if isinstance(data, Response):
             return make_response(data, code, headers)
 
-        # FIXME need to support ETags
-        # see https://github.com/Nobatek/flask-rest-api/blob/master/flask_rest_api/response.py
+        handlers = current_app.config.ACCEPT_HANDLERS
+        resp = make_response(self.get_accept_handler()(data), code, headers)
+        if len(handlers) > 1:
+            resp.vary.add("Accept")
+        return resp
 
-        accept = request.headers.get("Accept", "application/json")
+    def get_accept_handler(self):
+        """
+        Returns the function from the ``ACCEPT_HANDLERS`` config option to convert
+        response data with, negotiated from the ``Accept`` header of the current
+        request (taking quality values into account). Aborts with HTTP 406 if the
+        client doesn't accept any of them.
+        """
+        handlers = current_app.config.ACCEPT_HANDLERS
+        if not request.accept_mimetypes:
+            return handlers.get("application/json") or next(iter(handlers.values()))
+
+        mimetype = request.accept_mimetypes.best_match(handlers)
+        if mimetype is None:
+            abort(HTTPStatus.NOT_ACCEPTABLE)
+        return handlers[mimetype]
+
+    def stream_response(self, rv, code=200, headers=None):
+        """
+        Returns a streamed response of the model instances from a query or an
+        iterator, as newline-delimited JSON if the client prefers
+        ``application/x-ndjson``, or otherwise as a (chunked) JSON array.
+
+        Rows are fetched from the database and dumped with the
+        :attr:`serializer_many` in batches, so that memory use stays flat
+        regardless of the number of rows.
+        """
+        batch_size = self.Meta.stream
+        if isinstance(batch_size, bool):
+            batch_size = 1000
+        ndjson = (
+            request.accept_mimetypes.best_match(
+                ["application/json", "application/x-ndjson"]
+            )
+            == "application/x-ndjson"
+        )
+        if isinstance(rv, Query):
+            rv = rv.yield_per(batch_size)
+        serializer = self.get_projection(self.Meta.serializer_many)
+
+        def generate():
+            rows = iter(rv)
+            first = True
+            if not ndjson:
+                yield "["
+            while True:
+                batch = list(islice(rows, batch_size))
+                if not batch:
+                    break
+
+                for data in serializer.dump(batch):
+                    if ndjson:
+                        yield current_app.json.dumps(data) + "\n"
+                    else:
+                        yield ("" if first else ",") + current_app.json.dumps(data)
+                    first = False
+            if not ndjson:
+                yield "]"
+
+        mimetype = "application/x-ndjson" if ndjson else "application/json"
+        return current_app.response_class(
+            stream_with_context(generate()), code, headers, mimetype=mimetype
+        )
+
+    def get_projection(self, serializer: ModelSerializer) -> ModelSerializer:
+        """
+        Returns the projection of ``serializer`` to the fields requested with the
+        ``fields`` query parameter (a comma-separated list of field names, as sent
+        over the wire), or ``serializer`` itself if the parameter isn't set.
+        Aborts with HTTP 400 if any of the requested fields is unknown.
+
+        See :meth:`~flask_unchained.bundles.api.ModelSerializer.get_projection`.
+        """
+        fields = request.args.get("fields")
+        if fields is None or serializer is None:
+            return serializer
+
+        fields = [field.strip() for field in fields.split(",") if field.strip()]
         try:
-            dump_fn = current_app.config.ACCEPT_HANDLERS[accept]
-        except KeyError as e:
-            # see if we can use JSON when there is no handler for the requested Accept header
-            if "*/*" not in accept:
-                raise e
-            dump_fn = current_app.config.ACCEPT_HANDLERS["application/json"]
+            return serializer.get_projection(fields, self.Meta.etag_columns or ())
+        except ValueError as e:
+            abort(HTTPStatus.BAD_REQUEST, str(e))
+
+    def get_etag(self, rv) -> Optional[str]:
+        """
+        Returns the (unquoted) ETag for a model instance or list of model instances,
+        computed from the primary key and :attr:`etag_columns` values of each
+        instance, or ``None`` if the ``etag_columns`` meta option isn't set.
+
+        ETags have the form ``<state>.<variant>``: the state part only depends on
+        the instances (see :meth:`get_state_etag`), while the variant part depends
+        on the representation requested (the ``Accept`` header and ``fields``
+        query param), so that ``If-None-Match`` works per representation.
+        """
+        if not self.Meta.etag_columns:
+            return None
+
+        if isinstance(rv, list):
+            values = [self._get_etag_values(obj) for obj in rv]
+            return self._get_variant_etag(generate_etag(repr(values).encode()))
+        return self._get_variant_etag(self.get_state_etag(rv))
+
+    def get_state_etag(self, instance, data: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Returns the (unquoted) validator for the current state of ``instance``,
+        independent of the representation requested: a hash of its primary key
+        and :attr:`etag_columns` values if set, otherwise of its full serialized
+        data (``data``, if already dumped with :attr:`serializer`).
+        """
+        if self.Meta.etag_columns:
+            return generate_etag(repr(self._get_etag_values(instance)).encode())
+
+        if data is None:
+            data = self.Meta.serializer.dump(instance)
+        return generate_etag(json.dumps(data, sort_keys=True, default=default).encode())
 
-        return make_response(dump_fn(data), code, headers)
+    def get_last_modified(self, rv) -> Optional[datetime]:
+        """
+        Returns the latest ``updated_at`` timestamp of a model instance or list of
+        model instances, or ``None`` if the model doesn't have an ``updated_at``
+        column.
+        """
+        updated_at = getattr(self.Meta.model.Meta, "updated_at", None)
+        instances = rv if isinstance(rv, list) else [rv]
+        if not updated_at or not instances:
+            return None
+
+        timestamps = [getattr(obj, updated_at, None) for obj in instances]
+        if not all(isinstance(x, datetime) for x in timestamps):
+            return None
+        return max(timestamps)
+
+    def get_current_etag(self, instance) -> str:
+        """
+        Returns the (unquoted) validator of the current state of ``instance``, as
+        included in the ETags of GET requests for it (whatever representation they
+        requested). Used for checking ``If-Match`` preconditions.
+        """
+        return self.get_state_etag(instance)
+
+    def _get_etag_values(self, instance) -> Tuple[Any, ...]:
+        columns = (self.Meta.model.Meta.pk, *self.Meta.etag_columns)
+        return tuple(getattr(instance, col) for col in columns)
+
+    def _get_variant_etag(self, state_etag: str) -> str:
+        accept = request.headers.get("Accept", "application/json")
+        fields = request.args.get("fields")
+        variant = generate_etag(repr((accept, fields)).encode())[:8]
+        return f"{state_etag}.{variant}"
+
+    def _get_projection_loader_options(self):
+        return self.get_projection(self.Meta.serializer).get_loader_options()
+
+    def _is_model_data(self, rv) -> bool:
+        if isinstance(rv, list):
+            return all(isinstance(x, self.Meta.model) for x in rv)
+        return isinstance(rv, self.Meta.model)
+
+    def _set_validators(self, resp, etag, last_modified):
+        if etag and not resp.get_etag()[0]:
+            resp.set_etag(etag, weak=True)
+        if last_modified and not resp.last_modified:
+            resp.last_modified = last_modified
+        return resp
 
     def get_decorators(self, method_name):
         decorators = list(super().get_decorators(method_name)).copy()
-        if method_name not in ALL_RESOURCE_METHODS:
+        if method_name not in ALL_MODEL_RESOURCE_METHODS:
             return decorators
 
+        # look up cached responses after the method decorators ran too (and
+        # before the default decorators load anything)
+        if self.Meta.cache is not None:
+            decorators.remove(self._get_cached_response)
+
         if isinstance(self.Meta.method_decorators, dict):
             decorators += list(self.Meta.method_decorators.get(method_name, []))
         elif isinstance(self.Meta.method_decorators, (list, tuple)):
             decorators += list(self.Meta.method_decorators)
 
+        if self.Meta.cache is not None:
+            decorators.append(self._get_cached_response)
+
         if (
             method_name in self.Meta.exclude_decorators
             or method_name not in self.Meta.include_decorators
@@ -541,7 +962,15 @@ class ModelResource(Resource, metaclass=ModelResourceMetaclass):
             return decorators
 
         if method_name == LIST:
-            decorators.append(partial(list_loader, model=self.Meta.model))
+            decorators.append(
+                partial(
+                    list_loader,
+                    model=self.Meta.model,
+                    pagination=self.Meta.pagination,
+                    stream=bool(self.Meta.stream),
+                    serializer=partial(self.get_projection, self.Meta.serializer_many),
+                )
+            )
         elif method_name in RESOURCE_MEMBER_METHODS:
             param_name = get_param_tuples(self.Meta.member_param)[0][1]
             kw_name = "instance"  # needed by the patch/put loaders
@@ -551,9 +980,22 @@ class ModelResource(Resource, metaclass=ModelResourceMetaclass):
             if method_name in {DELETE, GET}:
                 sig = inspect.signature(getattr(self, method_name))
                 kw_name = list(sig.parameters.keys())[0]
+            options = None
+            if method_name == GET and self.Meta.serializer is not None:
+                options = self._get_projection_loader_options
+            elif method_name != DELETE and self.Meta.serializer is not None:
+                options = self.Meta.serializer.get_loader_options()
             decorators.append(
-                partial(param_converter, **{param_name: {kw_name: self.Meta.model}})
+                partial(
+                    param_converter,
+                    options=options,
+                    **{param_name: {kw_name: self.Meta.model}},
+                )
             )
+            if method_name in {DELETE, PATCH, PUT}:
+                decorators.append(
+                    partial(if_match, etag_fn=self.get_current_etag, kw_name=kw_name)
+                )
 
         if method_name == CREATE:
             decorators.append(
@@ -563,6 +1005,26 @@ class ModelResource(Resource, metaclass=ModelResourceMetaclass):
             decorators.append(partial(patch_loader, serializer=self.Meta.serializer))
         elif method_name == PUT:
             decorators.append(partial(put_loader, serializer=self.Meta.serializer))
+        elif method_name == BULK_CREATE:
+            decorators.append(
+                partial(bulk_create_loader, serializer=self.Meta.serializer_create)
+            )
+        elif method_name == BULK_PATCH:
+            decorators.append(
+                partial(
+                    bulk_patch_loader,
+                    serializer=self.Meta.serializer,
+                    model=self.Meta.model,
+                )
+            )
+        elif method_name == BULK_DELETE:
+            decorators.append(
+                partial(
+                    bulk_delete_loader,
+                    serializer=self.Meta.serializer,
+                    model=self.Meta.model,
+                )
+            )
         return decorators
 
 
@@ -1,6 +1,8 @@
 from types import FunctionType
 from typing import *
+from weakref import WeakKeyDictionary
 
+from flask import current_app, has_app_context
 from speaklater import _LazyString
 
 from flask_unchained import unchained
@@ -17,11 +19,14 @@ try:
     from marshmallow.class_registry import _registry
     from marshmallow.exceptions import ValidationError as MarshmallowValidationError
     from marshmallow.fields import Field
+    from marshmallow.fields import List as ListField
+    from marshmallow.fields import Nested
     from marshmallow_sqlalchemy.convert import ModelConverter as BaseModelConverter
     from marshmallow_sqlalchemy.schema import (
         SQLAlchemyAutoSchemaMeta as BaseModelSerializerMetaclass,
     )
-    from sqlalchemy.orm import SynonymProperty
+    from sqlalchemy import inspect as sa_inspect
+    from sqlalchemy.orm import SynonymProperty, joinedload, load_only, selectinload
 except ImportError:
     _registry = {}
     from py_meta_utils import OptionalClass as BaseModelSerializer
@@ -230,28 +235,132 @@ class ModelSerializerOptionsClass(BaseModelSerializerOptionsClass):
         self._model = model
 
 
-def maybe_convert_keys(
-    data: Any,
-    key_fn: Optional[FunctionType] = None,
-    fields: Tuple[str] = (),
-    many: bool = False,
-) -> Any:
-    if not key_fn or not fields:
+class _KeyMap(dict):
+    """
+    A precomputed mapping of keys to their converted names. Keys that weren't
+    known up front get converted on the fly (but aren't cached, since they come
+    from request data).
+
+    For internal use only.
+    """
+
+    def __init__(
+        self,
+        key_fn: Optional[FunctionType],
+        fields: Set[str],
+        keys: Iterable[str] = (),
+    ):
+        super().__init__()
+        self.key_fn = key_fn
+        self.fields = fields
+        self.enabled = bool(key_fn and fields)
+        if self.enabled:
+            for key in keys:
+                self[key] = self.__missing__(key)
+
+    def __missing__(self, key):
+        if not isinstance(key, str):
+            return key
+        new_key = self.key_fn(key)
+        if key not in self.fields and new_key not in self.fields:
+            return key
+        return new_key
+
+    def convert(self, data: Any, many: bool = False) -> Any:
+        if not self.enabled:
+            return data
+        elif many:
+            return [self.convert(el) for el in data]
+        elif isinstance(data, dict):
+            return {self[k]: v for k, v in data.items()}
         return data
 
-    if many:
-        return [maybe_convert_keys(el, key_fn, fields, many=False) for el in data]
-    elif isinstance(data, dict):
-        rv = data.copy()
-        for k, v in data.items():
-            new_k = key_fn(k)
-            if k not in fields and new_k not in fields:
-                continue
-            if k != new_k:
-                rv.pop(k)
-            rv[new_k] = v
-        return rv
-    return data
+
+# the loader options of serializer instances, and the model class they were built
+# for (kept out of the instances, because apispec deep copies serializers)
+_loader_options_cache = WeakKeyDictionary()
+
+# the projections of serializer instances, by field names and extra columns
+_projections_cache = WeakKeyDictionary()
+_MAX_PROJECTIONS = 128
+
+
+def _get_loader_options(
+    serializer: "ModelSerializer",
+    model,
+    seen: FrozenSet[type] = frozenset(),
+    prefix: str = "",
+) -> Tuple[List[Any], List[str]]:
+    """
+    Returns the loader options (and a description of them) to eager load the
+    relationships of ``model`` that ``serializer`` dumps.
+    """
+    try:
+        relationships = sa_inspect(model).relationships
+    except Exception:
+        return [], []
+
+    seen = seen | {type(serializer)}
+    options, plan = [], []
+    for name, field in serializer.dump_fields.items():
+        strategy = field.metadata.get("eager_load", True)
+        attr = field.attribute or name
+        if not strategy or attr not in relationships:
+            continue
+
+        relationship = relationships[attr]
+        if strategy is True:
+            strategy = "selectin" if relationship.uselist else "joined"
+        elif strategy not in {"selectin", "joined"}:
+            raise ValueError(
+                f"Invalid eager_load strategy {strategy!r} for the {name} field "
+                f'of {type(serializer).__name__} (must be "selectin" or "joined")'
+            )
+
+        loader_fn = selectinload if strategy == "selectin" else joinedload
+        loader = loader_fn(getattr(model, attr))
+        plan.append(f"{prefix}{attr} ({strategy})")
+
+        inner = field.inner if isinstance(field, ListField) else field
+        nested = isinstance(inner, Nested) and inner.schema
+        if isinstance(nested, ModelSerializer) and type(nested) not in seen:
+            nested_options, nested_plan = _get_loader_options(
+                nested, relationship.mapper.class_, seen, f"{prefix}{attr}."
+            )
+            if nested_options:
+                loader = loader.options(*nested_options)
+            plan.extend(nested_plan)
+        options.append(loader)
+    return options, plan
+
+
+def _get_load_only_columns(
+    serializer: "ModelSerializer",
+    model,
+    extra_columns: Iterable[str] = (),
+) -> Optional[Set[str]]:
+    """
+    Returns the names of the column attributes of ``model`` needed to dump the
+    fields of ``serializer``, or ``None`` if some field doesn't map to a column or
+    a relationship (so it's unknown which columns it needs).
+    """
+    mapper = sa_inspect(model)
+    columns = {model.Meta.pk, *extra_columns}
+    if model.Meta.updated_at in mapper.column_attrs:
+        columns.add(model.Meta.updated_at)
+
+    for name, field in serializer.dump_fields.items():
+        attr = field.attribute or name
+        if attr in mapper.column_attrs:
+            columns.add(attr)
+        elif attr in mapper.relationships:
+            columns.update(
+                mapper.get_property_by_column(column).key
+                for column in mapper.relationships[attr].local_columns
+            )
+        else:
+            return None
+    return columns
 
 
 class ModelSerializer(BaseModelSerializer, metaclass=ModelSerializerMetaclass):
@@ -290,6 +399,92 @@ class ModelSerializer(BaseModelSerializer, metaclass=ModelSerializerMetaclass):
     OPTIONS_CLASS = ModelSerializerOptionsClass
     opts: ModelSerializerOptionsClass = None  # set by the metaclass
 
+    # the extra columns to load, if this serializer is a projection
+    _projection_columns: Optional[Tuple[str, ...]] = None
+
+    def get_loader_options(self) -> List[Any]:
+        """
+        Returns the SQLAlchemy loader options to eager load the relationships this
+        serializer dumps (taking ``only`` and ``exclude`` into account), so that
+        dumping model instances doesn't lazy load them one at a time. To-many
+        relationships use ``selectinload``, and to-one relationships use
+        ``joinedload``. The loader options of nested model serializers get
+        chained.
+
+        Set the ``eager_load`` metadata of a field to ``False`` to opt out, or to
+        ``"selectin"`` or ``"joined"`` to choose the loading strategy::
+
+            articles = ma.Nested('ArticleSerializer', many=True,
+                                 metadata={'eager_load': False})
+        """
+        model = self.opts.model
+        cached = _loader_options_cache.get(self)
+        if cached and cached[0] is model:
+            return cached[1]
+
+        options, plan = _get_loader_options(self, model)
+        if self._projection_columns is not None:
+            columns = _get_load_only_columns(self, model, self._projection_columns)
+            if columns:
+                options.append(load_only(*[getattr(model, col) for col in columns]))
+                plan.append("load only " + ", ".join(sorted(columns)))
+
+        if has_app_context():
+            current_app.logger.debug(
+                f"{type(self).__name__} eager loading plan: "
+                + (", ".join(plan) or "(none)")
+            )
+        _loader_options_cache[self] = (model, options)
+        return options
+
+    def get_projection(
+        self,
+        fields: Iterable[str],
+        extra_columns: Iterable[str] = (),
+    ) -> "ModelSerializer":
+        """
+        Returns a copy of this serializer that only dumps the given fields (by
+        their names as sent over the wire, or by their field names). The loader
+        options of projections also only load the columns needed to dump their
+        fields (plus the primary key, ``model.Meta.updated_at`` and
+        ``extra_columns``), unless some field isn't a column or a relationship.
+
+        Projections are cached per serializer instance.
+
+        :raises ValueError: If any of the fields is unknown (or not dumped).
+        """
+        fields = tuple(fields)
+        extra_columns = tuple(extra_columns)
+        names = set()
+        invalid = []
+        for field in fields:
+            name = self._dump_field_names.get(field)
+            if name is None:
+                invalid.append(field)
+            else:
+                names.add(name)
+        if invalid:
+            raise ValueError(f"Invalid fields: {', '.join(invalid)}")
+
+        key = (frozenset(names), extra_columns)
+        projections = _projections_cache.setdefault(self, {})
+        if key in projections:
+            return projections[key]
+
+        projection = type(self)(
+            only=names,
+            exclude=self.exclude,
+            many=self.many,
+            context=self.context,
+            load_only=self.load_only,
+            dump_only=self.dump_only,
+        )
+        projection._projection_columns = extra_columns
+        if len(projections) >= _MAX_PROJECTIONS:
+            projections.pop(next(iter(projections)))
+        projections[key] = projection
+        return projection
+
     def is_create(self):
         """
         Check if we're creating a new object. Note that this context flag
@@ -329,23 +524,21 @@ class ModelSerializer(BaseModelSerializer, metaclass=ModelSerializerMetaclass):
         data = data or {}
 
         # maybe convert all keys in data with the configured fn
-        data = maybe_convert_keys(
-            data,
-            self.opts.load_key_fn,
-            self.opts.fields or set(self.declared_fields.keys()),
-            many=many,
-        )
+        many = self.many if many is None else many
+        data = self._load_keys.convert(data, many)
         try:
             return super().load(
                 data, many=many, partial=partial, unknown=unknown, **kwargs
             )
         except MarshmallowValidationError as e:
-            e.messages = maybe_convert_keys(
-                e.messages,
-                self.opts.dump_key_fn,
-                self.opts.fields or set(self.declared_fields.keys()),
-                many=False,
-            )
+            if many and isinstance(e.messages, dict):
+                # the errors of collections are keyed by the index of the items
+                e.messages = {
+                    i: self._dump_keys.convert(messages)
+                    for i, messages in e.messages.items()
+                }
+            else:
+                e.messages = self._dump_keys.convert(e.messages)
             raise e
 
     def dump(self, obj, *, many: bool = None):
@@ -361,12 +554,7 @@ class ModelSerializer(BaseModelSerializer, metaclass=ModelSerializerMetaclass):
         data = super().dump(obj, many=many)
 
         # maybe convert all keys in data with the configured fn
-        return maybe_convert_keys(
-            data,
-            self.opts.dump_key_fn,
-            fields=self.opts.fields or set(self.declared_fields.keys()),
-            many=many,
-        )
+        return self._dump_keys.convert(data, self.many if many is None else many)
 
     def handle_error(
         self, error: MarshmallowValidationError, data: Any, **kwargs
@@ -380,19 +568,27 @@ class ModelSerializer(BaseModelSerializer, metaclass=ModelSerializerMetaclass):
             "Missing data for required field.",
             "Field may not be null.",
         }
-        for field_name in error.normalized_messages():
-            for i, msg in enumerate(error.messages[field_name]):
-                if isinstance(msg, _LazyString):
-                    msg = str(msg)
-                if msg in required_messages:
-                    label = title_case(field_name)
-                    error.messages[field_name][i] = f"{label} is required."
+        all_messages = [error.normalized_messages()]
+        if kwargs.get("many"):
+            # the errors of collections are keyed by the index of the items
+            all_messages = [m for m in all_messages[0].values() if isinstance(m, dict)]
+
+        for messages in all_messages:
+            for field_name in messages:
+                for i, msg in enumerate(messages[field_name]):
+                    if isinstance(msg, _LazyString):
+                        msg = str(msg)
+                    if msg in required_messages:
+                        label = title_case(field_name)
+                        messages[field_name][i] = f"{label} is required."
 
     def _init_fields(self):
         """
         Overridden to:
         - automatically validate ids (primary keys) are the same when updating objects.
         - automatically convert slug, created_at, and updated_at to dump-only fields
+        - precompute the key conversions of field names for dumping and loading
+          (and the lookup of dumped fields by their converted names)
         """
         super()._init_fields()
 
@@ -414,6 +610,19 @@ class ModelSerializer(BaseModelSerializer, metaclass=ModelSerializerMetaclass):
                 self.dump_fields[name] = field
                 self.load_fields.pop(name, None)
 
+        fields = set(self.opts.fields or self.declared_fields.keys())
+        keys = {field.data_key or name for name, field in self.fields.items()}
+        self._dump_keys = _KeyMap(self.opts.dump_key_fn, fields, keys)
+        self._load_keys = _KeyMap(
+            self.opts.load_key_fn,
+            fields,
+            keys | {self._dump_keys[key] for key in keys},
+        )
+        self._dump_field_names = {}
+        for name, field in self.dump_fields.items():
+            self._dump_field_names[name] = name
+            self._dump_field_names[self._dump_keys[field.data_key or name]] = name
+
 
 __all__ = [
     "ModelConverter",
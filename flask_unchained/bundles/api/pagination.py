@@ -0,0 +1,274 @@
+import base64
+import binascii
+
+from http import HTTPStatus
+from typing import *
+from urllib.parse import urlencode
+
+from flask import abort, request
+
+
+try:
+    from sqlalchemy import text
+except ImportError:
+    text = None
+
+
+class Page:
+    """
+    A page of model instances, as returned by :meth:`Pagination.paginate`.
+    """
+
+    def __init__(
+        self,
+        items: List[Any],
+        per_page: int,
+        page: Optional[int] = None,
+        next_cursor: Optional[str] = None,
+        has_next: bool = False,
+        total: Optional[int] = None,
+    ):
+        self.items = items
+        """
+        The model instances on this page.
+        """
+
+        self.per_page = per_page
+        """
+        The (maximum) number of model instances per page.
+        """
+
+        self.page = page
+        """
+        The page number (for offset pagination).
+        """
+
+        self.next_cursor = next_cursor
+        """
+        The cursor of the next page (for keyset pagination).
+        """
+
+        self.has_next = has_next
+        """
+        Whether or not there is a next page.
+        """
+
+        self.total = total
+        """
+        The (possibly estimated) total number of model instances, if counted.
+        """
+
+    def get_headers(self) -> Dict[str, str]:
+        """
+        Returns the ``Link`` header (and the ``X-Total-Count`` header, if the total
+        got counted) for the current request.
+        """
+        links = []
+        if self.page is not None:
+            links.append(("first", {"page": 1}))
+            if self.page > 1:
+                links.append(("prev", {"page": self.page - 1}))
+            if self.has_next:
+                links.append(("next", {"page": self.page + 1}))
+            if self.total is not None:
+                last_page = max(1, -(-self.total // self.per_page))
+                links.append(("last", {"page": last_page}))
+        else:
+            links.append(("first", {"cursor": None}))
+            if self.has_next:
+                links.append(("next", {"cursor": self.next_cursor}))
+
+        headers = {
+            "Link": ", ".join(
+                f'<{_url_with_args(args)}>; rel="{rel}"' for rel, args in links
+            )
+        }
+        if self.total is not None:
+            headers["X-Total-Count"] = str(self.total)
+        return headers
+
+
+class Pagination:
+    """
+    Pagination settings for :class:`~flask_unchained.bundles.api.ModelResource`
+    lists, as set by the ``pagination`` meta option::
+
+        class UserResource(ModelResource):
+            class Meta:
+                model = User
+                pagination = Pagination(Pagination.KEYSET, per_page=50)
+
+    Results are always ordered by the primary key of the model, so that pages are
+    stable. Clients select pages using the ``page`` (offset pagination) or the
+    ``cursor`` (keyset pagination) query parameters, and the page size with the
+    ``per_page`` query parameter. Links to other pages are sent in the ``Link``
+    header.
+
+    :param mode: Either ``"offset"`` (the default) or ``"keyset"``. Keyset
+                 pagination stays fast for deep pages, but pages can only be
+                 navigated forwards.
+    :param per_page: The default number of items per page.
+    :param max_per_page: The maximum number of items per page clients may request.
+    :param count: Whether or not to send the total number of items in the
+                  ``X-Total-Count`` header. Set to ``"estimate"`` to use table
+                  statistics when the database supports it (PostgreSQL), instead
+                  of running a ``COUNT`` query.
+    """
+
+    OFFSET = "offset"
+    KEYSET = "keyset"
+
+    def __init__(
+        self,
+        mode: str = OFFSET,
+        per_page: int = 20,
+        max_per_page: int = 100,
+        count: Union[bool, str] = False,
+    ):
+        if mode not in {self.OFFSET, self.KEYSET}:
+            raise ValueError(
+                f"Invalid pagination mode {mode!r} (must be "
+                f"{self.OFFSET!r} or {self.KEYSET!r})"
+            )
+        if count not in {True, False, "estimate"}:
+            raise ValueError('count must be True, False, or "estimate"')
+
+        self.mode = mode
+        self.per_page = min(per_page, max_per_page)
+        self.max_per_page = max_per_page
+        self.count = count
+
+    def paginate(self, query, model) -> Page:
+        """
+        Returns the :class:`Page` of ``query`` requested by the current request.
+        """
+        pk = getattr(model, model.Meta.pk)
+        per_page = self._get_int_arg("per_page", self.per_page)
+        per_page = min(per_page, self.max_per_page)
+
+        total = None
+        if self.count:
+            total = self._count(query, model)
+
+        if self.mode == self.OFFSET:
+            page = self._get_int_arg("page", 1)
+            items = (
+                query.order_by(pk).offset((page - 1) * per_page).limit(per_page + 1).all()
+            )
+            return Page(
+                items[:per_page],
+                per_page,
+                page=page,
+                has_next=len(items) > per_page,
+                total=total,
+            )
+
+        cursor = request.args.get("cursor")
+        if cursor:
+            query = query.filter(pk > self._decode_cursor(cursor, pk))
+        items = query.order_by(pk).limit(per_page + 1).all()
+        has_next = len(items) > per_page
+        items = items[:per_page]
+        next_cursor = None
+        if has_next:
+            next_cursor = self._encode_cursor(getattr(items[-1], model.Meta.pk))
+        return Page(
+            items, per_page, next_cursor=next_cursor, has_next=has_next, total=total
+        )
+
+    def get_query_parameters(self) -> List[Dict[str, Any]]:
+        """
+        Returns the OpenAPI specs of the query parameters for selecting pages.
+        """
+        per_page = {
+            "in": "query",
+            "name": "per_page",
+            "required": False,
+            "description": "The number of items per page.",
+            "schema": {
+                "type": "integer",
+                "minimum": 1,
+                "maximum": self.max_per_page,
+                "default": self.per_page,
+            },
+        }
+        if self.mode == self.OFFSET:
+            return [
+                {
+                    "in": "query",
+                    "name": "page",
+                    "required": False,
+                    "description": "The page number.",
+                    "schema": {"type": "integer", "minimum": 1, "default": 1},
+                },
+                per_page,
+            ]
+        return [
+            {
+                "in": "query",
+                "name": "cursor",
+                "required": False,
+                "description": 'The cursor of the page (from the "next" link).',
+                "schema": {"type": "string"},
+            },
+            per_page,
+        ]
+
+    def _count(self, query, model) -> int:
+        if (
+            self.count == "estimate"
+            and query.session.get_bind().dialect.name == "postgresql"
+        ):
+            estimate = query.session.execute(
+                text(
+                    "SELECT reltuples::bigint FROM pg_class "
+                    "WHERE oid = CAST(:table AS regclass)"
+                ),
+                {"table": model.__table__.fullname},
+            ).scalar()
+            # tables that were never vacuumed or analyzed have no estimate
+            if estimate is not None and estimate >= 0:
+                return estimate
+        return query.order_by(None).count()
+
+    def _get_int_arg(self, name: str, default: int) -> int:
+        value = request.args.get(name)
+        if value is None:
+            return default
+        try:
+            value = int(value)
+        except ValueError:
+            value = 0
+        if value < 1:
+            abort(HTTPStatus.BAD_REQUEST, f"The {name} query parameter must be >= 1")
+        return value
+
+    def _decode_cursor(self, cursor: str, pk) -> Any:
+        try:
+            value = base64.urlsafe_b64decode(cursor.encode()).decode()
+            return pk.type.python_type(value)
+        except (binascii.Error, UnicodeDecodeError, ValueError, TypeError):
+            abort(HTTPStatus.BAD_REQUEST, "Invalid cursor")
+
+    def _encode_cursor(self, value: Any) -> str:
+        return base64.urlsafe_b64encode(str(value).encode()).decode()
+
+    def __repr__(self):
+        return (
+            f"Pagination(mode={self.mode!r}, per_page={self.per_page}, "
+            f"max_per_page={self.max_per_page}, count={self.count!r})"
+        )
+
+
+def _url_with_args(args: Dict[str, Any]) -> str:
+    query_args = [(k, v) for k, v in request.args.items(multi=True) if k not in args]
+    query_args += [(k, v) for k, v in args.items() if v is not None]
+    if not query_args:
+        return request.base_url
+    return f"{request.base_url}?{urlencode(query_args)}"
+
+
+__all__ = [
+    "Page",
+    "Pagination",
+]
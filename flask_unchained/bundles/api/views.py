@@ -1,4 +1,4 @@
-from flask_unchained import Controller, current_app, injectable, route
+from flask_unchained import Controller, current_app, injectable, request, route
 
 from .extensions import Api
 
@@ -15,4 +15,25 @@ class OpenAPIController(Controller):
 
     @route("/openapi.json")
     def json(self):
-        return self.jsonify(self.api.spec.to_dict())
+        """
+        Serves the pre-rendered OpenAPI spec, compressed with brotli or gzip when
+        the client accepts them, and answered conditionally by its ETag.
+        """
+        document = self.api.get_document()
+        encoding = None
+        for name in ("br", "gzip"):
+            if name in document.encodings and request.accept_encodings[name]:
+                encoding = name
+                break
+
+        response = current_app.response_class(
+            document.encodings[encoding] if encoding else document.data,
+            mimetype="application/json",
+        )
+        if encoding:
+            response.content_encoding = encoding
+            response.set_etag(f"{document.etag}-{encoding}")
+        else:
+            response.set_etag(document.etag)
+        response.vary.add("Accept-Encoding")
+        return response.make_conditional(request)
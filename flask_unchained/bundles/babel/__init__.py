@@ -5,7 +5,7 @@ from typing import *
 import pkg_resources
 
 from flask import Blueprint, current_app, g, request
-from flask_babel import Domain
+from flask_babel import Domain, force_locale, get_domain
 from flask_babel import gettext as _gettext
 from flask_babel import ngettext as _ngettext
 from speaklater import make_lazy_string
@@ -49,6 +49,8 @@ class BabelBundle(Bundle):
     _has_views = False
 
     def before_init_app(self, app: FlaskUnchained):
+        # domains cache their loaded catalogs, so they get reused per app
+        app.extensions["babel_domains"] = {}
         app.jinja_env.add_extension("jinja2.ext.i18n")
         babel.locale_selector_func = self.get_locale
 
@@ -74,6 +76,27 @@ class BabelBundle(Bundle):
                 lazy_gettext, lazy_ngettext, newstyle=True
             )
 
+    def warmup(self, app: FlaskUnchained) -> Dict[str, int]:
+        """
+        Load the message catalogs of the default domain, and of every bundle with
+        translations, for each of the configured ``LANGUAGES``.
+        """
+        domains = [
+            _get_domain_by_name(bundle.module_name, app)
+            for bundle in app.unchained.bundles.values()
+            if _has_translations(bundle.module_name)
+        ]
+
+        catalogs = 0
+        with app.test_request_context():
+            domains.insert(0, get_domain())
+            for language in app.config.LANGUAGES:
+                with force_locale(language):
+                    for domain in domains:
+                        domain.get_translations()
+                        catalogs += 1
+        return {"catalogs": catalogs}
+
     def get_url_rule(self, rule: Optional[str]):
         if not rule:
             return f"/<{self.language_code_key}>"
@@ -171,10 +194,26 @@ def lazy_ngettext(*args, **kwargs):
 
 
 def _get_domain(match):
-    domain_name = match.groupdict()["domain"]
+    return _get_domain_by_name(match.groupdict()["domain"])
+
+
+def _get_domain_by_name(domain_name, app=None):
+    app = app or current_app
+    domains: Dict[str, Domain] = app.extensions.setdefault("babel_domains", {})
+    if domain_name in domains:
+        return domains[domain_name]
+
     try:
         domain_resources = pkg_resources.resource_filename(domain_name, "translations")
     except ImportError:
-        return current_app.extensions["babel"]._default_domain
+        return app.extensions["babel"]._default_domain
 
-    return Domain(domain_resources, domain=domain_name)
+    domains[domain_name] = Domain(domain_resources, domain=domain_name)
+    return domains[domain_name]
+
+
+def _has_translations(module_name):
+    try:
+        return pkg_resources.resource_isdir(module_name, "translations")
+    except ImportError:
+        return False
@@ -1,11 +1,22 @@
 from collections import defaultdict
 from typing import *
+from warnings import warn
 
 from flask_wtf.csrf import generate_csrf
+from jinja2 import TemplateError
 
 from flask_unchained import Bundle, FlaskUnchained
 from flask_unchained.constants import DEV, TEST
 
+from .caching import (
+    FileSystemViewCache,
+    LRUViewCache,
+    RedisViewCache,
+    ViewCache,
+    cached_view,
+    get_view_cache,
+    register_invalidation_listeners,
+)
 from .constants import (
     ALL_RESOURCE_METHODS,
     CREATE,
@@ -90,6 +101,14 @@ class ControllerBundle(Bundle):
             app.url_map.converters[name] = StringConverter
 
     def after_init_app(self, app: FlaskUnchained) -> None:
+        """
+        Configure setting the CSRF token cookie, and invalidating the view cache
+        when models get committed to the database (if the SQLAlchemy Bundle is
+        enabled).
+        """
+        if "sqlalchemy_bundle" in app.unchained.bundles:
+            register_invalidation_listeners()
+
         if app.config.WTF_CSRF_ENABLED:
 
             @app.after_request
@@ -100,11 +119,62 @@ class ControllerBundle(Bundle):
                     )
                 return response
 
+    def warmup(self, app: FlaskUnchained) -> Dict[str, int]:
+        """
+        Build the URL map's matcher, instantiate stateless controllers (and apply
+        their decorators), and compile the templates of the controllers with
+        registered routes (when Jinja's template cache is enabled).
+        """
+        app.url_map.update()
+
+        controllers = set()
+        for view_func in app.view_functions.values():
+            view_class = getattr(view_func, "view_class", None)
+            if (
+                isinstance(view_class, type)
+                and issubclass(view_class, Controller)
+                and view_class.Meta.stateless
+            ):
+                controller = view_class._get_instance(view_func)
+                controller._get_decorated_view_func(view_func.__name__)
+                controllers.add(id(controller))
+
+        templates = 0
+        template_folders = {
+            route._controller_cls.Meta.template_folder
+            for routes in self.endpoints.values()
+            for route in routes
+            if route._controller_cls and route._controller_cls.Meta.template_folder
+        }
+        if app.jinja_env.cache is not None and template_folders:
+            prefixes = tuple(f"{folder}/" for folder in template_folders)
+            for template_name in app.jinja_env.list_templates():
+                if not template_name.startswith(prefixes):
+                    continue
+                try:
+                    app.jinja_env.get_template(template_name)
+                except TemplateError as e:
+                    warn(f"Could not preload the {template_name} template: {e}")
+                else:
+                    templates += 1
+
+        return {
+            "routes": len(app.view_functions),
+            "controllers": len(controllers),
+            "templates": templates,
+        }
+
 
 __all__ = [
     "ControllerBundle",
     "Controller",
     "Resource",
+    "cached_view",
+    "get_view_cache",
+    "FileSystemViewCache",
+    "LRUViewCache",
+    "RedisViewCache",
+    "ViewCache",
     "route",
     "no_route",
     "param_converter",
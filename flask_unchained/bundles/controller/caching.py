@@ -0,0 +1,496 @@
+import hashlib
+import os
+import pickle
+import shutil
+import stat
+import tempfile
+import threading
+import time
+
+from collections import OrderedDict
+from functools import wraps
+from itertools import chain
+from typing import *
+
+from flask import current_app, has_app_context, request
+
+from flask_unchained import FlaskUnchained
+
+
+try:
+    from flask_login import current_user
+except ImportError:
+    current_user = None
+
+try:
+    from sqlalchemy import event
+    from sqlalchemy import inspect as sa_inspect
+except ImportError:
+    event = None
+
+
+_TAGS_SESSION_INFO_KEY = "view_cache_tags"
+
+
+class ViewCache:
+    """
+    Base class for the stores of cached view responses. Entries are tagged (with
+    the names of the models they depend on), so that they can be invalidated
+    together.
+    """
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Returns the value stored for ``key``, or ``None`` if it's missing or expired.
+        """
+        raise NotImplementedError
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        timeout: int = 0,
+        tags: Iterable[str] = (),
+    ) -> None:
+        """
+        Stores ``value`` for ``key``, for ``timeout`` seconds (or until invalidated,
+        if ``timeout`` is ``0``).
+        """
+        raise NotImplementedError
+
+    def invalidate(self, tags: Iterable[str]) -> None:
+        """
+        Deletes the entries stored with any of ``tags``.
+        """
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """
+        Deletes all the entries.
+        """
+        raise NotImplementedError
+
+
+class LRUViewCache(ViewCache):
+    """
+    An in-process view cache, evicting the least recently used entries once it
+    holds ``maxsize`` of them.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._keys_by_tag: Dict[str, Set[str]] = {}
+        self._lock = threading.RLock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value, _ = entry
+            if expires_at and expires_at <= time.time():
+                self._delete(key)
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, timeout=0, tags=()):
+        expires_at = time.time() + timeout if timeout else 0
+        tags = frozenset(tags)
+        with self._lock:
+            self._delete(key)
+            self._entries[key] = (expires_at, value, tags)
+            for tag in tags:
+                self._keys_by_tag.setdefault(tag, set()).add(key)
+            while len(self._entries) > self.maxsize:
+                self._delete(next(iter(self._entries)))
+
+    def invalidate(self, tags):
+        with self._lock:
+            for tag in tags:
+                for key in self._keys_by_tag.pop(tag, ()):
+                    self._delete(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_tag.clear()
+
+    def _delete(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+
+        for tag in entry[2]:
+            keys = self._keys_by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_tag[tag]
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class FileSystemViewCache(ViewCache):
+    """
+    A view cache storing entries as files in ``cache_dir`` (so that they're shared
+    between the processes of an app server on the same host). The keys of each
+    tag are recorded as empty files in a folder per tag.
+
+    Entries get unpickled, so ``cache_dir`` gets created only accessible by its
+    owner, and a :class:`ValueError` is raised if other users can write to it.
+    """
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+
+        st = os.stat(cache_dir)
+        if st.st_mode & stat.S_IWOTH or (
+            hasattr(os, "getuid") and st.st_uid != os.getuid()
+        ):
+            raise ValueError(
+                f"Refusing to use {cache_dir!r} as view cache dir: it must be owned "
+                f"by the current user, and not writable by other users"
+            )
+
+    def get(self, key):
+        path = self._get_path(key)
+        try:
+            with open(path, "rb") as f:
+                expires_at, value = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return None
+
+        if expires_at and expires_at <= time.time():
+            self._remove(path)
+            return None
+        return value
+
+    def set(self, key, value, timeout=0, tags=()):
+        expires_at = time.time() + timeout if timeout else 0
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump((expires_at, value), f, pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._get_path(key))
+        except OSError:
+            self._remove(tmp_path)
+            return
+
+        for tag in tags:
+            tag_dir = self._get_tag_dir(tag)
+            os.makedirs(tag_dir, exist_ok=True)
+            open(os.path.join(tag_dir, key), "wb").close()
+
+    def invalidate(self, tags):
+        for tag in tags:
+            tag_dir = self._get_tag_dir(tag)
+            try:
+                keys = os.listdir(tag_dir)
+            except OSError:
+                continue
+
+            for key in keys:
+                self._remove(self._get_path(key))
+                self._remove(os.path.join(tag_dir, key))
+
+    def clear(self):
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+        os.makedirs(self.cache_dir, mode=0o700, exist_ok=True)
+
+    def _get_path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.cache")
+
+    def _get_tag_dir(self, tag):
+        return os.path.join(self.cache_dir, "tags", _hash(tag))
+
+    def _remove(self, path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+class RedisViewCache(ViewCache):
+    """
+    A view cache storing entries in Redis (so that they're shared between hosts).
+    The keys of each tag are recorded in a Redis set.
+    """
+
+    def __init__(self, redis, key_prefix: str = "view_cache:"):
+        self.redis = redis
+        self.key_prefix = key_prefix
+
+    def get(self, key):
+        value = self.redis.get(self.key_prefix + key)
+        if value is None:
+            return None
+        return pickle.loads(value)
+
+    def set(self, key, value, timeout=0, tags=()):
+        key = self.key_prefix + key
+        self.redis.set(
+            key, pickle.dumps(value, pickle.HIGHEST_PROTOCOL), ex=timeout or None
+        )
+        for tag in tags:
+            self.redis.sadd(self._get_tag_key(tag), key)
+
+    def invalidate(self, tags):
+        for tag in tags:
+            tag_key = self._get_tag_key(tag)
+            self.redis.delete(*self.redis.smembers(tag_key), tag_key)
+
+    def clear(self):
+        keys = list(self.redis.scan_iter(match=f"{self.key_prefix}*"))
+        if keys:
+            self.redis.delete(*keys)
+
+    def _get_tag_key(self, tag):
+        return f"{self.key_prefix}tag:{tag}"
+
+
+def create_view_cache(app: FlaskUnchained) -> ViewCache:
+    """
+    Returns a new view cache for ``app``, as configured by its ``VIEW_CACHE_*``
+    config options.
+    """
+    cache_type = app.config.VIEW_CACHE_TYPE
+    if isinstance(cache_type, ViewCache):
+        return cache_type
+    elif cache_type == "lru":
+        return LRUViewCache(app.config.VIEW_CACHE_MAXSIZE)
+    elif cache_type == "filesystem":
+        cache_dir = app.config.VIEW_CACHE_DIR or os.path.join(
+            app.instance_path, "view_cache"
+        )
+        return FileSystemViewCache(cache_dir)
+    elif cache_type == "redis":
+        redis = app.config.VIEW_CACHE_REDIS
+        if redis is None:
+            from redis import Redis
+
+            redis = Redis()
+        return RedisViewCache(redis, app.config.VIEW_CACHE_KEY_PREFIX)
+    raise ValueError(
+        f"Invalid VIEW_CACHE_TYPE {cache_type!r} (must be 'lru', 'filesystem', "
+        f"'redis', or a ViewCache instance)"
+    )
+
+
+def get_view_cache(app: Optional[FlaskUnchained] = None) -> ViewCache:
+    """
+    Returns the view cache of ``app`` (or of the current app), creating it on
+    first use.
+    """
+    app = app or current_app._get_current_object()
+    view_cache = app.extensions.get("view_cache")
+    if view_cache is None:
+        view_cache = app.extensions["view_cache"] = create_view_cache(app)
+    return view_cache
+
+
+def cached_view(
+    *decorator_args,
+    timeout: Optional[int] = None,
+    tags: Iterable[str] = (),
+    vary_on_user: bool = False,
+    vary_on_roles: bool = False,
+):
+    """
+    Decorator to cache the responses of a view to GET (and HEAD) requests in the
+    app's view cache (see the ``VIEW_CACHE_TYPE`` config option). Only complete
+    responses with a 200 status code and without cookies get cached, and unless
+    ``vary_on_user`` or ``vary_on_roles`` is set, neither do responses that vary
+    on the ``Cookie`` or ``Authorization`` request headers. For example::
+
+        @route('/articles/<int:id>')
+        @auth_required
+        @cached_view(timeout=60, tags=['Article'])
+        def article(id):
+            # ...
+
+    Cache hits skip the decorated view, so apply decorators checking access
+    *above* ``cached_view``.
+
+    Responses get cached by endpoint, view args, query string (with the params
+    sorted) and ``Accept`` header. Cached responses get an ``ETag`` (unless the
+    view set one) and are answered conditionally, so that clients sending a
+    matching ``If-None-Match`` header get HTTP 304.
+
+    Cached responses get invalidated when instances of the models named by
+    ``tags`` (or of their subclasses) get committed to the database (using the
+    SQLAlchemy Bundle's session), or manually by calling
+    ``get_view_cache().invalidate(tags)``.
+
+    To cache views of :class:`~flask_unchained.Controller` and
+    :class:`~flask_unchained.bundles.api.ModelResource` classes, use their
+    ``cache`` meta option instead.
+
+    :param timeout: The number of seconds to cache responses for (``0`` means
+                    until invalidated). Defaults to the
+                    ``VIEW_CACHE_DEFAULT_TIMEOUT`` config option.
+    :param tags: The names of the models the responses depend on.
+    :param vary_on_user: Whether or not to cache responses per user.
+    :param vary_on_roles: Whether or not to cache responses per set of user roles.
+    """
+    tags = tuple(tags)
+
+    def wrapped(fn):
+        @wraps(fn)
+        def decorated(*args, **kwargs):
+            if request.method not in {"GET", "HEAD"}:
+                return fn(*args, **kwargs)
+
+            key = _get_cache_key(vary_on_user, vary_on_roles)
+            response = _load_response(key)
+            if response is not None:
+                return response
+
+            return _store_response(
+                key,
+                current_app.make_response(fn(*args, **kwargs)),
+                timeout=timeout,
+                tags=tags,
+                varies_on_user=vary_on_user or vary_on_roles,
+            )
+
+        return decorated
+
+    if decorator_args and callable(decorator_args[0]):
+        return wrapped(decorator_args[0])
+    return wrapped
+
+
+def register_invalidation_listeners() -> None:
+    """
+    Register the SQLAlchemy session event listeners that invalidate the view cache
+    tags of the models committed to the database (if the SQLAlchemy Bundle is
+    installed).
+    """
+    if event is None:
+        return
+
+    # imported here to avoid importing the SQLAlchemy Bundle with this bundle
+    from flask_unchained.bundles.sqlalchemy import db
+
+    for name, fn in [
+        ("after_flush", _collect_tags),
+        ("after_commit", _invalidate_tags),
+        ("after_rollback", _discard_tags),
+    ]:
+        if not event.contains(db.session, name, fn):
+            event.listen(db.session, name, fn)
+
+
+def _get_cache_key(vary_on_user: bool, vary_on_roles: bool) -> str:
+    user_id = roles = None
+    if (vary_on_user or vary_on_roles) and current_user is not None:
+        if current_user.is_authenticated:
+            if vary_on_user:
+                user_id = current_user.get_id()
+            if vary_on_roles:
+                roles = sorted(role.name for role in getattr(current_user, "roles", ()))
+
+    return _hash(
+        repr((
+            request.endpoint,
+            sorted(request.view_args.items()) if request.view_args else None,
+            sorted(request.args.items(multi=True)),
+            request.headers.get("Accept"),
+            user_id,
+            roles,
+        ))
+    )
+
+
+def _load_response(key: str):
+    """
+    Returns the cached response for ``key`` (answered conditionally), or ``None``.
+    """
+    cached = get_view_cache().get(key)
+    if cached is None:
+        return None
+
+    status, headers, data = cached
+    response = current_app.response_class(data, status, headers)
+    return response.make_conditional(request)
+
+
+def _store_response(
+    key: str,
+    response,
+    timeout: Optional[int] = None,
+    tags: Iterable[str] = (),
+    varies_on_user: bool = False,
+):
+    """
+    Caches ``response`` for ``key`` if it's cacheable, returning it (answered
+    conditionally, if it got cached).
+    """
+    if not _is_cacheable(response, varies_on_user):
+        return response
+
+    if "ETag" not in response.headers:
+        response.add_etag()
+    if timeout is None:
+        timeout = current_app.config.VIEW_CACHE_DEFAULT_TIMEOUT
+    get_view_cache().set(
+        key,
+        (response.status_code, list(response.headers), response.get_data()),
+        timeout=timeout,
+        tags=tags,
+    )
+    return response.make_conditional(request)
+
+
+def _is_cacheable(response, varies_on_user: bool = False) -> bool:
+    if response.status_code != 200 or response.is_streamed:
+        return False
+    elif "Set-Cookie" in response.headers:
+        return False
+    elif not varies_on_user and (
+        "Cookie" in response.vary or "Authorization" in response.vary
+    ):
+        # the response depends on who made the request
+        return False
+    return not (response.cache_control.no_store or response.cache_control.private)
+
+
+def _hash(value: str) -> str:
+    return hashlib.sha1(value.encode()).hexdigest()
+
+
+def _collect_tags(session, flush_context):
+    tags = session.info.setdefault(_TAGS_SESSION_INFO_KEY, set())
+    for instance in chain(session.new, session.dirty, session.deleted):
+        mapper = sa_inspect(instance).mapper
+        tags.update(m.class_.__name__ for m in mapper.iterate_to_root())
+
+
+def _invalidate_tags(session):
+    tags = session.info.pop(_TAGS_SESSION_INFO_KEY, None)
+    if not tags or not has_app_context():
+        return
+
+    view_cache = current_app.extensions.get("view_cache")
+    if view_cache is not None:
+        view_cache.invalidate(tags)
+
+
+def _discard_tags(session):
+    session.info.pop(_TAGS_SESSION_INFO_KEY, None)
+
+
+__all__ = [
+    "FileSystemViewCache",
+    "LRUViewCache",
+    "RedisViewCache",
+    "ViewCache",
+    "cached_view",
+    "create_view_cache",
+    "get_view_cache",
+]
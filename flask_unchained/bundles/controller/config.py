@@ -29,3 +29,47 @@ class Config(BundleConfig):
     """
     The cookie name to set on responses for the CSRF token. Defaults to "csrf_token".
     """
+
+    VIEW_CACHE_TYPE = "lru"
+    """
+    Which store to use for caching the responses of views (see
+    :func:`~flask_unchained.bundles.controller.caching.cached_view` and the
+    ``cache`` meta option of controllers). Built-in types:
+
+    - ``'lru'``: :class:`~flask_unchained.bundles.controller.caching.LRUViewCache` (default)
+    - ``'filesystem'``: :class:`~flask_unchained.bundles.controller.caching.FileSystemViewCache`
+    - ``'redis'``: :class:`~flask_unchained.bundles.controller.caching.RedisViewCache`
+
+    Can also be set to an instance of a
+    :class:`~flask_unchained.bundles.controller.caching.ViewCache` subclass.
+    """
+
+    VIEW_CACHE_DEFAULT_TIMEOUT = 300
+    """
+    The default number of seconds to cache responses for (``0`` means forever,
+    or until the cache gets invalidated).
+    """
+
+    VIEW_CACHE_MAXSIZE = 1024
+    """
+    The maximum number of responses the ``'lru'`` view cache stores before it
+    starts evicting the least recently used ones.
+    """
+
+    VIEW_CACHE_DIR = None
+    """
+    The folder where the ``'filesystem'`` view cache stores responses. Defaults to
+    a folder named ``view_cache`` in the app's instance folder. It must not be
+    writable by other users (the cached responses get unpickled).
+    """
+
+    VIEW_CACHE_REDIS = None
+    """
+    A :class:`redis.Redis` instance for the ``'redis'`` view cache. By default,
+    connect to ``127.0.0.1:6379``.
+    """
+
+    VIEW_CACHE_KEY_PREFIX = "view_cache:"
+    """
+    A prefix for the keys of the ``'redis'`` view cache.
+    """
@@ -5,6 +5,7 @@ import os
 from http import HTTPStatus
 from types import FunctionType
 from typing import *
+from weakref import WeakKeyDictionary
 
 from flask_unchained._compat import QUART_ENABLED
 
@@ -14,6 +15,7 @@ if QUART_ENABLED:
     from quart import current_app as app
     from quart import (
         flash,
+        g,
         jsonify,
         make_response,
         render_template,
@@ -25,6 +27,7 @@ else:
         after_this_request,
         current_app as app,
         flash,
+        g,
         jsonify,
         make_response,
         render_template,
@@ -33,6 +36,7 @@ else:
     )
 
 from flask_unchained.di import _set_up_class_dependency_injection
+from flask_unchained.exceptions import ServiceUsageError
 from py_meta_utils import AbstractMetaOption as _ControllerAbstractMetaOption
 from py_meta_utils import (
     McsArgs,
@@ -51,6 +55,7 @@ from .attr_constants import (
     NOT_VIEWS_ATTR,
     REMOVE_SUFFIXES_ATTR,
 )
+from .caching import _get_cache_key, _load_response, _store_response
 from .route import Route
 from .utils import controller_name, redirect
 
@@ -95,6 +100,7 @@ class ControllerMetaclass(type):
 
     def __new__(mcs, name, bases, clsdict):
         clsdict["_view_funcs"] = {}
+        clsdict["_template_paths"] = {}
         mcs_args = McsArgs(mcs, name, bases, clsdict)
         _set_up_class_dependency_injection(mcs_args)
         if mcs_args.is_abstract:
@@ -151,6 +157,61 @@ class ControllerDecoratorsMetaOption(MetaOption):
             raise ValueError(f"The {self.name} meta option must be a list of callables.")
 
 
+class ControllerCacheMetaOption(MetaOption):
+    """
+    Whether or not to cache the responses of this controller's views to GET
+    requests (see :func:`~flask_unchained.bundles.controller.caching.cached_view`).
+    Set to ``True`` to use the defaults, to a number of seconds to cache
+    responses for, or to a dictionary of keyword arguments for ``cached_view``::
+
+        class Meta:
+            cache = dict(timeout=60, tags=['Article'], vary_on_user=True)
+
+    Cached responses get looked up after the decorators listed in the
+    ``decorators`` meta option ran (so they should check access), but decorators
+    applied directly to view methods only run on cache misses.
+
+    Defaults to None (no caching).
+    """
+
+    def __init__(self):
+        super().__init__("cache", default=None, inherit=True)
+
+    def get_value(self, meta, base_classes_meta, mcs_args: McsArgs):
+        value = super().get_value(meta, base_classes_meta, mcs_args)
+        if value is True:
+            return {}
+        elif value is False:
+            return None
+        elif isinstance(value, int):
+            return dict(timeout=value)
+        return value
+
+    def check_value(self, value, mcs_args: McsArgs):
+        if value is not None and not isinstance(value, dict):
+            raise ValueError(
+                f"The {self.name} meta option must be a boolean, a number of "
+                f"seconds, or a dictionary of keyword arguments for cached_view"
+            )
+
+
+class ControllerStatelessMetaOption(MetaOption):
+    """
+    Whether or not this controller keeps no per-request state on ``self``. When
+    True, each view reuses one controller instance (per app) instead of creating
+    a new one for every request, and its decorators get applied only once.
+    Stateless controllers can only get singleton services injected. Defaults to
+    False.
+    """
+
+    def __init__(self):
+        super().__init__("stateless", default=False, inherit=True)
+
+    def check_value(self, value, mcs_args: McsArgs):
+        if not isinstance(value, bool):
+            raise ValueError(f"The {self.name} meta option must be a boolean")
+
+
 class ControllerTemplateFolderNameMetaOption(MetaOption):
     """
     The name of the folder containing the templates for this controller's views. Defaults
@@ -241,6 +302,8 @@ class ControllerMetaOptionsFactory(MetaOptionsFactory):
     _options = [
         _ControllerAbstractMetaOption,
         ControllerDecoratorsMetaOption,
+        ControllerCacheMetaOption,
+        ControllerStatelessMetaOption,
         ControllerTemplateFolderNameMetaOption,
         ControllerTemplateFileExtensionMetaOption,
         ControllerUrlPrefixMetaOption,
@@ -264,6 +327,8 @@ class Controller(metaclass=ControllerMetaclass):
                 abstract = False  # this is the default; no need to set explicitly
                 decorators = ()  # a list of decorators to apply to all view methods
                                  # on the controller (defaults to an empty tuple)
+                stateless = False  # set to True to reuse one controller instance
+                                   # for all requests (defaults to False)
                 template_folder = 'site'  # defaults to the snake_cased class name,
                                           # minus any Controller/View suffix
                 template_file_extension = app.config.TEMPLATE_FILE_EXTENSION = '.html'
@@ -329,6 +394,7 @@ class Controller(metaclass=ControllerMetaclass):
 
     # the metaclass ensures a unique _view_funcs dict for each subclass of controller
     _view_funcs: Dict[str, FunctionType] = {}  # keyed by method names on controllers
+    _template_paths: Dict[Tuple[str, str], str] = {}  # keyed by (name, extension)
 
     class Meta:
         abstract = True
@@ -352,14 +418,19 @@ class Controller(metaclass=ControllerMetaclass):
                               (The file extension can be omitted.)
         :param ctx: Context variables to pass into the template.
         """
-        if "." not in template_name:
-            template_file_extension = (
-                self.Meta.template_file_extension or app.config.TEMPLATE_FILE_EXTENSION
-            )
-            template_name = f"{template_name}{template_file_extension}"
-        if self.Meta.template_folder and os.sep not in template_name:
-            template_name = os.path.join(self.Meta.template_folder, template_name)
-        return render_template(template_name, **ctx)
+        template_file_extension = (
+            self.Meta.template_file_extension or app.config.TEMPLATE_FILE_EXTENSION
+        )
+        key = (template_name, template_file_extension)
+        template_path = self._template_paths.get(key)
+        if template_path is None:
+            template_path = template_name
+            if "." not in template_path:
+                template_path = f"{template_path}{template_file_extension}"
+            if self.Meta.template_folder and os.sep not in template_path:
+                template_path = os.path.join(self.Meta.template_folder, template_path)
+            self._template_paths[key] = template_path
+        return render_template(template_path, **ctx)
 
     def render_template_string(self, source, **ctx):
         return render_template_string(source, **ctx)
@@ -459,37 +530,151 @@ class Controller(metaclass=ControllerMetaclass):
         # - we also apply decorators listed in Meta.decorators in reverse,
         #   so that they get applied in the logical top-to-bottom order as
         #   declared in controllers
+        # - stateless controllers reuse one instance per app (like Flask's
+        #   View.init_every_request = False), created on the first request
+        # - when the controller's cache meta option is set, cached responses get
+        #   looked up after the decorators listed in Meta.decorators ran (see
+        #   get_decorators), and stored once dispatch_request made the response
         if method_name not in cls._view_funcs:
             if QUART_ENABLED:
 
                 async def view_func(*args, **kwargs):
-                    self = view_func.view_class(*class_args, **class_kwargs)
-                    return await self.dispatch_request(method_name, *args, **kwargs)
+                    self = view_func.view_class._get_instance(view_func)
+                    rv = await self.dispatch_request(method_name, *args, **kwargs)
+                    return self._cache_response(rv)
 
             else:
 
                 def view_func(*args, **kwargs):
-                    self = view_func.view_class(*class_args, **class_kwargs)
-                    return self.dispatch_request(method_name, *args, **kwargs)
+                    self = view_func.view_class._get_instance(view_func)
+                    rv = self.dispatch_request(method_name, *args, **kwargs)
+                    return self._cache_response(rv)
 
             wrapper_assignments = set(functools.WRAPPER_ASSIGNMENTS) - {"__qualname__"}
             functools.update_wrapper(
                 view_func, getattr(cls, method_name), assigned=list(wrapper_assignments)
             )
             view_func.view_class = cls
+            view_func.class_args = class_args
+            view_func.class_kwargs = class_kwargs
+            view_func.instances = WeakKeyDictionary()
             cls._view_funcs[method_name] = view_func
 
         return cls._view_funcs[method_name]
 
+    @classmethod
+    def _get_cache_options(cls) -> Dict[str, Any]:
+        """
+        Returns the keyword arguments for ``cached_view`` from the ``cache`` meta
+        option.
+        """
+        return dict(cls.Meta.cache)
+
+    def _get_cached_response(self, fn):
+        """
+        Decorator returning the cached response to GET requests, if any. Otherwise
+        the key to cache the response for gets recorded for :meth:`_cache_response`.
+        """
+
+        @functools.wraps(fn)
+        def decorated(*args, **kwargs):
+            if request.method not in {"GET", "HEAD"}:
+                return fn(*args, **kwargs)
+
+            options = self._get_cache_options()
+            key = _get_cache_key(
+                options.get("vary_on_user", False), options.get("vary_on_roles", False)
+            )
+            response = _load_response(key)
+            if response is not None:
+                return response
+
+            g._view_cache_key = key
+            return fn(*args, **kwargs)
+
+        return decorated
+
+    def _cache_response(self, rv):
+        """
+        Caches the response of a view whose cached response was missing.
+        """
+        key = self.Meta.cache is not None and g.pop("_view_cache_key", None)
+        if not key:
+            return rv
+
+        options = self._get_cache_options()
+        return _store_response(
+            key,
+            app.make_response(rv),
+            timeout=options.get("timeout"),
+            tags=options.get("tags", ()),
+            varies_on_user=bool(
+                options.get("vary_on_user") or options.get("vary_on_roles")
+            ),
+        )
+
+    @classmethod
+    def _get_instance(cls, view_func):
+        """
+        Returns the controller instance to handle a request to ``view_func`` with:
+        a new one for every request, unless the controller is stateless.
+        """
+        if not cls.Meta.stateless:
+            return cls(*view_func.class_args, **view_func.class_kwargs)
+
+        flask_app = app._get_current_object()
+        self = view_func.instances.get(flask_app)
+        if self is None:
+            cls._check_stateless_dependencies()
+            self = cls(*view_func.class_args, **view_func.class_kwargs)
+            view_func.instances[flask_app] = self
+        return self
+
+    @classmethod
+    def _check_stateless_dependencies(cls):
+        """
+        Makes sure stateless controllers only get singleton services injected
+        (otherwise they would keep using the instances of the first request).
+        """
+        from flask_unchained.unchained import _get_service_param_names, unchained
+
+        for name in _get_service_param_names(cls):
+            scope = unchained.services.get_scope(name)
+            if scope != "singleton":
+                raise ServiceUsageError(
+                    f"The stateless {cls.__name__} cannot get the {scope}-scoped "
+                    f"{name} service injected (set stateless to False, or get it "
+                    f"from unchained.services in its views)."
+                )
+
     def dispatch_request(self, method_name, *view_args, **view_kwargs):
-        decorators = self.get_decorators(method_name)
+        view_func = self._get_decorated_view_func(method_name)
+        return view_func(*view_args, **view_kwargs)
+
+    def _get_decorated_view_func(self, method_name):
+        """
+        Returns the view method with its decorators applied (only once for
+        stateless controllers).
+        """
+        if self.Meta.stateless:
+            decorated_view_funcs = self.__dict__.setdefault("_decorated_view_funcs", {})
+            if method_name in decorated_view_funcs:
+                return decorated_view_funcs[method_name]
+
         view_func = self.apply_decorators(
-            view_func=getattr(self, method_name), decorators=decorators
+            view_func=getattr(self, method_name),
+            decorators=self.get_decorators(method_name),
         )
-        return view_func(*view_args, **view_kwargs)
+        if self.Meta.stateless:
+            decorated_view_funcs[method_name] = view_func
+        return view_func
 
     def get_decorators(self, method_name):
-        return self.Meta.decorators or ()
+        decorators = self.Meta.decorators or ()
+        if self.Meta.cache is not None:
+            # after the other decorators, so that they also run for cache hits
+            decorators = (*decorators, self._get_cached_response)
+        return decorators
 
     def apply_decorators(self, view_func, decorators):
         if not decorators:
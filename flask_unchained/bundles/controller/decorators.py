@@ -1,14 +1,18 @@
 from enum import Enum
 from functools import wraps
 from http import HTTPStatus
+from typing import *
 
-from flask import abort, request
+from flask import abort, has_request_context, request
+from flask.globals import request_ctx
 
 from flask_unchained.string_utils import snake_case
 from py_meta_utils import _missing
 
 
 try:
+    from sqlalchemy import inspect as sa_inspect
+
     from sqlalchemy_unchained import BaseModel as Model
 except ImportError:
     Model = None
@@ -17,6 +21,9 @@ from .attr_constants import FN_ROUTES_ATTR, NO_ROUTES_ATTR
 from .route import Route
 
 
+_PARAM_CONVERTER_INSTANCES_ATTR = "_param_converter_instances"
+
+
 def route(
     rule=None,
     blueprint=None,
@@ -173,13 +180,36 @@ def param_converter(*decorator_args, **decorator_kwargs):
                          post_id={'post_arg_name': Post})
         def show_post(user_arg_name, post_arg_name):
             # do stuff
+
+    Models already loaded during the current request (eg by other param
+    converters) are reused, as are instances in the SQLAlchemy session when
+    looking them up by primary key. Url params referring to the same model column
+    get loaded with a single ``IN`` query.
+
+    To eager load relationships the view will use, pass SQLAlchemy loader options
+    with the ``options`` keyword argument (either a list, or a dictionary keyed by
+    model class)::
+
+        @route('/users/<int:user_id>/posts/<int:id>')
+        @param_converter(user_id=User, id=Post,
+                         options={Post: [joinedload(Post.tags)]})
+        def show_post(user, post):
+            # do stuff
+
+    The ``options`` can also be a function returning them, which gets called for
+    every request.
     """
+    options = decorator_kwargs.pop("options", None)
 
     def wrapped(fn):
         @wraps(fn)
         def decorated(*view_args, **view_kwargs):
             if Model is not None:
-                view_kwargs = _convert_models(view_kwargs, decorator_kwargs)
+                view_kwargs = _convert_models(
+                    view_kwargs,
+                    decorator_kwargs,
+                    options() if callable(options) else options,
+                )
             view_kwargs = _convert_query_params(view_kwargs, decorator_kwargs)
             return fn(*view_args, **view_kwargs)
 
@@ -193,7 +223,9 @@ def param_converter(*decorator_args, **decorator_kwargs):
 def _convert_models(
     view_kwargs: dict,
     url_param_names_to_models: dict,
+    options: Optional[Union[list, tuple, dict]] = None,
 ) -> dict:
+    lookups = []
     for url_param_name, model_mapping in url_param_names_to_models.items():
         if url_param_name not in view_kwargs and url_param_name not in request.args:
             continue
@@ -210,22 +242,88 @@ def _convert_models(
             arg_name = snake_case(model.__name__)
 
         filter_by = url_param_name.replace(snake_case(model.__name__) + "_", "")
-        instance = model.query.filter_by(
-            **{
-                filter_by: view_kwargs.pop(
-                    url_param_name, request.args.get(url_param_name)
-                ),
-            }
-        ).first()
+        value = view_kwargs.pop(url_param_name, request.args.get(url_param_name))
+        lookups.append((arg_name, (model, filter_by, value)))
 
+    instances = _load_models([key for _, key in lookups], options)
+    for arg_name, key in lookups:
+        instance = instances.get(key)
         if not instance:
             abort(HTTPStatus.NOT_FOUND)
-
         view_kwargs[arg_name] = instance
 
     return view_kwargs
 
 
+def _load_models(
+    keys: List[Tuple[type, str, Any]],
+    options: Optional[Union[list, tuple, dict]] = None,
+) -> Dict[Tuple[type, str, Any], Any]:
+    """
+    Load the instances for the given (model, column name, value) keys, going
+    through the identity map of the current request.
+    """
+    if has_request_context():
+        ctx = request_ctx._get_current_object()
+        if not hasattr(ctx, _PARAM_CONVERTER_INSTANCES_ATTR):
+            setattr(ctx, _PARAM_CONVERTER_INSTANCES_ATTR, {})
+        instances = getattr(ctx, _PARAM_CONVERTER_INSTANCES_ATTR)
+    else:
+        instances = {}
+
+    values_by_column = {}
+    for key in keys:
+        if key in instances:
+            continue
+
+        model, filter_by, value = key
+        instance = _get_from_session(model, filter_by, value)
+        if instance is not None:
+            instances[key] = instance
+        else:
+            values_by_column.setdefault((model, filter_by), {})[value] = key
+
+    for (model, filter_by), values in values_by_column.items():
+        query = model.query
+        model_options = options
+        if isinstance(options, dict):
+            model_options = options.get(model)
+        if model_options:
+            query = query.options(*model_options)
+
+        if len(values) == 1:
+            [(value, key)] = values.items()
+            instance = query.filter_by(**{filter_by: value}).first()
+            if instance is not None:
+                instances[key] = instance
+            continue
+
+        # values from the query string are strings, so match them as such
+        keys_by_value = {str(value): key for value, key in values.items()}
+        for instance in query.filter(getattr(model, filter_by).in_(values)).all():
+            key = keys_by_value.get(str(getattr(instance, filter_by)))
+            if key is not None and key not in instances:
+                instances[key] = instance
+
+    return instances
+
+
+def _get_from_session(model, filter_by: str, value: Any):
+    """
+    Returns the instance of ``model`` with the primary key ``value`` if it's in
+    the session's identity map (without querying the database).
+    """
+    mapper = sa_inspect(model)
+    if len(mapper.primary_key) != 1:
+        return None
+
+    if mapper.get_property_by_column(mapper.primary_key[0]).key != filter_by:
+        return None
+
+    identity_key = mapper.identity_key_from_primary_key([value])
+    return model.query.session.identity_map.get(identity_key)
+
+
 def _convert_query_params(
     view_kwargs: dict,
     param_name_to_converters: dict,
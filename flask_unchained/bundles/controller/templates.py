@@ -4,14 +4,17 @@ templates with the same name/path as templates from later template folders (ie
 from superclass bundles in the hierarchy)
 """
 
+import os
 import re
 
+from collections import namedtuple
 from typing import *
 
 from flask import request
 from flask.globals import request_ctx
 from flask.templating import DispatchingJinjaLoader, Environment
-from jinja2 import TemplateNotFound
+from jinja2 import BaseLoader, TemplateNotFound
+from jinja2.loaders import split_template_path
 
 from flask_unchained import unchained
 
@@ -35,7 +38,43 @@ class UnchainedJinjaEnvironment(Environment):
         return template
 
 
+TemplateCacheInfo = namedtuple("TemplateCacheInfo", ("hits", "misses", "size"))
+
+
 class UnchainedJinjaLoader(DispatchingJinjaLoader):
+    """
+    Resolves templates by their name and override depth (eg ``site/base.html``
+    and ``site/base.html__1__`` for the template it extends) to the first,
+    second, etc. app or blueprint loader that has a template with that name.
+
+    Resolved templates are indexed, so loading them again takes a single lookup
+    instead of trying every loader. When templates get auto-reloaded (ie in
+    development), the index entries are also checked against the modification
+    times of the folders the template could be found in.
+    """
+
+    def __init__(self, app):
+        super().__init__(app)
+        self._index: Dict[str, Tuple[BaseLoader, Optional[Tuple[int, ...]]]] = {}
+        self._index_version = None
+        self._hits = 0
+        self._misses = 0
+
+    def cache_info(self) -> TemplateCacheInfo:
+        """
+        Returns the number of template lookups resolved from the index (hits),
+        the number of lookups that had to try the loaders (misses), and the
+        number of indexed templates.
+        """
+        return TemplateCacheInfo(self._hits, self._misses, len(self._index))
+
+    def cache_clear(self) -> None:
+        """
+        Clear the index and reset its statistics.
+        """
+        self._index.clear()
+        self._hits = self._misses = 0
+
     def _get_source_explained(self, environment, template):
         attempts = []
         trv = None
@@ -63,9 +102,29 @@ class UnchainedJinjaLoader(DispatchingJinjaLoader):
         raise TemplateNotFound(template)
 
     def _get_source_fast(self, environment, template):
-        num_priors = 0
+        # registering blueprints adds loaders
+        if self._index_version != len(self.app.blueprints):
+            self._index.clear()
+            self._index_version = len(self.app.blueprints)
+
+        original_template = template
         template, expected_priors = parse_template(template)
 
+        entry = self._index.get(original_template)
+        if entry is not None:
+            loader, mtimes = entry
+            if mtimes is None or mtimes == self._get_folder_mtimes(template):
+                try:
+                    rv = loader.get_source(environment, template)
+                except TemplateNotFound:
+                    pass
+                else:
+                    self._hits += 1
+                    return rv
+            self._index.pop(original_template, None)
+
+        self._misses += 1
+        num_priors = 0
         for srcobj, loader in self._iter_loaders(template):
             try:
                 rv = loader.get_source(environment, template)
@@ -73,11 +132,31 @@ class UnchainedJinjaLoader(DispatchingJinjaLoader):
                 continue
 
             if expected_priors == num_priors:
+                mtimes = None
+                if environment.auto_reload:
+                    mtimes = self._get_folder_mtimes(template)
+                self._index[original_template] = (loader, mtimes)
                 return rv
             num_priors += 1
 
         raise TemplateNotFound(template)
 
+    def _get_folder_mtimes(self, template: str) -> Tuple[int, ...]:
+        """
+        Returns the modification times of the folders of all the (filesystem)
+        loaders the template could be found in (or -1 for missing folders), which
+        change when templates get added to or removed from them.
+        """
+        folder = split_template_path(template)[:-1]
+        mtimes = []
+        for _, loader in self._iter_loaders(template):
+            for search_path in getattr(loader, "searchpath", ()):
+                try:
+                    mtimes.append(os.stat(os.path.join(search_path, *folder)).st_mtime_ns)
+                except OSError:
+                    mtimes.append(-1)
+        return tuple(mtimes)
+
 
 def pretty_num(num):
     if num % 10 == 1 and num != 11:
@@ -172,6 +251,7 @@ def is_active(endpoint_or_kwargs: Union[str, dict]):
 
 
 __all__ = [
+    "TemplateCacheInfo",
     "UnchainedJinjaEnvironment",
     "UnchainedJinjaLoader",
 ]
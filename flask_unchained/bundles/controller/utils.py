@@ -1,13 +1,15 @@
+import functools
 import re
 
 from typing import *
 from urllib.parse import quote as urlquote
 from urllib.parse import unquote, unquote_plus, urlsplit
 
-from flask import Response, current_app
+from flask import Response, current_app, has_request_context
 from flask import redirect as flask_redirect
 from flask import request
 from flask import url_for as flask_url_for
+from flask.globals import request_ctx
 from werkzeug.routing import BuildError, UnicodeConverter
 
 from flask_unchained._compat import is_local_proxy
@@ -140,6 +142,22 @@ def url_for(
     if not what or "/" in what:
         return what
 
+    cache = _UrlForCache.get(current_app._get_current_object())
+
+    # links to endpoints of rules without variables (by far the most common case
+    # in templates) only need to get built once per script root and host
+    if (
+        not values
+        and _anchor is None
+        and not _external
+        and not _external_host
+        and _method is None
+        and _scheme is None
+    ):
+        url = cache.get_static_url(what, _cls)
+        if url is not None:
+            return url
+
     flask_url_for_kwargs = dict(
         _anchor=_anchor,
         _external=_external,
@@ -151,16 +169,12 @@ def url_for(
 
     # check if it's a class method name, and try that endpoint
     if _cls and "." not in what:
-        controller_routes = getattr(_cls, CONTROLLER_ROUTES_ATTR)
-        method_routes = controller_routes.get(what)
-        try:
-            return _url_for(method_routes[0].endpoint, **flask_url_for_kwargs)
-        except (
-            BuildError,  # url not found
-            IndexError,  # method_routes[0] is out-of-range (no routes on view)
-            TypeError,  # method_routes is None ("what" wasn't a view/method name)
-        ):
-            pass
+        endpoint = cache.get_method_endpoint(what, _cls)
+        if endpoint is not None:
+            try:
+                return _url_for(endpoint, **flask_url_for_kwargs)
+            except BuildError:
+                pass
 
     # what must be an endpoint
     return _url_for(what, **flask_url_for_kwargs)
@@ -298,11 +312,9 @@ def _url_for(endpoint: str, **values) -> Union[str, None]:
         return flask_url_for(endpoint, **values)
 
     values.pop("_external")  # do custom external host handling instead
-    scheme = values.pop("_scheme", "http")
-    if "://" not in external_host:
-        external_host = f"{scheme}://{external_host}"
-    elif not external_host.startswith(f"{scheme}://"):
-        external_host = f"{scheme}{external_host[external_host.find('://'):]}"
+    external_host = _get_external_host_prefix(
+        external_host, values.pop("_scheme", "http")
+    )
 
     url = flask_url_for(endpoint, **values)
     if "://" in url:
@@ -310,6 +322,119 @@ def _url_for(endpoint: str, **values) -> Union[str, None]:
     return f"{external_host}{url}"
 
 
+@functools.lru_cache(maxsize=64)
+def _get_external_host_prefix(external_host: str, scheme: str) -> str:
+    if "://" not in external_host:
+        return f"{scheme}://{external_host}"
+    elif not external_host.startswith(f"{scheme}://"):
+        return f"{scheme}{external_host[external_host.find('://'):]}"
+    return external_host
+
+
+class _UrlForCache:
+    """
+    Caches what :func:`url_for` resolves for an app: the endpoints of controller
+    methods, and the URLs of endpoints whose rules have no variables. Cleared
+    whenever endpoints or URL defaults functions get added to the app.
+
+    For internal use only.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self.version = None
+        self.method_endpoints: Dict[Tuple[str, type], Optional[str]] = {}
+        self.static_endpoints: Dict[str, bool] = {}
+        self.static_urls: Dict[Tuple[str, ...], str] = {}
+
+    @classmethod
+    def get(cls, app) -> "_UrlForCache":
+        cache = app.extensions.get("url_for_cache")
+        if cache is None:
+            cache = app.extensions["url_for_cache"] = cls(app)
+
+        version = (
+            len(app.url_map._rules_by_endpoint),
+            sum(len(fns) for fns in app.url_default_functions.values()),
+        )
+        if cache.version != version:
+            cache.version = version
+            cache.method_endpoints.clear()
+            cache.static_endpoints.clear()
+            cache.static_urls.clear()
+        return cache
+
+    def get_method_endpoint(self, method_name: str, cls) -> Optional[str]:
+        """
+        Returns the endpoint of the first route of the given controller method (or
+        None if it's not a view, or its endpoint isn't registered with the app).
+        """
+        key = (method_name, cls if isinstance(cls, type) else type(cls))
+        try:
+            return self.method_endpoints[key]
+        except KeyError:
+            pass
+
+        endpoint = None
+        method_routes = getattr(cls, CONTROLLER_ROUTES_ATTR).get(method_name)
+        if method_routes:
+            endpoint = method_routes[0].endpoint
+            if (
+                endpoint not in self.app.url_map._rules_by_endpoint
+                and not self.app.url_build_error_handlers
+            ):
+                endpoint = None
+        self.method_endpoints[key] = endpoint
+        return endpoint
+
+    def get_static_url(self, what: str, cls=None) -> Optional[str]:
+        """
+        Returns the URL of the endpoint (or controller method name) ``what`` if
+        its rule has no variables (or None if it does, or outside of requests).
+        """
+        if not has_request_context():
+            return None
+
+        endpoint = what
+        if cls and "." not in what:
+            endpoint = self.get_method_endpoint(what, cls) or what
+        if not self._is_static(endpoint):
+            return None
+
+        url_adapter = request_ctx.url_adapter
+        key = (
+            endpoint,
+            url_adapter.script_name,
+            url_adapter.subdomain,
+            url_adapter.server_name,
+            url_adapter.url_scheme,
+        )
+        url = self.static_urls.get(key)
+        if url is None:
+            url = self.static_urls[key] = flask_url_for(endpoint)
+        return url
+
+    def _is_static(self, endpoint: str) -> bool:
+        is_static = self.static_endpoints.get(endpoint)
+        if is_static is not None:
+            return is_static
+
+        # (without values, werkzeug always builds the first rule of an endpoint if
+        # it has no variables, so adding more rules doesn't change the url)
+        rules = self.app.url_map._rules_by_endpoint.get(endpoint)
+        is_static = bool(rules) and not rules[0].arguments and not rules[0].websocket
+        if is_static:
+            # url defaults functions could add values (same lookup as
+            # Flask.inject_url_defaults)
+            names = [None]
+            if "." in endpoint:
+                parts = endpoint.rpartition(".")[0].split(".")
+                names += [".".join(parts[: i + 1]) for i in range(len(parts))]
+            is_static = not any(self.app.url_default_functions.get(n) for n in names)
+        self.static_endpoints[endpoint] = is_static
+        return is_static
+
+
 # modified from flask_security.utils.validate_redirect_url
 def _validate_redirect_url(url, _external_host=None):
     url = (url or "").strip().replace("\\", "/")
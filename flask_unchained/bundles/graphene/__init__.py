@@ -8,7 +8,12 @@ from flask_unchained import Bundle, FlaskUnchained
 from flask_unchained.bundles.controller.extensions import csrf
 
 from .exceptions import MutationValidationError
-from .object_types import MutationsObjectType, QueriesObjectType, SQLAlchemyObjectType
+from .object_types import (
+    MutationsObjectType,
+    QueriesObjectType,
+    SQLAlchemyObjectType,
+    get_loader_options,
+)
 
 
 class GrapheneBundle(Bundle):
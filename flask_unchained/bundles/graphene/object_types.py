@@ -1,5 +1,7 @@
 import graphene
 
+from flask import current_app
+from graphene.utils.str_converters import to_snake_case
 from graphene.utils.subclass_with_meta import (
     SubclassWithMeta_Meta as BaseObjectTypeMetaclass,
 )
@@ -12,8 +14,10 @@ from graphene_sqlalchemy.converter import (
 from graphene_sqlalchemy.types import (
     SQLAlchemyObjectTypeOptions as BaseSQLAlchemyObjectTypeOptions,
 )
+from graphql.language.ast import Field, FragmentSpread, InlineFragment
+from sqlalchemy import inspect as sa_inspect
 from sqlalchemy import types
-from sqlalchemy.orm import class_mapper
+from sqlalchemy.orm import class_mapper, joinedload, selectinload
 
 from flask_unchained import unchained
 from flask_unchained.bundles.sqlalchemy.sqla.types import BigInteger
@@ -156,16 +160,77 @@ class SQLAlchemyObjectType(BaseSQLAlchemyObjectType):
         )
 
 
+def get_loader_options(model, info) -> list:
+    """
+    Returns the SQLAlchemy loader options to eager load the relationships of
+    ``model`` selected by the GraphQL query being resolved, so that resolving the
+    selected fields doesn't lazy load them one at a time. To-many relationships
+    use ``selectinload``, and to-one relationships use ``joinedload``.
+    """
+    options, plan = _get_loader_options(
+        model, info.field_asts[0].selection_set, info.fragments
+    )
+    current_app.logger.debug(
+        f"{info.field_name} eager loading plan: " + (", ".join(plan) or "(none)")
+    )
+    return options
+
+
+def _get_loader_options(model, selection_set, fragments, prefix=""):
+    relationships = sa_inspect(model).relationships
+    options, plan = [], []
+    for selection in _iter_field_nodes(selection_set, fragments):
+        attr = to_snake_case(selection.name.value)
+        if attr not in relationships:
+            continue
+
+        relationship = relationships[attr]
+        strategy = "selectin" if relationship.uselist else "joined"
+        loader_fn = selectinload if relationship.uselist else joinedload
+        loader = loader_fn(getattr(model, attr))
+        plan.append(f"{prefix}{attr} ({strategy})")
+
+        nested_options, nested_plan = _get_loader_options(
+            relationship.mapper.class_,
+            selection.selection_set,
+            fragments,
+            f"{prefix}{attr}.",
+        )
+        if nested_options:
+            loader = loader.options(*nested_options)
+        plan.extend(nested_plan)
+        options.append(loader)
+    return options, plan
+
+
+def _iter_field_nodes(selection_set, fragments):
+    if selection_set is None:
+        return
+
+    for selection in selection_set.selections:
+        if isinstance(selection, Field):
+            yield selection
+        elif isinstance(selection, InlineFragment):
+            yield from _iter_field_nodes(selection.selection_set, fragments)
+        elif isinstance(selection, FragmentSpread):
+            fragment = fragments.get(selection.name.value)
+            if fragment is not None:
+                yield from _iter_field_nodes(fragment.selection_set, fragments)
+
+
 def _get_field_resolver(field: graphene.Field):
     def _get(self, info, **kwargs):
-        return field.type._meta.model.query.filter_by(**kwargs).one_or_none()
+        model = field.type._meta.model
+        query = model.query.options(*get_loader_options(model, info))
+        return query.filter_by(**kwargs).one_or_none()
 
     return _get
 
 
 def _get_list_resolver(list_: graphene.List):
     def _get_list(self, info, **kwargs):
-        return list_.of_type._meta.model.query.all()
+        model = list_.of_type._meta.model
+        return model.query.options(*get_loader_options(model, info)).all()
 
     return _get_list
 
@@ -198,7 +263,8 @@ class QueriesObjectType(graphene.ObjectType, metaclass=QueriesObjectTypeMetaclas
 
         # your_bundle/graphql/schema.py
 
-        from flask_unchained.bundles.graphene import QueriesObjectType
+        from flask_unchained.bundles.graphene import (
+            QueriesObjectType, get_loader_options)
 
         from . import types
 
@@ -211,10 +277,14 @@ class QueriesObjectType(graphene.ObjectType, metaclass=QueriesObjectTypeMetaclas
 
             # this is what the default resolvers do, and how you would override them:
             def resolve_child(self, info, **kwargs):
-                return types.Child._meta.model.query.filter_by(**kwargs).one_or_none()
+                model = types.Child._meta.model
+                return (model.query.options(*get_loader_options(model, info))
+                                   .filter_by(**kwargs)
+                                   .one_or_none())
 
             def resolve_children(self, info, **kwargs):
-                return types.Child._meta.model.query.all()
+                model = types.Child._meta.model
+                return model.query.options(*get_loader_options(model, info)).all()
     """
 
     class Meta:
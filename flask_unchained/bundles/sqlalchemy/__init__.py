@@ -1,10 +1,11 @@
-from flask_unchained import Bundle
+from flask_unchained import Bundle, FlaskUnchained
 from sqlalchemy_unchained import ValidationError, ValidationErrors
 
 from .base_model import BaseModel
 from .extensions import Migrate, SQLAlchemyUnchained, db, migrate
 from .forms import ModelForm, QuerySelectField, QuerySelectMultipleField
 from .model_registry import UnchainedModelRegistry
+from .query_stats import QueryStats, init_request_stats, record_queries
 from .services import ModelManager, SessionManager
 
 
@@ -32,3 +33,11 @@ class SQLAlchemyBundle(Bundle):
         """
         A lookup of model classes keyed by class name.
         """
+
+    def after_init_app(self, app: FlaskUnchained) -> None:
+        """
+        Record the query stats of requests, if the ``SQLALCHEMY_QUERY_STATS`` config
+        option is enabled.
+        """
+        if app.config.SQLALCHEMY_QUERY_STATS:
+            init_request_stats(app)
@@ -51,6 +51,31 @@ class Config(BundleConfig):
     :func:`~flask_sqlalchemy.get_debug_queries` for more information.
     """
 
+    SQLALCHEMY_QUERY_STATS = False
+    """
+    Whether or not to record the number of queries, the total time spent in the
+    database and the slowest statements of each request, and to log them (see
+    :func:`~flask_unchained.bundles.sqlalchemy.query_stats.init_request_stats`).
+    """
+
+    SQLALCHEMY_QUERY_STATS_HEADERS = False
+    """
+    Whether or not to add the ``X-Query-Count`` and ``Server-Timing`` headers to
+    responses (requires ``SQLALCHEMY_QUERY_STATS``).
+    """
+
+    SQLALCHEMY_QUERY_STATS_SLOWEST = 5
+    """
+    How many of the slowest statements of each request to include in its query
+    stats.
+    """
+
+    SQLALCHEMY_SLOW_QUERY_THRESHOLD = None
+    """
+    The number of seconds after which queries get logged as slow warnings (requires
+    ``SQLALCHEMY_QUERY_STATS``). Disabled by default.
+    """
+
     SQLALCHEMY_BINDS = {}
     """
     A dictionary that maps bind keys to SQLAlchemy connection URIs.
@@ -123,6 +148,22 @@ class Config(BundleConfig):
     """
 
 
+class DevConfig(Config):
+    """
+    Default configuration options for development.
+    """
+
+    SQLALCHEMY_QUERY_STATS = True
+    """
+    Record and log the query stats of requests in development.
+    """
+
+    SQLALCHEMY_QUERY_STATS_HEADERS = True
+    """
+    Add the query stats headers to responses in development.
+    """
+
+
 class TestConfig(Config):
     """
     Default configuration options for testing.
@@ -1,5 +1,9 @@
+from contextlib import contextmanager
+
 import pytest
 
+from .query_stats import record_queries, register_query_listeners
+
 
 from .model_registry import UnchainedModelRegistry  # isort: skip (required import)
 
@@ -27,3 +31,29 @@ def db_session(db):
         transaction.rollback()
         connection.close()
         session.remove()
+
+
+@pytest.fixture()
+def assert_max_queries(db_session):
+    """
+    Returns a context manager failing the test when the code in its block runs
+    more than ``n`` queries (listing the statements run, grouped by fingerprint)::
+
+        def test_list_articles(client, assert_max_queries):
+            with assert_max_queries(2):
+                client.get('/articles')
+
+    The recorded :class:`~flask_unchained.bundles.sqlalchemy.QueryStats` get
+    yielded as the target of the ``with`` statement.
+    """
+    register_query_listeners()
+
+    @contextmanager
+    def assert_max_queries(n: int):
+        with record_queries() as stats:
+            yield stats
+
+        if stats.count > n:
+            pytest.fail(f"Expected at most {n} queries, but ran {stats.format()}")
+
+    return assert_max_queries
@@ -0,0 +1,259 @@
+import heapq
+import re
+import time
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import *
+
+from flask import current_app, g, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from flask_unchained import FlaskUnchained
+
+
+_active_stats: ContextVar[Tuple["QueryStats", ...]] = ContextVar(
+    "query_stats", default=()
+)
+
+_START_TIMES_INFO_KEY = "query_stats_start_times"
+
+_STRING_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_RE = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PARAM_RE = re.compile(r"%\(\w+\)s|%s|(?<![:\w]):\w+|\$\d+")
+_IN_LIST_RE = re.compile(r"\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)", re.IGNORECASE)
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=1024)
+def fingerprint(statement: str) -> str:
+    """
+    Returns the shape of a SQL statement, with its literals and bound parameters
+    replaced by ``?`` (and lists of them in ``IN`` clauses by ``...``), so that
+    repetitions of the same query can be grouped together. For example::
+
+        fingerprint("SELECT * FROM article WHERE id IN (1, 2, 3) AND title = 'x'")
+        # "SELECT * FROM article WHERE id IN (...) AND title = ?"
+    """
+    statement = _STRING_RE.sub("?", statement)
+    statement = _PARAM_RE.sub("?", statement)
+    statement = _NUMBER_RE.sub("?", statement)
+    statement = _IN_LIST_RE.sub("IN (...)", statement)
+    return _WHITESPACE_RE.sub(" ", statement).strip()
+
+
+class QueryStats:
+    """
+    Aggregates the SQL queries executed while recording (see
+    :func:`record_queries`): how many ran, how long they took in total, how
+    often each statement fingerprint ran, and the slowest statements.
+
+    :param max_slowest: How many of the slowest statements to keep.
+    :param slow_threshold: The number of seconds after which to log queries as
+                           slow (disabled if ``None``).
+    """
+
+    def __init__(self, max_slowest: int = 5, slow_threshold: Optional[float] = None):
+        self.max_slowest = max_slowest
+        self.slow_threshold = slow_threshold
+
+        self.count = 0
+        """
+        The number of queries executed.
+        """
+
+        self.duration = 0.0
+        """
+        The total number of seconds spent executing queries.
+        """
+
+        self.fingerprints: Dict[str, List[Union[int, float]]] = {}
+        """
+        The number of executions and total duration of queries, by fingerprint.
+        """
+
+        self._slowest: List[Tuple[float, int, str]] = []
+
+    def record(self, statement: str, duration: float) -> None:
+        """
+        Records the execution of ``statement`` taking ``duration`` seconds.
+        """
+        self.count += 1
+        self.duration += duration
+
+        totals = self.fingerprints.setdefault(fingerprint(statement), [0, 0.0])
+        totals[0] += 1
+        totals[1] += duration
+
+        item = (duration, self.count, statement)
+        if len(self._slowest) < self.max_slowest:
+            heapq.heappush(self._slowest, item)
+        elif self._slowest and duration > self._slowest[0][0]:
+            heapq.heapreplace(self._slowest, item)
+
+        if self.slow_threshold is not None and duration >= self.slow_threshold:
+            current_app.logger.warning(
+                f"Slow query ({duration * 1000:.2f}ms): {statement}"
+            )
+
+    @property
+    def slowest(self) -> List[Tuple[float, str]]:
+        """
+        The slowest statements executed, as ``(duration, statement)`` tuples
+        (slowest first).
+        """
+        return [
+            (duration, statement)
+            for duration, _, statement in sorted(self._slowest, reverse=True)
+        ]
+
+    @property
+    def repeated(self) -> Dict[str, int]:
+        """
+        The number of executions of the statement fingerprints that ran more than
+        once (most repeated first).
+        """
+        return {
+            fp: count
+            for fp, (count, _) in sorted(
+                self.fingerprints.items(), key=lambda item: -item[1][0]
+            )
+            if count > 1
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Returns the stats as a JSON-serializable dictionary (with durations in
+        milliseconds).
+        """
+        return {
+            "count": self.count,
+            "duration_ms": round(self.duration * 1000, 2),
+            "distinct": len(self.fingerprints),
+            "repeated": self.repeated,
+            "slowest": [
+                {"statement": statement, "duration_ms": round(duration * 1000, 2)}
+                for duration, statement in self.slowest
+            ],
+        }
+
+    def format(self) -> str:
+        """
+        Returns a human-readable summary of the stats.
+        """
+        lines = [f"{self.count} queries in {self.duration * 1000:.2f}ms"]
+        for fp, (count, duration) in self.fingerprints.items():
+            lines.append(f"  {count}x ({duration * 1000:.2f}ms): {fp}")
+        return "\n".join(lines)
+
+
+@contextmanager
+def record_queries(**kwargs) -> Iterator[QueryStats]:
+    """
+    Context manager recording the queries executed (by any engine, in the current
+    context) inside its block::
+
+        with record_queries() as stats:
+            Article.query.all()
+        assert stats.count == 1
+
+    Requires the listeners registered by :func:`register_query_listeners`.
+    Keyword arguments get passed to :class:`QueryStats`.
+    """
+    stats = QueryStats(**kwargs)
+    token = _active_stats.set(_active_stats.get() + (stats,))
+    try:
+        yield stats
+    finally:
+        _active_stats.reset(token)
+
+
+def register_query_listeners() -> None:
+    """
+    Register the engine event listeners timing queries for :func:`record_queries`.
+    They return immediately when nothing is being recorded.
+    """
+    for name, fn in [
+        ("before_cursor_execute", _before_cursor_execute),
+        ("after_cursor_execute", _after_cursor_execute),
+        ("handle_error", _handle_error),
+    ]:
+        if not event.contains(Engine, name, fn):
+            event.listen(Engine, name, fn)
+
+
+def init_request_stats(app: FlaskUnchained) -> None:
+    """
+    Record the queries of every request to ``app``. Each request gets logged with
+    its query stats (as ``extra={'query_stats': stats.to_dict()}``), and when the
+    ``SQLALCHEMY_QUERY_STATS_HEADERS`` config option is enabled, responses get
+    ``X-Query-Count`` and ``Server-Timing`` headers.
+    """
+    register_query_listeners()
+
+    @app.before_request
+    def start_recording_queries():
+        stats = QueryStats(
+            max_slowest=app.config.SQLALCHEMY_QUERY_STATS_SLOWEST,
+            slow_threshold=app.config.SQLALCHEMY_SLOW_QUERY_THRESHOLD,
+        )
+        g._query_stats = stats
+        g._query_stats_token = _active_stats.set(_active_stats.get() + (stats,))
+
+    @app.after_request
+    def report_query_stats(response):
+        stats = g.get("_query_stats")
+        if stats is None:
+            return response
+
+        if app.config.SQLALCHEMY_QUERY_STATS_HEADERS:
+            response.headers["X-Query-Count"] = str(stats.count)
+            response.headers.add("Server-Timing", f"db;dur={stats.duration * 1000:.2f}")
+
+        app.logger.info(
+            f"{request.method} {request.path} {response.status_code} "
+            f"queries={stats.count} distinct={len(stats.fingerprints)} "
+            f"db_time_ms={stats.duration * 1000:.2f}",
+            extra={"query_stats": stats.to_dict()},
+        )
+        return response
+
+    @app.teardown_request
+    def stop_recording_queries(exc=None):
+        token = g.pop("_query_stats_token", None)
+        if token is not None:
+            _active_stats.reset(token)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _active_stats.get():
+        conn.info.setdefault(_START_TIMES_INFO_KEY, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    active_stats = _active_stats.get()
+    start_times = conn.info.get(_START_TIMES_INFO_KEY)
+    if not active_stats or not start_times:
+        return
+
+    duration = time.perf_counter() - start_times.pop()
+    for stats in active_stats:
+        stats.record(statement, duration)
+
+
+def _handle_error(exception_context):
+    conn = exception_context.connection
+    start_times = conn is not None and conn.info.get(_START_TIMES_INFO_KEY)
+    if start_times:
+        start_times.pop()
+
+
+__all__ = [
+    "QueryStats",
+    "fingerprint",
+    "init_request_stats",
+    "record_queries",
+    "register_query_listeners",
+]
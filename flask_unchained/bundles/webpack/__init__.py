@@ -1,4 +1,6 @@
-from flask_unchained import Bundle
+from typing import *
+
+from flask_unchained import Bundle, FlaskUnchained
 
 from .extensions import Webpack, webpack
 
@@ -12,3 +14,11 @@ class WebpackBundle(Bundle):
     """
     The name of the Webpack Bundle.
     """
+
+    def warmup(self, app: FlaskUnchained) -> Dict[str, int]:
+        """
+        Make sure the webpack manifest is loaded.
+        """
+        if not webpack.assets:
+            webpack._load_assets(app)
+        return {"webpack assets": len(webpack.assets)}
@@ -203,11 +203,16 @@ def _get_basic_cli():
 def main():
     parser = argparse.ArgumentParser(add_help=False)
     parser.add_argument("--env")
+    parser.add_argument("command", nargs="*")
     args, _ = parser.parse_known_args()
 
     env = args.env or os.getenv("FLASK_ENV", DEV)
     os.environ["FLASK_ENV"] = ENV_ALIASES.get(env, env)
 
+    # the app must be profiled while it gets created (before the command runs)
+    if args.command[:2] == ["unchained", "boot-profile"]:
+        os.environ["UNCHAINED_BOOT_PROFILE"] = "true"
+
     debug = get_boolean_env("FLASK_DEBUG", env not in PROD_ENVS)
     os.environ["FLASK_DEBUG"] = "true" if debug else "false"
 
@@ -1,3 +1,5 @@
+import json
+
 from flask_unchained import current_app
 from flask_unchained.cli import cli, click, print_table
 
@@ -95,14 +97,12 @@ def hooks(ctx):
             if hook.require_exactly_one_bundle_module
             else hook.bundle_module_names
         )
-        rows.append(
-            (
-                hook.name,
-                bundle_module_names and ", ".join(bundle_module_names) or "(None)",
-                hook.bundle_override_module_names_attr or "(None)",
-                format_docstring(hook.__doc__) or "(None)",
-            )
-        )
+        rows.append((
+            hook.name,
+            bundle_module_names and ", ".join(bundle_module_names) or "(None)",
+            hook.bundle_override_module_names_attr or "(None)",
+            format_docstring(hook.__doc__) or "(None)",
+        ))
     print_table(header, rows)
 
 
@@ -113,7 +113,15 @@ def services():
     """
     header = ("Name", "Class", "Location")
     rows = []
-    for name, svc in current_app.unchained.services.items():
+    services = current_app.unchained.services
+    for name in services:
+        if not services.is_built(name):
+            # lazy or scoped services get listed without instantiating them
+            svc = current_app.unchained._services_registry[name]
+            rows.append((name, svc.__name__, svc.__module__))
+            continue
+
+        svc = services[name]
         if isinstance(svc, object):
             rows.append((name, svc.__class__.__name__, svc.__module__))
         elif hasattr(svc, "__module__") and hasattr(svc, "__name__"):
@@ -125,3 +133,61 @@ def services():
     print_table(
         header, sorted(sorted(rows, key=lambda row: row[0]), key=lambda row: row[2])
     )
+
+
+@unchained_group.command("boot-profile")
+@click.option(
+    "--json",
+    "as_json",
+    is_flag=True,
+    default=False,
+    help="Print the recorded timings as JSON instead of a table.",
+)
+@click.option(
+    "--chrome-trace",
+    type=click.Path(dir_okay=False, writable=True),
+    default=None,
+    help="Write the timings to this file in the Chrome trace-event format.",
+)
+@click.option(
+    "--limit",
+    type=int,
+    default=None,
+    help="Only show the slowest LIMIT timings.",
+)
+def boot_profile(as_json, chrome_trace, limit):
+    """
+    Show how long each step of booting the app took.
+    """
+    from ..boot_profiler import boot_profiler
+
+    boot_profiler.disable()
+    if not boot_profiler.records:
+        click.echo(
+            "No boot timings were recorded. Set the UNCHAINED_BOOT_PROFILE "
+            "environment variable if the app is not created by the flask command."
+        )
+        return
+
+    if chrome_trace:
+        with open(chrome_trace, "w") as f:
+            json.dump(boot_profiler.to_chrome_trace(), f)
+        click.echo(f"Wrote Chrome trace to {chrome_trace}")
+
+    records = sorted(boot_profiler.records, key=lambda r: r.wall_time, reverse=True)
+    if as_json:
+        click.echo(json.dumps([r._asdict() for r in records[:limit]], indent=2))
+        return
+
+    header = ("Category", "Name", "Wall (ms)", "Imports (ms)", "Allocated (KiB)")
+    rows = [
+        (
+            record.category,
+            record.name,
+            f"{record.wall_time * 1e3:.2f}",
+            f"{record.import_time * 1e3:.2f}",
+            f"{record.allocated / 1024:.1f}",
+        )
+        for record in records[:limit]
+    ]
+    print_table(header, rows, column_alignments=("<", "<", ">", ">", ">"))
@@ -29,6 +29,44 @@ class BundleConfig(metaclass=BundleConfigMetaclass):
 class _ConfigDefaults:
     DEBUG = get_boolean_env("FLASK_DEBUG", False)
 
+    SERVICES_LAZY = False
+    """
+    Whether or not to defer instantiating services until they are first needed
+    (injected, looked up with :meth:`~flask_unchained.Unchained.get_local_proxy`,
+    or accessed on ``unchained.services``). Circular dependencies are still
+    detected when the app boots.
+    """
+
+    SERVICES_EAGER = []
+    """
+    When :attr:`SERVICES_LAZY` is enabled, the names of services that should still
+    be instantiated when the app boots (eg, so they get built before forking
+    worker processes).
+    """
+
+    FREEZE_CONFIG = False
+    """
+    Whether or not to freeze the app config into an immutable snapshot at the end
+    of :meth:`~flask_unchained.AppFactory.create_app` (see
+    :meth:`~flask_unchained.AppFactory.freeze_config`). Writing to the config
+    afterwards raises an exception in production, and issues a warning otherwise.
+    """
+
+    WARMUP = False
+    """
+    Whether or not to call :meth:`~flask_unchained.AppFactory.warmup` at the end of
+    :meth:`~flask_unchained.AppFactory.create_app`, preloading everything the
+    bundles would otherwise build while handling the first requests.
+    """
+
+    WARMUP_GC_FREEZE = True
+    """
+    Whether or not :meth:`~flask_unchained.AppFactory.warmup` should freeze the
+    objects allocated so far with :func:`gc.freeze`, so the garbage collector of
+    forked worker processes doesn't copy the memory pages they share with the
+    master process.
+    """
+
 
 class _DevConfigDefaults:
     DEBUG = get_boolean_env("FLASK_DEBUG", True)
@@ -7,6 +7,7 @@ from typing import *
 from py_meta_utils import (
     AbstractMetaOption,
     McsArgs,
+    MetaOption,
     MetaOptionsFactory,
     _missing,
     deep_getattr,
@@ -74,6 +75,168 @@ def _get_injected_value(
     return value
 
 
+def _try_get_injected_value(unchained_ext, param_name: str):
+    try:
+        return _get_injected_value(unchained_ext, param_name, throw=False)
+    except AttributeError:  # config was requested before the app was created
+        return _missing
+
+
+def _raise_missing_injectable(di_name: str, param_name: str):
+    is_constructor = "." not in di_name and di_name != di_name.lower()
+    action = "initialized" if is_constructor else "called"
+    raise ServiceUsageError(
+        f"{di_name} was {action} without the {param_name} parameter. "
+        f"Please supply it manually, or make sure it gets injected."
+    )
+
+
+class _InjectionPlan:
+    """
+    The parameter layout of a callable wrapped by
+    :meth:`~flask_unchained.Unchained.inject`, compiled once when the callable gets
+    wrapped so that each call only needs to fill in its missing injectable params.
+
+    Providers are still looked up at call time, because services and extensions
+    can be replaced after a callable has been wrapped (eg in tests).
+
+    For internal use only.
+    """
+
+    def __init__(
+        self,
+        sig: inspect.Signature,
+        explicit_args: Optional[Iterable[str]] = None,
+    ):
+        self.sig = sig
+        self.explicit_args = set(explicit_args) if explicit_args is not None else None
+
+        positional = (
+            inspect.Parameter.POSITIONAL_ONLY,
+            inspect.Parameter.POSITIONAL_OR_KEYWORD,
+        )
+        keyword = (
+            inspect.Parameter.POSITIONAL_OR_KEYWORD,
+            inspect.Parameter.KEYWORD_ONLY,
+        )
+        positional_names = [n for n, p in sig.parameters.items() if p.kind in positional]
+
+        # (name, position, has_injectable_default) for every named parameter
+        self.params = tuple(
+            (
+                name,
+                positional_names.index(name) if p.kind in positional else None,
+                _is_injectable(p.default),
+            )
+            for name, p in sig.parameters.items()
+            if p.kind in positional or p.kind == inspect.Parameter.KEYWORD_ONLY
+        )
+        self.positional_names = tuple(positional_names)
+        self.keyword_names = frozenset(
+            name for name, p in sig.parameters.items() if p.kind in keyword
+        )
+        self.to_inject = tuple(
+            (name, position)
+            for name, position, has_injectable_default in self.params
+            if (
+                name in self.explicit_args
+                if self.explicit_args is not None
+                else has_injectable_default
+            )
+        )
+
+    def is_fast_path(self, fn_args: tuple, fn_kwargs: Dict[str, Any]) -> bool:
+        """
+        Whether or not the given call can be handled without binding the signature.
+        Calls that pass extra positional args, unknown keyword args, or the same
+        param both positionally and by keyword fall back to :meth:`bind`.
+        """
+        num_args = len(fn_args)
+        if num_args > len(self.positional_names):
+            return False
+        if fn_kwargs:
+            passed_positionally = self.positional_names[:num_args]
+            for name in fn_kwargs:
+                if name not in self.keyword_names or name in passed_positionally:
+                    return False
+        return True
+
+    def inject(
+        self,
+        unchained_ext,
+        di_name: str,
+        fn_args: tuple,
+        fn_kwargs: Dict[str, Any],
+    ) -> None:
+        """
+        Inject any missing injectable params into ``fn_kwargs`` (in place), and raise
+        :class:`~flask_unchained.exceptions.ServiceUsageError` if any param is still
+        set to ``injectable`` afterwards. Only valid for calls where
+        :meth:`is_fast_path` returns True.
+        """
+        num_args = len(fn_args)
+        for name, position in self.to_inject:
+            if (position is not None and position < num_args) or name in fn_kwargs:
+                continue
+            value = _try_get_injected_value(unchained_ext, name)
+            if value is not _missing:
+                fn_kwargs[name] = value
+
+        for name, position, has_injectable_default in self.params:
+            if position is not None and position < num_args:
+                value = fn_args[position]
+            elif name in fn_kwargs:
+                value = fn_kwargs[name]
+            elif has_injectable_default:
+                _raise_missing_injectable(di_name, name)
+            else:
+                continue
+            if _is_injectable(value):
+                _raise_missing_injectable(di_name, name)
+
+    def bind(
+        self,
+        unchained_ext,
+        di_name: str,
+        fn_args: tuple,
+        fn_kwargs: Dict[str, Any],
+    ) -> Tuple[tuple, Dict[str, Any]]:
+        """
+        Bind the call against the full signature to figure out which params need
+        to be injected. Handles any argument shape the wrapped callable accepts.
+        """
+        # figure out which params we need to inject (we don't want to
+        # interfere with any params the user has passed manually)
+        bound_args = self.sig.bind_partial(*fn_args, **fn_kwargs)
+        required = set(self.sig.parameters.keys())
+        have = set(bound_args.arguments.keys())
+        need = required - have
+        to_inject = need & (
+            self.explicit_args
+            if self.explicit_args is not None
+            else {k for k, v in self.sig.parameters.items() if _is_injectable(v.default)}
+        )
+
+        # try to inject needed params from extensions or services
+        for param_name in to_inject:
+            value = _try_get_injected_value(unchained_ext, param_name)
+            if value is not _missing:
+                fn_kwargs[param_name] = value
+
+        # check to make sure we're not missing anything required
+        bound_args = self.sig.bind_partial(*fn_args, **fn_kwargs)
+        bound_args.apply_defaults()
+        for k, v in bound_args.arguments.items():
+            if _is_injectable(v):
+                _raise_missing_injectable(di_name, k)
+
+        return bound_args.args, bound_args.kwargs
+
+
+def _is_injectable(value: Any) -> bool:
+    return isinstance(value, str) and value == injectable
+
+
 def _inject_cls_attrs(
     _wrapped_constructor: Optional[callable] = None,
     _call_super_for_cls: Optional[str] = None,
@@ -108,6 +271,10 @@ def _inject_cls_attrs(
     return __init__
 
 
+def _get_service_scope(service) -> str:
+    return getattr(getattr(service, "Meta", None), "scope", "singleton")
+
+
 def _set_up_class_dependency_injection(mcs_args: McsArgs):
     mcs_args.clsdict[_DI_AUTOMATICALLY_HANDLED] = True
 
@@ -152,8 +319,32 @@ def _set_up_class_dependency_injection(mcs_args: McsArgs):
             setattr(method, "__di_name__", f"{mcs_args.name}.{method.__di_name__}")
 
 
+SERVICE_SCOPES = ("singleton", "app_context", "request")
+"""
+The valid values for ``Service.Meta.scope``, ordered from longest to shortest lived.
+"""
+
+
+class ServiceScopeMetaOption(MetaOption):
+    """
+    The lifetime of instances of this service. One of ``"singleton"`` (the default,
+    one instance per process), ``"app_context"`` (one instance per application
+    context), or ``"request"`` (one instance per request). Scoped instances are
+    shared by everything that injects them within the same context, and are
+    discarded when it gets torn down.
+    """
+
+    def __init__(self):
+        super().__init__("scope", default="singleton", inherit=True)
+
+    def check_value(self, value, mcs_args: McsArgs):
+        if value not in SERVICE_SCOPES:
+            scopes = ", ".join(f"{x!r}" for x in SERVICE_SCOPES)
+            raise ValueError(f"The {self.name} meta option must be one of {scopes}")
+
+
 class ServiceMetaOptionsFactory(MetaOptionsFactory):
-    _options = [AbstractMetaOption]
+    _options = [AbstractMetaOption, ServiceScopeMetaOption]
 
 
 class ServiceMetaclass(type):
@@ -183,15 +374,25 @@ class Service(metaclass=ServiceMetaclass):
     Base class for services. Automatically sets up dependency injection on the
     constructor of the subclass, and allows for your service to be automatically
     detected and used.
+
+    By default services are singletons. To instead get one instance per request
+    (or per application context)::
+
+        class TenantClient(Service):
+            class Meta:
+                scope = "request"  # or "app_context"
     """
 
     class Meta:
         abstract = True
+        scope = "singleton"
 
 
 __all__ = [
     "injectable",
+    "SERVICE_SCOPES",
     "Service",
     "ServiceMetaclass",
     "ServiceMetaOptionsFactory",
+    "ServiceScopeMetaOption",
 ]
@@ -0,0 +1,180 @@
+import hashlib
+import importlib
+import json
+import os
+import pkgutil
+
+from collections import namedtuple
+from types import ModuleType
+from typing import *
+from weakref import WeakKeyDictionary
+
+
+class DiscoveryIndex:
+    """
+    An index of the modules in bundle packages, and the names declared in them,
+    used by :class:`~flask_unchained.AppFactoryHook` to discover objects.
+
+    Every hook searches the same bundle modules (and their child modules), so
+    instead of each hook walking the package tree and inspecting every module
+    again, the index does so once per package (and once per load of each module),
+    and each hook filters the result with its own
+    :meth:`~flask_unchained.AppFactoryHook.type_check`.
+
+    The child module names of packages can optionally be persisted to disk (by
+    setting ``DISCOVERY_CACHE`` in your ``unchained_config`` to a file path), in
+    which case they get reused by subsequent processes for as long as the
+    fingerprint of the package's files (their paths, sizes and modification
+    times, and the contents of the Python files) stays the same.
+
+    For internal use only.
+    """
+
+    def __init__(self):
+        self._child_module_names: Dict[str, List[str]] = {}
+        self._member_names: MutableMapping[ModuleType, _MemberNames] = WeakKeyDictionary()
+        self._persisted: Dict[str, Dict[str, Any]] = {}
+        self._persist = False
+        self._dirty = False
+
+    def get_child_module_names(self, module: ModuleType) -> List[str]:
+        """
+        Returns the names of the child modules of ``module`` (empty if it isn't
+        a package).
+        """
+        if module.__name__ in self._child_module_names:
+            return self._child_module_names[module.__name__]
+
+        names = []
+        if importlib.util.find_spec(module.__name__).submodule_search_locations:
+            fingerprint = self._persist and _fingerprint(module.__path__)
+            persisted = self._persisted.get(module.__name__)
+            if persisted and persisted["fingerprint"] == fingerprint:
+                names = persisted["child_module_names"]
+            else:
+                names = [
+                    f"{module.__package__}.{name}"
+                    for _, name, _ in pkgutil.walk_packages(module.__path__)
+                ]
+                if self._persist:
+                    self._persisted[module.__name__] = dict(
+                        fingerprint=fingerprint, child_module_names=names
+                    )
+                    self._dirty = True
+
+        self._child_module_names[module.__name__] = names
+        return names
+
+    def get_members(
+        self,
+        module: ModuleType,
+        predicate: Optional[Callable[[Any], bool]] = None,
+    ) -> List[Tuple[str, Any]]:
+        """
+        Like :func:`inspect.getmembers`, except that the member names of each module
+        only get computed once per load of the module (ie again if it gets
+        reloaded, or its file changes), and members are looked up in the module's
+        namespace directly (falling back to :func:`getattr`).
+        """
+        spec = getattr(module, "__spec__", None)
+        loader = getattr(module, "__loader__", None)
+        file_stat = _stat(getattr(module, "__file__", None))
+        cached = self._member_names.get(module)
+        if not (
+            cached
+            and cached.spec is spec
+            and cached.loader is loader
+            and cached.file_stat == file_stat
+        ):
+            cached = _MemberNames(spec, loader, file_stat, sorted(dir(module)))
+            self._member_names[module] = cached
+
+        namespace = vars(module)
+        members = []
+        for name in cached.names:
+            try:
+                obj = namespace[name] if name in namespace else getattr(module, name)
+            except AttributeError:
+                continue
+            if not predicate or predicate(obj):
+                members.append((name, obj))
+        return members
+
+    def load(self, path: str) -> None:
+        """
+        Load the persisted child module names from ``path`` (if it exists), and
+        enable persisting them.
+        """
+        self._persist = True
+        try:
+            with open(path) as f:
+                self._persisted = json.load(f)
+        except (OSError, ValueError):
+            self._persisted = {}
+
+    def save(self, path: str) -> None:
+        """
+        Persist the child module names to ``path`` (if anything changed).
+        """
+        if not self._dirty:
+            return
+
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self._persisted, f)
+        os.replace(tmp_path, path)
+        self._dirty = False
+
+    def clear(self) -> None:
+        """
+        Clear the in-memory index.
+        """
+        self.__init__()
+
+
+_MemberNames = namedtuple("_MemberNames", ("spec", "loader", "file_stat", "names"))
+
+
+def _stat(path: Optional[str]) -> Optional[Tuple[int, int]]:
+    try:
+        stat = os.stat(path)
+    except (OSError, TypeError):
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+def _fingerprint(package_paths: Iterable[str]) -> str:
+    """
+    Hash of the paths, sizes, and modification times of all the files in a package,
+    and of the contents of its Python files (which may change without their size
+    or modification time changing, eg within the resolution of the filesystem's
+    timestamps, or with checkouts preserving modification times).
+    """
+    digest = hashlib.sha1()
+    stack = list(package_paths)
+    while stack:
+        entries = sorted(os.scandir(stack.pop()), key=lambda entry: entry.path)
+        for entry in entries:
+            if entry.name == "__pycache__":
+                continue
+            if entry.is_dir():
+                stack.append(entry.path)
+            else:
+                stat = entry.stat()
+                digest.update(f"{entry.path}:{stat.st_size}:{stat.st_mtime_ns};".encode())
+                if entry.name.endswith(".py"):
+                    with open(entry.path, "rb") as f:
+                        digest.update(hashlib.sha1(f.read()).digest())
+    return digest.hexdigest()
+
+
+discovery_index = DiscoveryIndex()
+"""
+The :class:`DiscoveryIndex` instance shared by all hooks.
+"""
+
+
+__all__ = [
+    "DiscoveryIndex",
+    "discovery_index",
+]
@@ -6,6 +6,14 @@ class CWDImportError(ImportError):
     pass
 
 
+class CircularDependencyError(Exception):
+    pass
+
+
+class FrozenConfigError(Exception):
+    pass
+
+
 class NameCollisionError(Exception):
     pass
 
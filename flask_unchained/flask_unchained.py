@@ -1,10 +1,12 @@
 from types import FunctionType
 from typing import *
+from warnings import warn
 
 import flask
 
+from .exceptions import FrozenConfigError
 from .unchained import Unchained, unchained
-from .utils import AttrDict
+from .utils import AttrDict, FrozenConfig
 
 
 class AttrDictFlaskConfig(AttrDict, flask.Config):
@@ -21,8 +23,86 @@ class AttrDictFlaskConfig(AttrDict, flask.Config):
         app.config.SECRET_KEY = 'super-secret'
 
     Otherwise the same as :class:`flask.Config`.
+
+    The config can optionally be frozen at the end of app initialization (see
+    :meth:`freeze`), after which :attr:`frozen` holds an immutable
+    :class:`~flask_unchained.utils.FrozenConfig` snapshot of it.
     """
 
+    _frozen: Optional[FrozenConfig] = None
+    _raise_on_write: bool = False
+
+    @property
+    def frozen(self) -> Optional[FrozenConfig]:
+        """
+        The frozen snapshot of the config, or ``None`` if it hasn't been frozen.
+        """
+        return self._frozen
+
+    def freeze(self, raise_on_write: bool = True) -> FrozenConfig:
+        """
+        Take an immutable snapshot of the config. Any later writes to the config
+        raise :class:`~flask_unchained.exceptions.FrozenConfigError` if
+        ``raise_on_write`` is True, otherwise they issue a warning and get applied
+        to both the config and the snapshot.
+        """
+        object.__setattr__(self, "_raise_on_write", raise_on_write)
+        object.__setattr__(self, "_frozen", FrozenConfig.from_mapping(self))
+        return self._frozen
+
+    def _check_write(self, key) -> None:
+        if self._frozen is None:
+            return
+
+        msg = f"Cannot modify {key}: the config is frozen."
+        if self._raise_on_write:
+            raise FrozenConfigError(msg)
+        warn(msg + " (The change will be applied, but would raise in production.)")
+
+    def __setitem__(self, key, value):
+        self._check_write(key)
+        super().__setitem__(key, value)
+        if self._frozen is not None:
+            self._frozen._set(key, value)
+
+    def __delitem__(self, key):
+        self._check_write(key)
+        super().__delitem__(key)
+        if self._frozen is not None:
+            self._frozen._delete(key)
+
+    def update(self, *args, **kwargs):
+        if self._frozen is None:
+            return super().update(*args, **kwargs)
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def pop(self, key, *default):
+        if self._frozen is None or key not in self:
+            return super().pop(key, *default)
+        value = self[key]
+        del self[key]
+        return value
+
+    def popitem(self):
+        self._check_write("the config")
+        key, value = super().popitem()
+        if self._frozen is not None:
+            self._frozen._delete(key)
+        return key, value
+
+    def clear(self):
+        self._check_write("the config")
+        super().clear()
+        if self._frozen is not None:
+            for key in list(self._frozen):
+                self._frozen._delete(key)
+
 
 class FlaskUnchained(flask.Flask):
     """
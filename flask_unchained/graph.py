@@ -0,0 +1,142 @@
+from typing import *
+
+from .exceptions import CircularDependencyError
+
+
+class DependencyGraph:
+    """
+    A minimal directed graph of named nodes and the names of the nodes they depend
+    on, used to resolve the order to load bundles, run hooks, initialize extensions,
+    and instantiate services in.
+
+    Nodes and edges are kept in insertion order, so resolving the order is stable
+    for the same input. The resolved order is cached until the graph is modified.
+
+    For internal use only.
+
+    :param kind: The plural name of what the nodes are (used in error messages).
+    """
+
+    def __init__(self, kind: str):
+        self.kind = kind
+        self._data: Dict[str, Any] = {}
+        self._edges: Dict[str, Dict[str, None]] = {}
+        self._order: Optional[List[str]] = None
+
+    def add_node(self, name: str, data: Any = None) -> None:
+        """
+        Add a node (or update the data of an existing one).
+        """
+        self._edges.setdefault(name, {})
+        if data is not None or name not in self._data:
+            self._data[name] = data
+        self._order = None
+
+    def add_edge(self, name: str, dependency_name: str) -> None:
+        """
+        Add an edge declaring that ``name`` depends on ``dependency_name`` (adding
+        either node if it doesn't exist yet).
+        """
+        for node in (name, dependency_name):
+            if node not in self._edges:
+                self.add_node(node)
+        self._edges[name][dependency_name] = None
+        self._order = None
+
+    def get(self, name: str, default: Any = None) -> Any:
+        """
+        Returns the data of the node with the given name.
+        """
+        data = self._data.get(name)
+        return default if data is None else data
+
+    def dependencies(self, name: str) -> List[str]:
+        """
+        Returns the names of the nodes the given node depends on.
+        """
+        return list(self._edges[name])
+
+    def resolve_order(self) -> List[str]:
+        """
+        Returns the node names ordered such that every node comes after the nodes
+        it depends on.
+
+        :raises CircularDependencyError: If the graph has a cycle.
+        """
+        if self._order is not None:
+            return list(self._order)
+
+        # Kahn's algorithm, processing the nodes generation by generation starting
+        # with the ones nothing depends on, then reversing the result. This is the
+        # same order networkx produced, which the ordering of bundles without
+        # explicit dependencies between them relies on.
+        indegree = dict.fromkeys(self._edges, 0)
+        for dependencies in self._edges.values():
+            for dependency_name in dependencies:
+                indegree[dependency_name] += 1
+
+        order = []
+        generation = [name for name, degree in indegree.items() if not degree]
+        while generation:
+            order.extend(generation)
+            next_generation = []
+            for name in generation:
+                for dependency_name in self._edges[name]:
+                    indegree[dependency_name] -= 1
+                    if not indegree[dependency_name]:
+                        next_generation.append(dependency_name)
+            generation = next_generation
+
+        if len(order) != len(self._edges):
+            problem_graph = ", ".join(f"{a} -> {b}" for a, b in self.find_cycle())
+            raise CircularDependencyError(
+                f"Circular dependency detected between {self.kind}: {problem_graph}"
+            )
+
+        order.reverse()
+        self._order = order
+        return list(order)
+
+    def find_cycle(self) -> List[Tuple[str, str]]:
+        """
+        Returns the edges of the first cycle found by a depth-first search, or an
+        empty list if the graph has none.
+        """
+        explored = set()
+        for start in self._edges:
+            if start in explored:
+                continue
+
+            path = [start]
+            on_path = {start}
+            stack = [iter(self._edges[start])]
+            while stack:
+                for dependency_name in stack[-1]:
+                    if dependency_name in on_path:
+                        cycle = path[path.index(dependency_name) :] + [dependency_name]
+                        return list(zip(cycle, cycle[1:]))
+                    if dependency_name not in explored:
+                        path.append(dependency_name)
+                        on_path.add(dependency_name)
+                        stack.append(iter(self._edges[dependency_name]))
+                        break
+                else:
+                    stack.pop()
+                    name = path.pop()
+                    on_path.discard(name)
+                    explored.add(name)
+        return []
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._edges
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._edges)
+
+    def __len__(self) -> int:
+        return len(self._edges)
+
+
+__all__ = [
+    "DependencyGraph",
+]
@@ -1,9 +1,9 @@
 from collections import namedtuple
 from typing import *
 
-import networkx as nx
-
 from ..flask_unchained import FlaskUnchained
+from ..graph import DependencyGraph
+from ..utils import bind_config_properties
 from .register_extensions_hook import RegisterExtensionsHook
 
 
@@ -43,6 +43,7 @@ class InitExtensionsHook(RegisterExtensionsHook):
             if name in self.unchained.extensions:
                 extension = self.unchained.extensions[name]
 
+            bind_config_properties(extension, None)  # unbind from previous apps
             extension.init_app(app)
             if name not in self.unchained.extensions:
                 self.unchained.extensions[name] = extension
@@ -64,22 +65,15 @@ class InitExtensionsHook(RegisterExtensionsHook):
                 extension, dependencies = extension
             extension_tuples.append(ExtensionTuple(name, extension, dependencies))
 
-        dag = nx.DiGraph()
+        dag = DependencyGraph("extensions")
         for extension_tuple in extension_tuples:
-            dag.add_node(extension_tuple.name, extension_tuple=extension_tuple)
+            dag.add_node(extension_tuple.name, extension_tuple)
             for dep_name in extension_tuple.dependencies:
                 dag.add_edge(extension_tuple.name, dep_name)
 
-        try:
-            extension_order = reversed(list(nx.topological_sort(dag)))
-        except nx.NetworkXUnfeasible:
-            msg = "Circular dependency detected between extensions"
-            problem_graph = ", ".join(f"{a} -> {b}" for a, b in nx.find_cycle(dag))
-            raise Exception(f"{msg}: {problem_graph}")
-
         rv = []
-        for ext_name in extension_order:
-            extension_tuple = dag.nodes[ext_name].get("extension_tuple")
+        for ext_name in dag.resolve_order():
+            extension_tuple = dag.get(ext_name)
             if extension_tuple:
                 rv.append(extension_tuple)
         return rv
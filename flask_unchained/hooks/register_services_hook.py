@@ -70,4 +70,13 @@ class RegisterServicesHook(AppFactoryHook):
         """
         Add services to the CLI shell context.
         """
-        ctx.update(self.unchained.services)
+        # lazy and scoped services get proxied, so they are only built when used
+        services = self.unchained.services
+        ctx.update({
+            name: (
+                services[name]
+                if services.is_built(name)
+                else self.unchained.get_local_proxy(name)
+            )
+            for name in services
+        })
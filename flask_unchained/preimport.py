@@ -0,0 +1,191 @@
+import importlib.abc
+import importlib.machinery
+import pkgutil
+import sys
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from types import CodeType, ModuleType
+from typing import *
+
+
+class PreimportResult:
+    """
+    The outcome of :meth:`PreimportFinder.preimport`.
+
+    For internal use only.
+    """
+
+    def __init__(self):
+        self.module_names: List[str] = []
+        """
+        The names of the modules whose code got loaded, in the order they were found.
+        """
+
+        self.errors: Dict[str, Exception] = {}
+        """
+        Exceptions raised while loading the code of modules, by module name. These
+        modules get imported as usual, so the same errors get raised (if any) at
+        the same point during app initialization as without preimporting.
+        """
+
+        self.load_time: float = 0.0
+        """
+        The total time (in seconds) the worker threads spent loading code.
+        """
+
+        self.wall_time: float = 0.0
+        """
+        The elapsed time (in seconds) loading the code in parallel took.
+        """
+
+    @property
+    def speedup(self) -> float:
+        """
+        How many times faster loading the code in parallel was than loading it
+        serially would have been.
+        """
+        return self.load_time / self.wall_time if self.wall_time else 1.0
+
+
+class PreimportFinder(importlib.abc.MetaPathFinder):
+    """
+    Loads the code of modules (ie reading bytecode caches, or reading and compiling
+    the source files) in a thread pool, ahead of them getting imported.
+
+    Once installed in :data:`sys.meta_path`, importing any of these modules uses the
+    preloaded code. The modules still get executed (imported) by whoever imports
+    them, so import order, and with it the order objects get registered in at
+    import time, is exactly the same as without preimporting.
+
+    For internal use only.
+    """
+
+    def __init__(self):
+        self._specs: Dict[str, importlib.machinery.ModuleSpec] = {}
+        self._code: Dict[str, CodeType] = {}
+
+    def preimport(
+        self,
+        module_names: Iterable[str],
+        *,
+        include_submodules: Iterable[str] = (),
+        max_workers: Optional[int] = None,
+    ) -> PreimportResult:
+        """
+        Load the code of the given modules (and of all the child modules of those
+        in ``include_submodules``) in parallel.
+        """
+        result = PreimportResult()
+        include_submodules = set(include_submodules)
+        specs = []
+        for module_name in module_names:
+            specs.extend(self._find_specs(module_name, module_name in include_submodules))
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            loaded = list(executor.map(_load_code, specs))
+        result.wall_time = time.perf_counter() - start
+
+        for spec, (code, error, load_time) in zip(specs, loaded):
+            result.load_time += load_time
+            if error is not None:
+                result.errors[spec.name] = error
+            elif code is not None:
+                self._specs[spec.name] = spec
+                self._code[spec.name] = code
+                result.module_names.append(spec.name)
+        return result
+
+    def install(self) -> None:
+        sys.meta_path.insert(0, self)
+
+    def uninstall(self) -> None:
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+        self._specs.clear()
+        self._code.clear()
+
+    def find_spec(self, fullname, path=None, target=None):
+        if fullname not in self._specs:
+            return None
+
+        spec = self._specs.pop(fullname)
+        code = self._code.pop(fullname)
+        loader = spec.loader
+        spec.loader = _PreloadedLoader(loader, code)
+        return spec
+
+    def _find_specs(
+        self,
+        module_name: str,
+        include_submodules: bool,
+    ) -> List[importlib.machinery.ModuleSpec]:
+        if module_name in sys.modules or module_name in self._specs:
+            return []
+
+        parent_name, _, _ = module_name.rpartition(".")
+        parent = sys.modules.get(parent_name)
+        if parent_name and not hasattr(parent, "__path__"):
+            return []  # the parent package must already be imported
+
+        spec = importlib.machinery.PathFinder.find_spec(
+            module_name, parent.__path__ if parent_name else None
+        )
+        if spec is None or not hasattr(spec.loader, "get_code"):
+            return []
+
+        specs = [spec]
+        if include_submodules and spec.submodule_search_locations:
+            stack = [(spec.name, spec.submodule_search_locations)]
+            while stack:
+                package_name, search_locations = stack.pop(0)
+                for _, name, is_pkg in pkgutil.iter_modules(search_locations):
+                    child_name = f"{package_name}.{name}"
+                    if child_name in sys.modules:
+                        continue
+                    child_spec = importlib.machinery.PathFinder.find_spec(
+                        child_name, search_locations
+                    )
+                    if child_spec is None or not hasattr(child_spec.loader, "get_code"):
+                        continue
+                    specs.append(child_spec)
+                    if is_pkg and child_spec.submodule_search_locations:
+                        stack.append((child_name, child_spec.submodule_search_locations))
+        return specs
+
+
+class _PreloadedLoader(importlib.abc.Loader):
+    """
+    Executes preloaded code, and restores the original loader on the module.
+    """
+
+    def __init__(self, loader, code: CodeType):
+        self.loader = loader
+        self.code = code
+
+    def create_module(self, spec):
+        return self.loader.create_module(spec)
+
+    def exec_module(self, module: ModuleType) -> None:
+        module.__loader__ = self.loader
+        module.__spec__.loader = self.loader
+        exec(self.code, module.__dict__)
+
+    def __getattr__(self, name):
+        return getattr(self.loader, name)
+
+
+def _load_code(spec: importlib.machinery.ModuleSpec):
+    start = time.perf_counter()
+    try:
+        code = spec.loader.get_code(spec.name)
+    except Exception as e:
+        return None, e, time.perf_counter() - start
+    return code, None, time.perf_counter() - start
+
+
+__all__ = [
+    "PreimportFinder",
+    "PreimportResult",
+]
@@ -1,18 +1,20 @@
 import functools
 import inspect
 import itertools
+import threading
 
 from typing import *
 
 import jinja2
 import markupsafe
-import networkx as nx
 
-from flask import Flask, current_app
+from flask import Flask, current_app, g, has_app_context, has_request_context
+from flask.globals import request_ctx
 
 from py_meta_utils import _missing
 
 from ._compat import QUART_ENABLED, LocalProxy
+from .boot_profiler import boot_profiler
 from .constants import (
     _DI_AUTOMATICALLY_HANDLED,
     _INJECT_CLS_ATTRS,
@@ -21,9 +23,18 @@ from .constants import (
     STAGING,
     TEST,
 )
-from .di import _ensure_service_name, _get_injected_value, _inject_cls_attrs, injectable
+from .di import (
+    SERVICE_SCOPES,
+    _ensure_service_name,
+    _get_injected_value,
+    _get_service_scope,
+    _inject_cls_attrs,
+    _InjectionPlan,
+    injectable,
+)
 from .exceptions import ServiceUsageError
-from .utils import AttrDict
+from .graph import DependencyGraph
+from .utils import AttrDict, bind_config_properties
 
 
 class DeferredBundleBlueprintFunctions:
@@ -182,6 +193,156 @@ class _DeferredBundleBlueprintFunctionsStore:
         return self._bundles[bundle_name]
 
 
+class _ServicesDict(AttrDict):
+    """
+    The dictionary of services (``unchained.services``). When lazy services are
+    enabled, it also holds factories for services that have not been instantiated
+    yet. Those get built (and stored) the first time they are looked up.
+
+    Services scoped to the app context or request are never stored here; looking
+    them up returns the instance cached on the current context (building it first
+    if necessary).
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        object.__setattr__(self, "_factories", {})
+        object.__setattr__(self, "_scoped", {})
+        object.__setattr__(self, "_lock", threading.RLock())
+
+    def set_scoped_factory(
+        self,
+        name: str,
+        scope: str,
+        factory: Callable[[], Any],
+    ) -> None:
+        """
+        Register a factory to build the service named ``name`` once per ``scope``.
+        """
+        self._scoped[name] = (scope, factory)
+
+    def is_built(self, name: str) -> bool:
+        """
+        Whether or not the service named ``name`` is a singleton that has already
+        been instantiated.
+        """
+        return dict.__contains__(self, name)
+
+    def get_scope(self, name: str) -> str:
+        """
+        Returns the scope of the service named ``name`` (``'singleton'`` unless it
+        is scoped to the app context or request).
+        """
+        if name in self._scoped:
+            return self._scoped[name][0]
+        return "singleton"
+
+    def set_factory(self, name: str, factory: Callable[[], Any]) -> None:
+        """
+        Register a factory to build the service named ``name`` on first access.
+        """
+        self._factories[name] = factory
+
+    def is_pending(self, name: str) -> bool:
+        """
+        Whether or not the service named ``name`` has yet to be instantiated.
+        """
+        return name in self._factories
+
+    def __missing__(self, name: str):
+        if name in self._scoped:
+            scope, factory = self._scoped[name]
+            instances = _get_scoped_services(name, scope)
+            if name not in instances:
+                instances[name] = factory()
+            return instances[name]
+
+        with self._lock:
+            if dict.__contains__(self, name):  # built by another thread
+                return dict.__getitem__(self, name)
+            if name not in self._factories:
+                raise KeyError(name)
+            service = self._factories[name]()
+            self[name] = service
+            return service
+
+    def __setitem__(self, name, value):
+        self._factories.pop(name, None)
+        super().__setitem__(name, value)
+
+    def __contains__(self, name):
+        return (
+            dict.__contains__(self, name)
+            or name in self._factories
+            or name in self._scoped
+        )
+
+    def __iter__(self):
+        yield from dict.__iter__(self)
+        yield from list(self._factories)
+        yield from list(self._scoped)
+
+    def __len__(self):
+        return dict.__len__(self) + len(self._factories) + len(self._scoped)
+
+    def keys(self):
+        return list(self)
+
+    def values(self):
+        return [self[name] for name in list(self)]
+
+    def items(self):
+        return [(name, self[name]) for name in list(self)]
+
+    def get(self, name, default=None):
+        try:
+            return self[name]
+        except KeyError:
+            return default
+
+    def pop(self, name, *default):
+        self._factories.pop(name, None)
+        self._scoped.pop(name, None)
+        return super().pop(name, *default)
+
+
+_SCOPED_SERVICES_ATTR = "_unchained_scoped_services"
+
+
+def _get_scoped_services(name: str, scope: str) -> Dict[str, Any]:
+    """
+    Returns the cache of service instances for the currently active ``scope``.
+    """
+    if scope == "request":
+        if not has_request_context():
+            raise ServiceUsageError(
+                f"The {name} service is request-scoped and can only be used "
+                f"while handling a request."
+            )
+        ctx = request_ctx._get_current_object()
+    elif not has_app_context():
+        raise ServiceUsageError(
+            f"The {name} service is app_context-scoped and can only be used "
+            f"within an application context."
+        )
+    else:
+        ctx = g._get_current_object()
+
+    if not hasattr(ctx, _SCOPED_SERVICES_ATTR):
+        setattr(ctx, _SCOPED_SERVICES_ATTR, {})
+    return getattr(ctx, _SCOPED_SERVICES_ATTR)
+
+
+def _teardown_request_scoped_services(exception=None) -> None:
+    if has_request_context():
+        vars(request_ctx._get_current_object()).pop(_SCOPED_SERVICES_ATTR, None)
+
+
+def _teardown_app_context_scoped_services(exception=None) -> None:
+    if has_app_context():
+        g.pop(_SCOPED_SERVICES_ATTR, None)
+
+
 class Unchained:
     """
     The ``Unchained`` extension. Responsible for initializing the app by loading all
@@ -199,11 +360,12 @@ class Unchained:
 
     def __init__(self, env: Optional[Union[DEV, PROD, STAGING, TEST]] = None):
         self.bundles = AttrDict()
+        self.bundle_graph = None
         self._deferred_bundle_functions = _DeferredBundleBlueprintFunctionsStore()
         self.babel_bundle = None
         self.env = env
         self.extensions = AttrDict()
-        self.services = AttrDict()
+        self.services = _ServicesDict()
 
         self._app = None
         self._app_bundle_cls = None
@@ -220,7 +382,8 @@ class Unchained:
         bundles: Optional[List[object]] = None,  # FIXME Optional[List[Bundle]]
         unchained_config: Optional[Dict[str, Any]] = None,
     ) -> None:
-        # deferred import to prevent circular dependency
+        # deferred imports to prevent circular dependencies
+        from .bundles import BundleGraph
         from .hooks.run_hooks_hook import RunHooksHook
 
         self.env = app.env or self.env
@@ -229,6 +392,8 @@ class Unchained:
         self._app = app
 
         bundles = bundles or []
+        if self.bundle_graph is None or list(self.bundle_graph.bundles) != bundles:
+            self.bundle_graph = BundleGraph(bundles)
         for bundle in bundles:
             bundle._deferred_functions = self._deferred_bundle_functions[
                 bundle.name
@@ -350,69 +515,33 @@ class Unchained:
                 return cls
 
             sig = inspect.signature(fn)
+            plan = _InjectionPlan(sig, args if has_explicit_args else None)
+            cls_attrs_to_inject = None
 
             # create a new function wrapping the original to inject params
             @functools.wraps(fn)
             def dependency_injector(*fn_args, **fn_kwargs):
-                # figure out which params we need to inject (we don't want to
-                # interfere with any params the user has passed manually)
-                bound_args = sig.bind_partial(*fn_args, **fn_kwargs)
-                required = set(sig.parameters.keys())
-                have = set(bound_args.arguments.keys())
-                need = required - have
-                to_inject = need & (
-                    set(args)
-                    if has_explicit_args
-                    else {
-                        k
-                        for k, v in sig.parameters.items()
-                        if isinstance(v.default, str) and v.default == injectable
-                    }
-                )
+                nonlocal cls_attrs_to_inject
 
-                # try to inject needed params from extensions or services
-                for param_name in to_inject:
-                    try:
-                        fn_kwargs[param_name] = _get_injected_value(
-                            unchained_ext=self,
-                            param_name=param_name,
-                            requested_by=dependency_injector.__di_name__,
-                        )
-                    except:
-                        continue
-
-                # check to make sure we're not missing anything required
-                # this check must live here so that it works when services get used
-                # outside of flask unchained
-                bound_args = sig.bind_partial(*fn_args, **fn_kwargs)
-                bound_args.apply_defaults()
-                for k, v in bound_args.arguments.items():
-                    if isinstance(v, str) and v == injectable:
-                        di_name = dependency_injector.__di_name__
-                        is_constructor = "." not in di_name and di_name != di_name.lower()
-                        action = "initialized" if is_constructor else "called"
-                        raise ServiceUsageError(
-                            f"{di_name} was {action} without the {k} parameter. "
-                            f"Please supply it manually, or make sure it gets injected."
-                        )
+                # only fill in the params the user hasn't passed manually. the
+                # missing params check must live here so that it works when
+                # services get used outside of flask unchained
+                di_name = dependency_injector.__di_name__
+                if plan.is_fast_path(fn_args, fn_kwargs):
+                    plan.inject(self, di_name, fn_args, fn_kwargs)
+                else:
+                    fn_args, fn_kwargs = plan.bind(self, di_name, fn_args, fn_kwargs)
 
                 if cls and not getattr(cls, _DI_AUTOMATICALLY_HANDLED, False):
-                    cls_attrs_to_inject = getattr(cls, _INJECT_CLS_ATTRS, [])
-                    for attr, value in vars(cls).items():
-                        if (
-                            isinstance(value, str)
-                            and value == injectable
-                            and attr not in cls_attrs_to_inject
-                        ):
-                            cls_attrs_to_inject.append(attr)
-
-                    if has_explicit_args:
-                        cls_attrs_to_inject = list(set(cls_attrs_to_inject) & set(args))
+                    if cls_attrs_to_inject is None:
+                        cls_attrs_to_inject = _get_cls_attrs_to_inject(
+                            cls, args if has_explicit_args else None
+                        )
                     if cls_attrs_to_inject:
                         setattr(cls, _INJECT_CLS_ATTRS, cls_attrs_to_inject)
                         _inject_cls_attrs()(cls)
 
-                return fn(*bound_args.args, **bound_args.kwargs)
+                return fn(*fn_args, **fn_kwargs)
 
             dependency_injector.__signature__ = sig
             dependency_injector.__di_name__ = getattr(fn, "__di_name__", fn.__name__)
@@ -428,16 +557,14 @@ class Unchained:
         return wrapper
 
     def _init_services(self):
-        dag = nx.DiGraph()
+        dag = DependencyGraph("services")
         for name, service in self._services_registry.items():
             if not callable(service):
                 self.services[name] = service
                 continue
 
             dag.add_node(name)
-            params = set(getattr(service, _INJECT_CLS_ATTRS, []))
-            params |= set(inspect.signature(service).parameters)
-            for param_name in params:
+            for param_name in _get_service_param_names(service):
                 if (
                     param_name in self.services
                     or param_name in self.extensions
@@ -445,44 +572,95 @@ class Unchained:
                 ):
                     dag.add_edge(name, param_name)
 
-        try:
-            instantiation_order = reversed(list(nx.topological_sort(dag)))
-        except nx.NetworkXUnfeasible:
-            msg = "Circular dependency detected between services"
-            problem_graph = ", ".join(f"{a} -> {b}" for a, b in nx.find_cycle(dag))
-            raise Exception(f"{msg}: {problem_graph}")
+        instantiation_order = dag.resolve_order()
 
+        lazy = self._app.config.get("SERVICES_LAZY", False)
+        has_scoped_services = False
         for name in instantiation_order:
             if name in self.services or name in self.extensions:
                 continue
 
-            service = self._services_registry[name]
-            params = {
-                n: self.extensions.get(n, self.services.get(n))
-                for n in dag.successors(name)
-                if n not in getattr(service, _INJECT_CLS_ATTRS)
-                and (n in self.extensions or n in self.services)
-            }
-            if "config" in inspect.signature(service).parameters:
-                params["config"] = self._app.config
-
-            if not isinstance(service, type):
-                self.services[name] = functools.partial(service, **params)
+            dependency_names = dag.dependencies(name)
+            scope = self._check_service_scope(name, dependency_names)
+            if scope != "singleton":
+                has_scoped_services = True
+                self.services.set_scoped_factory(
+                    name,
+                    scope,
+                    functools.partial(self._instantiate_service, name, dependency_names),
+                )
+            elif lazy:
+                self.services.set_factory(
+                    name,
+                    functools.partial(self._instantiate_service, name, dependency_names),
+                )
             else:
-                try:
-                    self.services[name] = service(**params)
-                except TypeError as e:
-                    # FIXME this exception is too generic, need to better parse
-                    # its string repr (eg, got unexpected keyword argument)
-                    missing = str(e).rsplit(": ")[-1]
-                    requester = f"{service.__module__}.{service.__name__}"
-                    raise Exception(
-                        f"No service found with the name {missing} "
-                        f"(required by {requester})"
-                    )
+                self.services[name] = self._instantiate_service(name, dependency_names)
+
+        if lazy:
+            eager = set(self._app.config.get("SERVICES_EAGER", []))
+            for name in instantiation_order:
+                if name in eager and self.services.is_pending(name):
+                    self.services.get(name)  # instantiates it
+
+        if has_scoped_services:
+            self._app.teardown_request(_teardown_request_scoped_services)
+            self._app.teardown_appcontext(_teardown_app_context_scoped_services)
 
         self._services_initialized = True
 
+    def _check_service_scope(self, name: str, dependency_names: List[str]) -> str:
+        """
+        Returns the scope of the service named ``name``, making sure it does not
+        depend upon any services with a shorter lifetime than its own.
+        """
+        scope = _get_service_scope(self._services_registry[name])
+        for dep_name in dependency_names:
+            if dep_name not in self._services_registry:
+                continue  # extensions and service instances are singletons
+
+            dep_scope = _get_service_scope(self._services_registry[dep_name])
+            if SERVICE_SCOPES.index(dep_scope) > SERVICE_SCOPES.index(scope):
+                raise ServiceUsageError(
+                    f"The {scope}-scoped {name} service cannot depend upon the "
+                    f"{dep_scope}-scoped {dep_name} service."
+                )
+        return scope
+
+    def _instantiate_service(self, name: str, dependency_names: List[str]):
+        with boot_profiler.profile("service", name):
+            service = self._do_instantiate_service(name, dependency_names)
+
+        frozen_config = getattr(self._app.config, "frozen", None)
+        if frozen_config is not None:
+            bind_config_properties(service, frozen_config)
+        return service
+
+    def _do_instantiate_service(self, name: str, dependency_names: List[str]):
+        service = self._services_registry[name]
+        params = {
+            n: self.extensions[n] if n in self.extensions else self.services[n]
+            for n in dependency_names
+            if n not in getattr(service, _INJECT_CLS_ATTRS)
+            and (n in self.extensions or n in self.services)
+        }
+        if "config" in inspect.signature(service).parameters:
+            params["config"] = self._app.config
+
+        if not isinstance(service, type):
+            return functools.partial(service, **params)
+
+        try:
+            return service(**params)
+        except TypeError as e:
+            # FIXME this exception is too generic, need to better parse
+            # its string repr (eg, got unexpected keyword argument)
+            missing = str(e).rsplit(": ")[-1]
+            requester = f"{service.__module__}.{service.__name__}"
+            raise Exception(
+                f"No service found with the name {missing} (required by {requester})"
+            )
+
     def __getattr__(self, name: str):
         """
         Implemented to allow accessing bundles by their name as attributes on the
@@ -833,12 +1011,16 @@ class Unchained:
         """
         This method is for use by tests only!
         """
+        from .discovery import discovery_index
+
+        discovery_index.clear()
         self.bundles = AttrDict()
+        self.bundle_graph = None
         self._deferred_bundle_functions = _DeferredBundleBlueprintFunctionsStore()
         self.babel_bundle = None
         self.env = None
         self.extensions = AttrDict()
-        self.services = AttrDict()
+        self.services = _ServicesDict()
 
         self._deferred_functions = []
         self._initialized = False
@@ -923,6 +1105,46 @@ class Unchained:
             return fn
 
 
+def _get_cls_attrs_to_inject(cls, explicit_args=None):
+    cls_attrs_to_inject = getattr(cls, _INJECT_CLS_ATTRS, [])
+    for attr, value in vars(cls).items():
+        if (
+            isinstance(value, str)
+            and value == injectable
+            and attr not in cls_attrs_to_inject
+        ):
+            cls_attrs_to_inject.append(attr)
+
+    if explicit_args is not None:
+        cls_attrs_to_inject = list(set(cls_attrs_to_inject) & set(explicit_args))
+    return cls_attrs_to_inject
+
+
+def _get_service_param_names(service) -> List[str]:
+    """
+    Returns the names of the parameters (and class attributes) a service may get
+    injected, in declaration order. Constructors accepting ``*args`` or ``**kwargs``
+    (ie passing them on to ``super().__init__``) also include those of the base
+    classes' constructors.
+    """
+    names = dict.fromkeys(getattr(service, _INJECT_CLS_ATTRS, []))
+    sig = inspect.signature(service)
+    names.update(dict.fromkeys(sig.parameters))
+    if not isinstance(service, type):
+        return list(names)
+
+    for base in service.__mro__[1:]:
+        if not any(
+            param.kind in {param.VAR_POSITIONAL, param.VAR_KEYWORD}
+            for param in sig.parameters.values()
+        ):
+            break
+        if "__init__" in vars(base) and base is not object:
+            sig = inspect.signature(base.__init__)
+            names.update(dict.fromkeys(list(sig.parameters)[1:]))
+    return list(names)
+
+
 def _inject(fn, inject_args):
     if not inject_args:
         return fn
@@ -4,10 +4,12 @@ import sys
 
 from datetime import datetime, timezone
 from importlib import import_module
+from typing import *
 
 from flask import current_app
 
-from .exceptions import CWDImportError
+from .boot_profiler import boot_profiler
+from .exceptions import CWDImportError, FrozenConfigError
 
 
 class AttrDict(dict):
@@ -25,6 +27,85 @@ class AttrDict(dict):
         return f"{self.__class__.__name__}({dict.__repr__(self)})"
 
 
+class FrozenConfig:
+    """
+    An immutable snapshot of an app's config, as created by
+    :meth:`~flask_unchained.flask_unchained.AttrDictFlaskConfig.freeze`. Config
+    options are stored in slots, so reading them is plain attribute access::
+
+        secret_key = app.config.frozen.SECRET_KEY
+        secret_key = app.config.frozen['SECRET_KEY']
+
+    NOTE: only the snapshot itself is immutable, not the values stored in it.
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data):
+        object.__setattr__(self, "_data", dict(data))
+        for key in type(self).__slots__:
+            object.__setattr__(self, key, data[key])
+
+    @classmethod
+    def from_mapping(cls, data) -> "FrozenConfig":
+        """
+        Create a snapshot of the given mapping.
+        """
+        slots = tuple(
+            key
+            for key in data
+            if isinstance(key, str) and key.isidentifier() and not key.startswith("_")
+        )
+        return type(cls.__name__, (cls,), {"__slots__": slots})(data)
+
+    def get(self, key, default=None):
+        return self._data.get(key, default)
+
+    def _set(self, key, value) -> None:
+        """
+        Update the snapshot in place (for use by the frozen config only).
+        """
+        if key in type(self).__slots__:
+            object.__setattr__(self, key, value)
+        self._data[key] = value
+
+    def _delete(self, key) -> None:
+        """
+        Delete from the snapshot in place (for use by the frozen config only).
+        """
+        if key in type(self).__slots__ and hasattr(self, key):
+            object.__delattr__(self, key)
+        self._data.pop(key, None)
+
+    def __getattr__(self, key):
+        # only called for keys without slots (or deleted ones)
+        try:
+            return self._data[key]
+        except KeyError:
+            raise AttributeError(key)
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __setattr__(self, key, value):
+        raise FrozenConfigError(f"Cannot set {key}: the config is frozen.")
+
+    def __delattr__(self, key):
+        raise FrozenConfigError(f"Cannot delete {key}: the config is frozen.")
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self._data!r})"
+
+
 class ConfigProperty:
     """
     Allows extension classes to create properties that proxy to the config value,
@@ -32,12 +113,21 @@ class ConfigProperty:
 
     If key is left unspecified, in will be injected by ``ConfigPropertyMetaclass``,
     defaulting to ``f'{ext_class_name}_{property_name}'.upper()``.
+
+    Once the app's config has been frozen, properties of instances bound to it
+    (see :func:`bind_config_properties`) read the value directly from the
+    :class:`FrozenConfig` snapshot, instead of going through ``current_app``.
     """
 
     def __init__(self, key=None):
         self.key = key
 
     def __get__(self, instance, cls):
+        frozen_config = instance is not None and instance.__dict__.get(
+            _FROZEN_CONFIG_ATTR
+        )
+        if frozen_config:
+            return frozen_config[self.key]
         return current_app.config[self.key]
 
 
@@ -72,6 +162,25 @@ class ConfigPropertyMetaclass(type):
                 descriptor.key = f"{config_prefix}_{property_name}".upper()
 
 
+_FROZEN_CONFIG_ATTR = "__frozen_config__"
+
+
+def bind_config_properties(obj, frozen_config: Optional[FrozenConfig]) -> bool:
+    """
+    Bind the :class:`ConfigProperty` attributes of ``obj`` to read from the given
+    frozen config (or unbind them by passing ``None``). Returns whether or not
+    ``obj`` has config properties.
+    """
+    if not isinstance(type(obj), ConfigPropertyMetaclass) or not hasattr(obj, "__dict__"):
+        return False
+
+    if frozen_config is None:
+        obj.__dict__.pop(_FROZEN_CONFIG_ATTR, None)
+    else:
+        obj.__dict__[_FROZEN_CONFIG_ATTR] = frozen_config
+    return True
+
+
 def cwd_import(module_name):
     """
     Attempt to import a module from the current working directory.
@@ -115,7 +224,8 @@ def safe_import_module(module_name):
     if the requested ``module_name`` is not found.
     """
     try:
-        return import_module(module_name)
+        with boot_profiler.profile("import", module_name):
+            return import_module(module_name)
     except ImportError as e:
         m = re.match(r"No module named '([\w\.]+)'", str(e))
         if not m or not module_name.startswith(m.group(1)):
@@ -132,10 +242,12 @@ def utcnow():
 
 __all__ = [
     "AttrDict",
+    "bind_config_properties",
     "ConfigProperty",
     "ConfigPropertyMetaclass",
     "cwd_import",
     "format_docstring",
+    "FrozenConfig",
     "get_boolean_env",
     "safe_import_module",
     "utcnow",
@@ -1,6 +1,7 @@
 from .bundles.controller import (
     Controller,
     Resource,
+    cached_view,
     no_route,
     param_converter,
     redirect,
@@ -0,0 +1,5 @@
+from flask_unchained import Bundle
+
+
+class ScopedServicesBundle(Bundle):
+    pass
@@ -0,0 +1,25 @@
+from flask_unchained import Service, injectable
+
+
+class SingletonService(Service):
+    pass
+
+
+class AppContextService(Service):
+    class Meta:
+        scope = "app_context"
+
+    def __init__(self, singleton_service: SingletonService = injectable):
+        self.singleton_service = singleton_service
+
+
+class RequestService(Service):
+    class Meta:
+        scope = "request"
+
+    def __init__(self, app_context_service: AppContextService = injectable):
+        self.app_context_service = app_context_service
+
+
+class ExtendedRequestService(RequestService):
+    pass
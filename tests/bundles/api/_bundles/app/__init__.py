@@ -0,0 +1,5 @@
+from flask_unchained import AppBundle
+
+
+class ApiTestAppBundle(AppBundle):
+    pass
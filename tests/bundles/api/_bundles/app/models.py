@@ -0,0 +1,16 @@
+from flask_unchained.bundles.sqlalchemy import db
+
+
+class Author(db.Model):
+    name = db.Column(db.String)
+
+    articles = db.relationship("Article", back_populates="author")
+
+
+class Article(db.Model):
+    title = db.Column(db.String)
+    body = db.Column(db.Text, nullable=True)
+    version = db.Column(db.Integer, default=1)
+
+    author_id = db.foreign_key("Author", nullable=True)
+    author = db.relationship("Author", back_populates="articles")
@@ -0,0 +1,24 @@
+from flask_unchained import resource
+
+from .views import (
+    ArticleResource,
+    AuthorResource,
+    BulkArticleResource,
+    CachedArticleResource,
+    KeysetArticleResource,
+    PaginatedArticleResource,
+    StreamedArticleResource,
+    VersionedArticleResource,
+)
+
+
+routes = lambda: [
+    resource("/articles", ArticleResource),
+    resource("/versioned-articles", VersionedArticleResource),
+    resource("/paginated-articles", PaginatedArticleResource),
+    resource("/keyset-articles", KeysetArticleResource),
+    resource("/streamed-articles", StreamedArticleResource),
+    resource("/bulk-articles", BulkArticleResource),
+    resource("/cached-articles", CachedArticleResource),
+    resource("/authors", AuthorResource),
+]
@@ -0,0 +1,17 @@
+from flask_unchained.bundles.api import ma
+
+from .models import Article, Author
+
+
+@ma.serializer()
+class ArticleSerializer(ma.ModelSerializer):
+    class Meta:
+        model = Article
+
+
+@ma.serializer()
+class AuthorSerializer(ma.ModelSerializer):
+    class Meta:
+        model = Author
+
+    articles = ma.Nested("ArticleSerializer", many=True)
@@ -0,0 +1,55 @@
+from flask_unchained.bundles.api import ModelResource
+
+from .models import Article, Author
+
+
+class ArticleResource(ModelResource):
+    class Meta:
+        model = Article
+
+
+class VersionedArticleResource(ModelResource):
+    class Meta:
+        model = Article
+        url_prefix = "/versioned-articles"
+        etag_columns = ("version",)
+
+
+class PaginatedArticleResource(ModelResource):
+    class Meta:
+        model = Article
+        url_prefix = "/paginated-articles"
+        pagination = dict(per_page=2, max_per_page=3, count=True)
+
+
+class KeysetArticleResource(ModelResource):
+    class Meta:
+        model = Article
+        url_prefix = "/keyset-articles"
+        pagination = "keyset"
+
+
+class StreamedArticleResource(ModelResource):
+    class Meta:
+        model = Article
+        url_prefix = "/streamed-articles"
+        stream = 2
+
+
+class BulkArticleResource(ModelResource):
+    class Meta:
+        model = Article
+        url_prefix = "/bulk-articles"
+        include_methods = ("list", "bulk_create", "bulk_patch", "bulk_delete")
+
+
+class CachedArticleResource(ModelResource):
+    class Meta:
+        model = Article
+        url_prefix = "/cached-articles"
+        cache = True
+
+
+class AuthorResource(ModelResource):
+    class Meta:
+        model = Author
@@ -0,0 +1,27 @@
+import pytest
+
+from sqlalchemy import event
+
+from tests.bundles.sqlalchemy.conftest import app, db, db_ext
+
+
+@pytest.fixture()
+def article(db):
+    from ._bundles.app.models import Article
+
+    article = Article(title="Hello", body="World")
+    db.session.add(article)
+    db.session.commit()
+    return article
+
+
+@pytest.fixture()
+def queries(db):
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", before_cursor_execute)
+    yield statements
+    event.remove(db.engine, "before_cursor_execute", before_cursor_execute)
@@ -0,0 +1,156 @@
+import pytest
+
+from sqlalchemy import event
+
+
+@pytest.fixture()
+def commits(db):
+    """
+    Counts the transactions that got committed.
+    """
+    count = []
+
+    def after_commit(session):
+        count.append(session)
+
+    event.listen(db.session, "after_commit", after_commit)
+    yield count
+    event.remove(db.session, "after_commit", after_commit)
+
+
+@pytest.fixture()
+def articles(db):
+    from ._bundles.app.models import Article
+
+    articles = [Article(title=f"Article {i}", version=1) for i in range(3)]
+    db.session.add_all(articles)
+    db.session.commit()
+    return articles
+
+
+@pytest.mark.bundles(["flask_unchained.bundles.api", "tests.bundles.api._bundles.app"])
+class TestBulkCreate:
+    def test_creates_all_in_one_commit(self, client, db, commits):
+        from ._bundles.app.models import Article
+
+        r = client.post(
+            "/bulk-articles/bulk",
+            json=[{"title": f"New {i}", "version": 1} for i in range(5)],
+        )
+        assert r.status_code == 201
+        assert [item["title"] for item in r.json] == [f"New {i}" for i in range(5)]
+        assert all(item["id"] for item in r.json)
+        assert len(commits) == 1
+        assert Article.query.count() == 5
+
+    def test_errors_by_index(self, client, db, commits):
+        from ._bundles.app.models import Article
+
+        r = client.post(
+            "/bulk-articles/bulk",
+            json=[{"title": "Ok", "version": 1}, {"version": 1}, {"createdAt": "x"}],
+        )
+        assert r.status_code == 400
+        assert r.json["errors"] == {
+            "1": {"title": ["Title is required."]},
+            "2": {
+                "createdAt": ["Unknown field."],
+                "title": ["Title is required."],
+                "version": ["Version is required."],
+            },
+        }
+        assert not commits
+        assert Article.query.count() == 0
+
+    def test_invalid_input_type(self, client, db):
+        r = client.post("/bulk-articles/bulk", json={"title": "Not a list"})
+        assert r.status_code == 400
+        assert r.json["errors"] == {"_schema": ["Invalid input type."]}
+
+    def test_not_included_by_default(self, client, db):
+        r = client.post("/articles/bulk", json=[])
+        assert r.status_code in {404, 405}
+
+
+@pytest.mark.bundles(["flask_unchained.bundles.api", "tests.bundles.api._bundles.app"])
+class TestBulkPatch:
+    def test_updates_all_in_one_commit(self, client, db, articles, commits):
+        r = client.patch(
+            "/bulk-articles/bulk",
+            json=[{"id": a.id, "title": f"Updated {a.id}"} for a in articles],
+        )
+        assert r.status_code == 200
+        assert [item["title"] for item in r.json] == [f"Updated {a.id}" for a in articles]
+        assert len(commits) == 1
+        for a in articles:
+            db.session.refresh(a)
+            assert a.title == f"Updated {a.id}"
+
+    def test_errors_by_index(self, client, db, articles, commits):
+        r = client.patch(
+            "/bulk-articles/bulk",
+            json=[
+                {"id": articles[0].id, "title": "Updated"},
+                {"title": "No id"},
+                {"id": 1000, "title": "Missing"},
+                {"id": articles[1].id, "createdAt": "x"},
+                "not an object",
+            ],
+        )
+        assert r.status_code == 400
+        assert r.json["errors"] == {
+            "1": {"id": ["Id is required."]},
+            "2": {"id": ["Not found."]},
+            "3": {"createdAt": ["Unknown field."]},
+            "4": {"_schema": ["Invalid input type."]},
+        }
+        assert not commits
+        assert not db.session.dirty
+        assert articles[0].title == "Article 0"
+
+    def test_duplicate_ids(self, client, db, articles, commits):
+        r = client.patch(
+            "/bulk-articles/bulk",
+            json=[
+                {"id": articles[0].id, "title": "First"},
+                {"id": articles[0].id, "title": "Second"},
+            ],
+        )
+        assert r.status_code == 400
+        assert r.json["errors"] == {"1": {"id": ["Duplicate id."]}}
+        assert not commits
+        assert articles[0].title == "Article 0"
+
+
+@pytest.mark.bundles(["flask_unchained.bundles.api", "tests.bundles.api._bundles.app"])
+class TestBulkDelete:
+    def test_deletes_all_in_one_commit(self, client, db, articles, commits):
+        from ._bundles.app.models import Article
+
+        r = client.delete("/bulk-articles/bulk", json=[articles[0].id, articles[2].id])
+        assert r.status_code == 204
+        assert len(commits) == 1
+        assert [a.id for a in Article.query.all()] == [articles[1].id]
+
+    def test_errors_by_index(self, client, db, articles, commits):
+        from ._bundles.app.models import Article
+
+        r = client.delete("/bulk-articles/bulk", json=[articles[0].id, 1000, [1]])
+        assert r.status_code == 400
+        assert r.json["errors"] == {
+            "1": {"id": ["Not found."]},
+            "2": {"id": ["Not found."]},
+        }
+        assert not commits
+        assert Article.query.count() == 3
+
+    def test_rejects_duplicate_ids(self, client, db, articles, commits):
+        from ._bundles.app.models import Article
+
+        r = client.delete(
+            "/bulk-articles/bulk", json=[articles[0].id, articles[2].id, articles[0].id]
+        )
+        assert r.status_code == 400
+        assert r.json["errors"] == {"2": {"id": ["Duplicate id."]}}
+        assert not commits
+        assert Article.query.count() == 3
@@ -0,0 +1,51 @@
+import pytest
+
+
+@pytest.mark.bundles(["flask_unchained.bundles.api", "tests.bundles.api._bundles.app"])
+class TestCachedModelResource:
+    def test_caches_get_and_list(self, client, article, queries):
+        r = client.get(f"/cached-articles/{article.id}")
+        assert r.status_code == 200
+        assert r.json["title"] == "Hello"
+        client.get("/cached-articles")
+        num_queries = len(queries)
+
+        assert client.get(f"/cached-articles/{article.id}").json == r.json
+        assert client.get("/cached-articles").status_code == 200
+        assert len(queries) == num_queries
+
+    def test_cached_responses_are_conditional(self, client, article):
+        etag = client.get(f"/cached-articles/{article.id}").headers["ETag"]
+        r = client.get(f"/cached-articles/{article.id}", headers={"If-None-Match": etag})
+        assert r.status_code == 304
+
+    def test_writes_invalidate_the_cache(self, client, article):
+        assert client.get("/cached-articles").json[0]["title"] == "Hello"
+
+        r = client.patch(f"/cached-articles/{article.id}", json={"title": "Bye"})
+        assert r.status_code == 200
+        assert client.get("/cached-articles").json[0]["title"] == "Bye"
+
+        r = client.delete(f"/cached-articles/{article.id}")
+        assert r.status_code == 204
+        assert client.get("/cached-articles").json == []
+
+    def test_commits_invalidate_the_cache(self, client, db, article):
+        from ._bundles.app.models import Article
+
+        client.get("/cached-articles")
+        db.session.add(Article(title="New"))
+        db.session.commit()
+        assert len(client.get("/cached-articles").json) == 2
+
+    def test_rollbacks_do_not_invalidate_the_cache(self, client, db, article):
+        from ._bundles.app.models import Article
+
+        client.get("/cached-articles")
+        db.session.add(Article(title="New"))
+        db.session.flush()
+        db.session.rollback()
+        db.session.add(Article(title="Not committed"))
+        db.session.flush()
+        assert len(client.get("/cached-articles").json) == 1
+        db.session.rollback()
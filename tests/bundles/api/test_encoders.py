@@ -0,0 +1,97 @@
+import datetime as dt
+import decimal
+import uuid
+
+import pytest
+
+from flask_unchained.bundles.api.encoders import (
+    cbor_response,
+    default,
+    msgpack_response,
+    orjson_response,
+)
+
+
+PAYLOAD = {
+    "id": uuid.UUID(int=1),
+    "price": decimal.Decimal("9.99"),
+    "createdAt": dt.datetime(2020, 1, 2, 3, 4, 5),
+}
+
+
+@pytest.mark.bundles(["flask_unchained.bundles.api", "tests.bundles.api._bundles.app"])
+class TestEncoders:
+    def test_default(self):
+        assert default(PAYLOAD["id"]) == str(uuid.UUID(int=1))
+        assert default(PAYLOAD["price"]) == "9.99"
+        with pytest.raises(TypeError):
+            default(object())
+
+    def test_orjson(self, app):
+        orjson = pytest.importorskip("orjson")
+
+        r = orjson_response(PAYLOAD)
+        assert r.mimetype == "application/json"
+        assert orjson.loads(r.get_data()) == {
+            "id": "00000000-0000-0000-0000-000000000001",
+            "price": "9.99",
+            "createdAt": "2020-01-02T03:04:05",
+        }
+
+    def test_msgpack(self, app):
+        msgpack = pytest.importorskip("msgpack")
+
+        r = msgpack_response(PAYLOAD)
+        assert r.mimetype == "application/msgpack"
+        assert msgpack.unpackb(r.get_data())["createdAt"] == "2020-01-02T03:04:05"
+
+    def test_cbor(self, app):
+        cbor2 = pytest.importorskip("cbor2")
+
+        r = cbor_response(PAYLOAD)
+        assert r.mimetype == "application/cbor"
+        assert cbor2.loads(r.get_data()) == {
+            "id": PAYLOAD["id"],
+            "price": PAYLOAD["price"],
+            "createdAt": PAYLOAD["createdAt"].replace(tzinfo=dt.timezone.utc),
+        }
+
+
+@pytest.mark.bundles(["flask_unchained.bundles.api", "tests.bundles.api._bundles.app"])
+class TestAcceptNegotiation:
+    @pytest.fixture()
+    def handlers(self, app):
+        app.config.ACCEPT_HANDLERS = {
+            "application/json": orjson_response,
+            "application/x-test": lambda data: app.response_class(
+                repr(data), mimetype="application/x-test"
+            ),
+        }
+
+    @pytest.mark.parametrize(
+        "accept, mimetype",
+        [
+            (None, "application/json"),
+            ("*/*", "application/json"),
+            ("application/x-test", "application/x-test"),
+            ("application/json;q=0.5, application/x-test", "application/x-test"),
+            ("application/json, application/x-test;q=0.9", "application/json"),
+            ("text/html, */*;q=0.8", "application/json"),
+        ],
+    )
+    def test_negotiation(self, client, article, handlers, accept, mimetype):
+        headers = {"Accept": accept} if accept else {}
+        r = client.get(f"/articles/{article.id}", headers=headers)
+        assert r.status_code == 200
+        assert r.mimetype == mimetype
+        assert r.vary.as_set() == {"accept"}
+
+    def test_not_acceptable(self, client, article, handlers):
+        r = client.get(f"/articles/{article.id}", headers={"Accept": "text/csv"})
+        assert r.status_code == 406
+
+    def test_json_only_by_default(self, app, client, article):
+        assert list(app.config.ACCEPT_HANDLERS) == ["application/json"]
+
+        r = client.get(f"/articles/{article.id}", headers={"Accept": "application/cbor"})
+        assert r.status_code == 406
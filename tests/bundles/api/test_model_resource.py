@@ -0,0 +1,138 @@
+import pytest
+
+from sqlalchemy import event
+
+
+@pytest.fixture()
+def serialized(db):
+    """
+    Records the model instances that got serialized.
+    """
+    from ._bundles.app.serializers import ArticleSerializer
+
+    dumped = []
+    original_dump = ArticleSerializer.dump
+
+    def dump(self, obj, *args, **kwargs):
+        dumped.append(obj)
+        return original_dump(self, obj, *args, **kwargs)
+
+    ArticleSerializer.dump = dump
+    yield dumped
+    ArticleSerializer.dump = original_dump
+
+
+@pytest.mark.bundles(["flask_unchained.bundles.api", "tests.bundles.api._bundles.app"])
+class TestConditionalRequests:
+    def test_etag_from_body(self, client, article):
+        r = client.get(f"/articles/{article.id}")
+        assert r.status_code == 200
+        etag, weak = r.get_etag()
+        assert etag and weak
+
+        r = client.get(
+            f"/articles/{article.id}", headers={"If-None-Match": f'W/"{etag}"'}
+        )
+        assert r.status_code == 304
+        assert not r.data
+
+        r = client.get(f"/articles/{article.id}", headers={"If-None-Match": '"stale"'})
+        assert r.status_code == 200
+        assert r.json["title"] == "Hello"
+
+    def test_list_etag(self, client, article):
+        r = client.get("/articles")
+        etag, _ = r.get_etag()
+        assert client.get("/articles", headers={"If-None-Match": etag}).status_code == 304
+
+    def test_etag_columns_short_circuit_serialization(self, client, article, serialized):
+        r = client.get(f"/versioned-articles/{article.id}")
+        assert r.status_code == 200
+        assert len(serialized) == 1
+        etag, weak = r.get_etag()
+        assert weak
+
+        r = client.get(
+            f"/versioned-articles/{article.id}", headers={"If-None-Match": f'W/"{etag}"'}
+        )
+        assert r.status_code == 304
+        assert r.get_etag() == (etag, True)
+        assert len(serialized) == 1
+
+    def test_etag_columns_change(self, client, db, article):
+        etag, _ = client.get(f"/versioned-articles/{article.id}").get_etag()
+
+        article.version += 1
+        db.session.commit()
+
+        r = client.get(
+            f"/versioned-articles/{article.id}", headers={"If-None-Match": etag}
+        )
+        assert r.status_code == 200
+        assert r.get_etag()[0] != etag
+
+    def test_last_modified(self, client, article, serialized):
+        r = client.get(f"/articles/{article.id}")
+        assert r.last_modified.replace(tzinfo=None) == article.updated_at.replace(
+            microsecond=0
+        )
+
+        r = client.get(
+            f"/articles/{article.id}",
+            headers={"If-Modified-Since": r.headers["Last-Modified"]},
+        )
+        assert r.status_code == 304
+        assert len(serialized) == 1
+
+    def test_if_match(self, client, article):
+        etag, _ = client.get(f"/articles/{article.id}").get_etag()
+
+        r = client.patch(
+            f"/articles/{article.id}",
+            json={"title": "Changed"},
+            headers={"If-Match": '"stale"'},
+        )
+        assert r.status_code == 412
+        assert article.title == "Hello"
+
+        r = client.patch(
+            f"/articles/{article.id}",
+            json={"title": "Changed"},
+            headers={"If-Match": f'W/"{etag}"'},
+        )
+        assert r.status_code == 200
+        assert r.json["title"] == "Changed"
+
+        r = client.delete(f"/articles/{article.id}", headers={"If-Match": f'"{etag}"'})
+        assert r.status_code == 412
+
+        r = client.delete(f"/articles/{article.id}", headers={"If-Match": "*"})
+        assert r.status_code == 204
+
+    def test_if_match_with_etag_columns(self, client, article):
+        etag, _ = client.get(f"/versioned-articles/{article.id}").get_etag()
+
+        r = client.put(
+            f"/versioned-articles/{article.id}",
+            json={"title": "Changed", "version": 2},
+            headers={"If-Match": etag},
+        )
+        assert r.status_code == 200
+
+        r = client.delete(f"/versioned-articles/{article.id}", headers={"If-Match": etag})
+        assert r.status_code == 412
+
+    @pytest.mark.parametrize("url", ["/articles/{id}", "/versioned-articles/{id}"])
+    def test_if_match_with_other_representation(self, client, article, url):
+        url = url.format(id=article.id)
+        etag, _ = client.get(
+            f"{url}?fields=id,title", headers={"Accept": "*/*"}
+        ).get_etag()
+        assert etag != client.get(url).get_etag()[0]
+
+        r = client.patch(
+            url,
+            json={"title": "Changed"},
+            headers={"Accept": "application/json", "If-Match": f'W/"{etag}"'},
+        )
+        assert r.status_code == 200
@@ -0,0 +1,103 @@
+import pytest
+
+from flask_unchained.bundles.api import ma
+
+
+@pytest.fixture()
+def authors(db):
+    from ._bundles.app.models import Article, Author
+
+    authors = [
+        Author(name=f"Author {i}", articles=[Article(title=f"{i}.{j}") for j in range(2)])
+        for i in range(3)
+    ]
+    db.session.add_all(authors)
+    db.session.commit()
+    db.session.expunge_all()
+    return authors
+
+
+@pytest.mark.bundles(["flask_unchained.bundles.api", "tests.bundles.api._bundles.app"])
+class TestLoaderOptions:
+    def test_nested_fields(self, app, caplog):
+        from ._bundles.app.serializers import ArticleSerializer, AuthorSerializer
+
+        assert ArticleSerializer().get_loader_options() == []
+
+        app.logger.setLevel("DEBUG")
+        with caplog.at_level("DEBUG", logger=app.logger.name):
+            assert len(AuthorSerializer().get_loader_options()) == 1
+        assert "AuthorSerializer eager loading plan: articles (selectin)" in caplog.text
+
+    def test_only_and_exclude(self):
+        from ._bundles.app.serializers import AuthorSerializer
+
+        assert AuthorSerializer(only=("id", "name")).get_loader_options() == []
+        assert AuthorSerializer(exclude=("articles",)).get_loader_options() == []
+
+    def test_opt_out_and_chaining(self, authors, queries):
+        from ._bundles.app.models import Article
+
+        class ArticleAuthorSerializer(ma.ModelSerializer):
+            class Meta:
+                model = Article
+
+            author = ma.Nested("AuthorSerializer", only=("id", "articles"))
+
+        class LazyArticleAuthorSerializer(ArticleAuthorSerializer):
+            author = ma.Nested(
+                "AuthorSerializer", only=("id",), metadata={"eager_load": False}
+            )
+
+        assert LazyArticleAuthorSerializer().get_loader_options() == []
+
+        serializer = ArticleAuthorSerializer(many=True)
+        options = serializer.get_loader_options()
+        assert len(options) == 1
+
+        data = serializer.dump(Article.query.options(*options).all())
+        assert len(data) == 6
+        assert len(data[0]["author"]["articles"]) == 2
+        # articles joined with their authors, and then the authors' articles
+        assert len(queries) == 2
+
+    def test_list_and_get(self, client, authors, queries):
+        r = client.get("/authors")
+        assert [len(author["articles"]) for author in r.json] == [2, 2, 2]
+        assert len(queries) == 2
+
+        queries.clear()
+        r = client.get(f"/authors/{r.json[0]['id']}")
+        assert len(r.json["articles"]) == 2
+        assert len(queries) == 2
+
+
+@pytest.mark.bundles(["flask_unchained.bundles.api", "tests.bundles.api._bundles.app"])
+class TestKeyConversion:
+    def test_dump(self, article):
+        from ._bundles.app.serializers import ArticleSerializer
+
+        data = ArticleSerializer().dump(article)
+        assert {"createdAt", "updatedAt", "title"} <= set(data)
+        assert "created_at" not in data
+
+        [data] = ArticleSerializer(many=True).dump([article])
+        assert {"createdAt", "updatedAt", "title"} <= set(data)
+
+    def test_load(self, db):
+        from ._bundles.app.serializers import AuthorSerializer
+
+        serializer = AuthorSerializer()
+        assert serializer.load({"name": "camelCase"}).name == "camelCase"
+        assert serializer._load_keys["createdAt"] == "created_at"
+        assert serializer._load_keys["created_at"] == "created_at"
+        assert serializer._load_keys["unknownKey"] == "unknownKey"
+
+    def test_error_messages(self, db):
+        from marshmallow import ValidationError
+
+        from ._bundles.app.serializers import ArticleSerializer
+
+        with pytest.raises(ValidationError) as e:
+            ArticleSerializer().load({"title": 1, "version": 1, "createdAt": "x"})
+        assert set(e.value.messages) == {"title", "createdAt"}
@@ -0,0 +1,91 @@
+import gzip
+import json
+
+import pytest
+
+from flask_unchained.bundles.api.commands import spec
+from flask_unchained.bundles.api.extensions.api import brotli
+from flask_unchained.bundles.api.views import OpenAPIController
+
+
+@pytest.fixture()
+def openapi_url(app):
+    app.add_url_rule(
+        "/docs/openapi.json", view_func=OpenAPIController.method_as_view("json")
+    )
+    return "/docs/openapi.json"
+
+
+@pytest.mark.bundles(["flask_unchained.bundles.api", "tests.bundles.api._bundles.app"])
+class TestOpenAPIDocument:
+    def test_rendered_once(self, app, monkeypatch):
+        api = app.extensions["api"]
+        document = api.get_document()
+        assert json.loads(document.data)["paths"]["/articles/{id}"]
+        assert gzip.decompress(document.encodings["gzip"]) == document.data
+        assert ("br" in document.encodings) == (brotli is not None)
+
+        monkeypatch.setattr(api.spec, "to_dict", lambda: pytest.fail("re-rendered"))
+        assert api.get_document() is document
+
+    def test_registering_invalidates(self, app):
+        from marshmallow import Schema, fields
+
+        api = app.extensions["api"]
+        document = api.get_document()
+
+        class ExtraSerializer(Schema):
+            name = fields.String()
+
+        api.register_serializer(ExtraSerializer)
+        assert api.get_document().etag != document.etag
+        assert (
+            "ExtraSerializer"
+            in json.loads(api.get_document().data)["components"]["schemas"]
+        )
+
+    @pytest.mark.options(api_spec_auto_reload=True)
+    def test_auto_reload(self, app):
+        api = app.extensions["api"]
+        document = api.get_document()
+        assert api.get_document() is document
+
+        api.spec.tag({"name": "Extra"})
+        assert api.get_document().etag != document.etag
+
+    def test_view(self, app, client, openapi_url):
+        document = app.extensions["api"].get_document()
+
+        r = client.get(openapi_url, headers={"Accept-Encoding": "identity"})
+        assert r.status_code == 200
+        assert r.data == document.data
+        assert r.headers["ETag"] == f'"{document.etag}"'
+        assert "Content-Encoding" not in r.headers
+        assert r.headers["Vary"] == "Accept-Encoding"
+
+        r = client.get(openapi_url, headers={"Accept-Encoding": "gzip"})
+        assert r.headers["Content-Encoding"] == "gzip"
+        assert r.headers["ETag"] == f'"{document.etag}-gzip"'
+        assert gzip.decompress(r.data) == document.data
+
+        r = client.get(
+            openapi_url,
+            headers={"Accept-Encoding": "gzip", "If-None-Match": r.headers["ETag"]},
+        )
+        assert r.status_code == 304
+
+    def test_spec_command(self, app, cli_runner, tmp_path):
+        out = tmp_path / "openapi.json"
+        result = cli_runner.invoke(spec, args=["--out", str(out), "--compress"])
+        assert result.exit_code == 0, result.output
+
+        document = app.extensions["api"].get_document()
+        assert out.read_bytes() == document.data
+        assert gzip.decompress((tmp_path / "openapi.json.gz").read_bytes()) == (
+            document.data
+        )
+        assert (tmp_path / "openapi.json.br").exists() == (brotli is not None)
+
+        result = cli_runner.invoke(spec, args=["--out", str(out), "--indent", "2"])
+        assert result.exit_code == 0, result.output
+        assert json.loads(out.read_bytes()) == json.loads(document.data)
@@ -0,0 +1,83 @@
+import pytest
+
+from flask_unchained.bundles.api import Pagination
+from flask_unchained.bundles.api.model_resource import ModelResource
+
+
+@pytest.fixture()
+def articles(db):
+    from ._bundles.app.models import Article
+
+    articles = [Article(title=f"Article {i}") for i in range(5)]
+    db.session.add_all(articles)
+    db.session.commit()
+    return articles
+
+
+def titles(r):
+    return [article["title"] for article in r.json]
+
+
+@pytest.mark.bundles(["flask_unchained.bundles.api", "tests.bundles.api._bundles.app"])
+class TestPagination:
+    def test_not_paginated_by_default(self, client, articles):
+        r = client.get("/articles")
+        assert len(r.json) == 5
+        assert "Link" not in r.headers
+
+    def test_offset(self, client, articles):
+        r = client.get("/paginated-articles")
+        assert titles(r) == ["Article 0", "Article 1"]
+        assert r.headers["X-Total-Count"] == "5"
+        assert r.headers["Link"] == ", ".join([
+            '<http://localhost/paginated-articles?page=1>; rel="first"',
+            '<http://localhost/paginated-articles?page=2>; rel="next"',
+            '<http://localhost/paginated-articles?page=3>; rel="last"',
+        ])
+
+        r = client.get("/paginated-articles?page=3")
+        assert titles(r) == ["Article 4"]
+        assert 'rel="prev"' in r.headers["Link"]
+        assert 'rel="next"' not in r.headers["Link"]
+
+    def test_max_per_page(self, client, articles):
+        r = client.get("/paginated-articles?per_page=50&page=2")
+        assert titles(r) == ["Article 3", "Article 4"]
+        assert "per_page=50&page=1" in r.headers["Link"]
+
+    def test_invalid_args(self, client, articles):
+        assert client.get("/paginated-articles?page=0").status_code == 400
+        assert client.get("/paginated-articles?per_page=x").status_code == 400
+        assert client.get("/keyset-articles?cursor=!!!").status_code == 400
+
+    def test_keyset(self, client, articles):
+        r = client.get("/keyset-articles?per_page=3")
+        assert titles(r) == ["Article 0", "Article 1", "Article 2"]
+        assert "X-Total-Count" not in r.headers
+
+        links = dict(
+            (rel.split('"')[1], url.strip(" <>"))
+            for url, rel in (link.split(";") for link in r.headers["Link"].split(","))
+        )
+        assert links["first"] == "http://localhost/keyset-articles?per_page=3"
+
+        r = client.get(links["next"])
+        assert titles(r) == ["Article 3", "Article 4"]
+        assert 'rel="next"' not in r.headers["Link"]
+
+    def test_openapi_parameters(self, app):
+        from ._bundles.app.views import KeysetArticleResource
+
+        params = KeysetArticleResource.Meta.pagination.get_query_parameters()
+        assert [p["name"] for p in params] == ["cursor", "per_page"]
+
+    def test_meta_option(self):
+        with pytest.raises(ValueError):
+
+            class InvalidResource(ModelResource):
+                class Meta:
+                    abstract = True
+                    pagination = "pages"
+
+        with pytest.raises(ValueError):
+            Pagination(count="sometimes")
@@ -0,0 +1,96 @@
+import pytest
+
+
+@pytest.fixture()
+def articles(db):
+    from ._bundles.app.models import Article, Author
+
+    author = Author(name="Author")
+    articles = [
+        Article(title=f"Article {i}", body="Body", author=author) for i in range(3)
+    ]
+    db.session.add_all(articles)
+    db.session.commit()
+    for article in articles:
+        db.session.refresh(article)
+    db.session.expunge_all()
+    return articles
+
+
+@pytest.mark.bundles(["flask_unchained.bundles.api", "tests.bundles.api._bundles.app"])
+class TestModelSerializerProjection:
+    def test_dumps_only_the_fields(self, articles):
+        from ._bundles.app.models import Article
+        from ._bundles.app.serializers import ArticleSerializer
+
+        serializer = ArticleSerializer()
+        projection = serializer.get_projection(["title", "createdAt"])
+        assert set(projection.dump(Article.query.first())) == {"title", "createdAt"}
+
+    def test_accepts_wire_and_field_names(self):
+        from ._bundles.app.serializers import ArticleSerializer
+
+        serializer = ArticleSerializer()
+        projection = serializer.get_projection(["createdAt"])
+        assert serializer.get_projection(["created_at"]) is projection
+        assert serializer.get_projection(["createdAt"], ["version"]) is not projection
+
+    def test_invalid_fields(self):
+        from ._bundles.app.serializers import ArticleSerializer
+
+        with pytest.raises(ValueError, match="Invalid fields: foo, authorId"):
+            ArticleSerializer().get_projection(["title", "foo", "authorId"])
+
+    def test_loader_options(self, articles, queries):
+        from ._bundles.app.models import Author
+        from ._bundles.app.serializers import AuthorSerializer
+
+        projection = AuthorSerializer().get_projection(["name"], ["id"])
+        assert len(projection.get_loader_options()) == 1
+        Author.query.options(*projection.get_loader_options()).all()
+        assert len(queries) == 1
+
+        projection = AuthorSerializer().get_projection(["articles"])
+        assert len(projection.get_loader_options()) == 2
+        queries.clear()
+        author = Author.query.options(*projection.get_loader_options()).one()
+        assert "name" not in queries[0].split("FROM")[0]
+        assert len(author.articles) == 3
+        assert len(queries) == 2
+
+
+@pytest.mark.bundles(["flask_unchained.bundles.api", "tests.bundles.api._bundles.app"])
+class TestSparseFieldsets:
+    def test_get(self, client, articles, queries):
+        r = client.get(f"/articles/{articles[0].id}?fields=title,createdAt")
+        assert r.status_code == 200
+        assert r.json == {"title": "Article 0", "createdAt": r.json["createdAt"]}
+        assert "body" not in queries[0]
+
+    def test_list(self, client, articles, queries):
+        r = client.get("/articles?fields=id,%20title")
+        assert r.status_code == 200
+        assert r.json == [{"id": a.id, "title": a.title} for a in articles]
+        assert "body" not in queries[0]
+
+    def test_paginated_list(self, client, articles):
+        r = client.get("/paginated-articles?fields=title")
+        assert r.json == [{"title": "Article 0"}, {"title": "Article 1"}]
+        assert "fields=title" in r.headers["Link"]
+
+    def test_streamed_list(self, client, articles):
+        r = client.get("/streamed-articles?fields=title")
+        assert r.json == [{"title": a.title} for a in articles]
+
+    def test_invalid_fields(self, client, articles):
+        r = client.get("/articles?fields=title,foo")
+        assert r.status_code == 400
+        assert "Invalid fields: foo" in r.get_data(as_text=True)
+
+    def test_etag_depends_on_fields(self, client, articles):
+        url = f"/versioned-articles/{articles[0].id}"
+        etag, _ = client.get(url).get_etag()
+        projected_etag, _ = client.get(f"{url}?fields=title").get_etag()
+        assert etag != projected_etag
+        r = client.get(f"{url}?fields=title", headers={"If-None-Match": projected_etag})
+        assert r.status_code == 304
@@ -0,0 +1,70 @@
+import json
+
+import pytest
+
+
+@pytest.fixture()
+def articles(db):
+    from ._bundles.app.models import Article
+
+    articles = [Article(title=f"Article {i}") for i in range(5)]
+    db.session.add_all(articles)
+    db.session.commit()
+    return articles
+
+
+@pytest.fixture()
+def batches(db):
+    """
+    Records the sizes of the batches of model instances that got serialized.
+    """
+    from ._bundles.app.serializers import ArticleSerializer
+
+    sizes = []
+    original_dump = ArticleSerializer.dump
+
+    def dump(self, obj, *args, **kwargs):
+        sizes.append(len(obj) if isinstance(obj, list) else 1)
+        return original_dump(self, obj, *args, **kwargs)
+
+    ArticleSerializer.dump = dump
+    yield sizes
+    ArticleSerializer.dump = original_dump
+
+
+@pytest.mark.bundles(["flask_unchained.bundles.api", "tests.bundles.api._bundles.app"])
+class TestStreaming:
+    def test_json_array(self, client, articles, batches):
+        r = client.get("/streamed-articles")
+        assert r.is_streamed
+        assert r.mimetype == "application/json"
+        assert "ETag" not in r.headers
+        assert [x["title"] for x in json.loads(r.data)] == [
+            f"Article {i}" for i in range(5)
+        ]
+        assert batches == [2, 2, 1]
+
+    def test_ndjson(self, client, articles, batches):
+        r = client.get("/streamed-articles", headers={"Accept": "application/x-ndjson"})
+        assert r.mimetype == "application/x-ndjson"
+        lines = r.data.decode().splitlines()
+        assert [json.loads(line)["title"] for line in lines] == [
+            f"Article {i}" for i in range(5)
+        ]
+        assert batches == [2, 2, 1]
+
+    def test_empty(self, client, db, batches):
+        assert json.loads(client.get("/streamed-articles").data) == []
+        r = client.get("/streamed-articles", headers={"Accept": "application/x-ndjson"})
+        assert r.data == b""
+        assert batches == []
+
+    def test_iterator(self, app, articles, batches):
+        from ._bundles.app.models import Article
+        from ._bundles.app.views import StreamedArticleResource
+
+        with app.test_request_context():
+            resource = StreamedArticleResource()
+            r = resource.stream_response(iter(Article.query.all()))
+            assert len(json.loads(r.get_data())) == 5
+        assert batches == [2, 2, 1]
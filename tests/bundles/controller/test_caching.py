@@ -0,0 +1,304 @@
+import fnmatch
+import functools
+import os
+import stat
+import time
+
+import pytest
+
+from flask import abort, jsonify, make_response, request
+
+from flask_unchained import Controller
+from flask_unchained.bundles.controller.caching import (
+    FileSystemViewCache,
+    LRUViewCache,
+    RedisViewCache,
+    cached_view,
+    create_view_cache,
+    get_view_cache,
+)
+
+
+class FakeRedis:
+    """
+    Implements the (few) Redis commands used by the RedisViewCache.
+    """
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, name):
+        value = self.data.get(name)
+        return value[0] if value else None
+
+    def set(self, name, value, ex=None):
+        self.data[name] = (value, ex)
+
+    def sadd(self, name, *values):
+        self.data.setdefault(name, set()).update(values)
+
+    def smembers(self, name):
+        return set(self.data.get(name, ()))
+
+    def delete(self, *names):
+        for name in names:
+            self.data.pop(name, None)
+
+    def scan_iter(self, match):
+        return [name for name in list(self.data) if fnmatch.fnmatch(name, match)]
+
+
+@pytest.fixture(params=["lru", "filesystem", "redis"])
+def view_cache(request, tmp_path):
+    if request.param == "lru":
+        return LRUViewCache()
+    elif request.param == "filesystem":
+        return FileSystemViewCache(str(tmp_path))
+    return RedisViewCache(FakeRedis())
+
+
+class TestViewCaches:
+    def test_get_and_set(self, view_cache):
+        assert view_cache.get("key") is None
+        view_cache.set("key", (200, [], b"data"))
+        assert view_cache.get("key") == (200, [], b"data")
+
+    def test_invalidate(self, view_cache):
+        view_cache.set("one", 1, tags=["Article"])
+        view_cache.set("two", 2, tags=["Article", "Author"])
+        view_cache.set("three", 3, tags=["Author"])
+        view_cache.invalidate(["Article"])
+        assert view_cache.get("one") is None
+        assert view_cache.get("two") is None
+        assert view_cache.get("three") == 3
+
+    def test_clear(self, view_cache):
+        view_cache.set("one", 1, tags=["Article"])
+        view_cache.set("two", 2)
+        view_cache.clear()
+        assert view_cache.get("one") is None
+        assert view_cache.get("two") is None
+
+
+class TestLRUViewCache:
+    def test_expires_entries(self, monkeypatch):
+        view_cache = LRUViewCache()
+        view_cache.set("key", "value", timeout=10)
+        monkeypatch.setattr(time, "time", lambda: float("inf"))
+        assert view_cache.get("key") is None
+        assert len(view_cache) == 0
+
+    def test_evicts_least_recently_used(self):
+        view_cache = LRUViewCache(maxsize=2)
+        view_cache.set("one", 1, tags=["Article"])
+        view_cache.set("two", 2)
+        view_cache.get("one")
+        view_cache.set("three", 3)
+        assert len(view_cache) == 2
+        assert view_cache.get("two") is None
+        assert view_cache.get("one") == 1
+
+        view_cache.set("four", 4)
+        view_cache.set("five", 5)
+        assert view_cache.get("one") is None
+        assert view_cache._keys_by_tag == {}
+
+
+class TestCreateViewCache:
+    def test_types(self, app, tmp_path):
+        assert isinstance(create_view_cache(app), LRUViewCache)
+
+        app.config.VIEW_CACHE_TYPE = "filesystem"
+        app.config.VIEW_CACHE_DIR = str(tmp_path)
+        assert isinstance(create_view_cache(app), FileSystemViewCache)
+
+        app.config.VIEW_CACHE_TYPE = "redis"
+        app.config.VIEW_CACHE_REDIS = FakeRedis()
+        assert isinstance(create_view_cache(app), RedisViewCache)
+
+        view_cache = LRUViewCache()
+        app.config.VIEW_CACHE_TYPE = view_cache
+        assert create_view_cache(app) is view_cache
+
+    def test_filesystem_dir(self, app, tmp_path):
+        app.config.VIEW_CACHE_TYPE = "filesystem"
+        app.instance_path = str(tmp_path / "instance")
+        view_cache = create_view_cache(app)
+        assert view_cache.cache_dir == str(tmp_path / "instance" / "view_cache")
+        assert stat.S_IMODE(os.stat(view_cache.cache_dir).st_mode) == 0o700
+
+        shared_dir = tmp_path / "shared"
+        shared_dir.mkdir()
+        shared_dir.chmod(0o777)
+        app.config.VIEW_CACHE_DIR = str(shared_dir)
+        with pytest.raises(ValueError, match="Refusing to use"):
+            create_view_cache(app)
+
+    def test_invalid_type(self, app):
+        app.config.VIEW_CACHE_TYPE = "memcached"
+        with pytest.raises(ValueError, match="Invalid VIEW_CACHE_TYPE"):
+            create_view_cache(app)
+
+    def test_get_view_cache_is_created_once(self, app):
+        assert get_view_cache() is get_view_cache(app)
+
+
+@pytest.fixture()
+def calls(app):
+    calls = []
+
+    @cached_view(tags=["Article"])
+    def cached():
+        calls.append(request.args.to_dict())
+        status = int(request.args.get("status", 200))
+        return jsonify(calls=len(calls)), status
+
+    @cached_view
+    def with_cookie():
+        calls.append({})
+        response = make_response("cookie")
+        response.set_cookie("foo", "bar")
+        return response
+
+    @cached_view
+    def varies_on_cookie():
+        calls.append({})
+        response = make_response("session")
+        response.vary.add("Cookie")
+        return response
+
+    app.add_url_rule("/cached", view_func=cached, methods=["GET", "POST"])
+    app.add_url_rule("/with-cookie", view_func=with_cookie)
+    app.add_url_rule("/vary-cookie", view_func=varies_on_cookie)
+    return calls
+
+
+class TestCachedView:
+    def test_caches_get_requests(self, client, calls):
+        r = client.get("/cached?a=1&b=2")
+        assert r.json == {"calls": 1}
+        r = client.get("/cached?b=2&a=1")
+        assert r.json == {"calls": 1}
+        assert len(calls) == 1
+
+        client.get("/cached?a=2&b=2")
+        assert len(calls) == 2
+
+    def test_varies_on_accept(self, client, calls):
+        client.get("/cached", headers={"Accept": "application/json"})
+        client.get("/cached", headers={"Accept": "application/msgpack"})
+        assert len(calls) == 2
+
+    def test_skips_other_methods(self, client, calls):
+        client.get("/cached")
+        r = client.post("/cached")
+        assert r.json == {"calls": 2}
+
+    def test_skips_errors_and_cookies(self, client, calls):
+        client.get("/cached?status=404")
+        client.get("/cached?status=404")
+        assert len(calls) == 2
+
+        client.get("/with-cookie")
+        client.get("/with-cookie")
+        assert len(calls) == 4
+
+    def test_skips_responses_varying_on_the_user(self, client, calls):
+        client.get("/vary-cookie")
+        client.get("/vary-cookie")
+        assert len(calls) == 2
+
+    def test_cached_responses_are_conditional(self, client, calls):
+        etag = client.get("/cached").headers["ETag"]
+        r = client.get("/cached", headers={"If-None-Match": etag})
+        assert r.status_code == 304
+        assert len(calls) == 1
+
+    def test_invalidate(self, client, calls):
+        client.get("/cached")
+        get_view_cache().invalidate(["Author"])
+        client.get("/cached")
+        assert len(calls) == 1
+
+        get_view_cache().invalidate(["Article"])
+        client.get("/cached")
+        assert len(calls) == 2
+
+
+class TestControllerCacheMetaOption:
+    def test_values(self):
+        class Default(Controller):
+            pass
+
+        class Enabled(Controller):
+            class Meta:
+                cache = True
+
+        class Timeout(Controller):
+            class Meta:
+                cache = 60
+
+        class Options(Controller):
+            class Meta:
+                cache = dict(tags=["Article"], vary_on_user=True)
+
+        class Inherited(Options):
+            pass
+
+        class Disabled(Options):
+            class Meta:
+                cache = False
+
+        assert Default.Meta.cache is None
+        assert Enabled.Meta.cache == {}
+        assert Timeout.Meta.cache == {"timeout": 60}
+        assert Options.Meta.cache == {"tags": ["Article"], "vary_on_user": True}
+        assert Inherited.Meta.cache == Options.Meta.cache
+        assert Disabled.Meta.cache is None
+
+    def test_invalid_value(self):
+        with pytest.raises(ValueError, match="The cache meta option must be"):
+
+            class Invalid(Controller):
+                class Meta:
+                    cache = "yes"
+
+    def test_wraps_views(self, app, client):
+        calls = []
+
+        class SiteController(Controller):
+            class Meta:
+                cache = True
+
+            def index(self):
+                calls.append(1)
+                return "index"
+
+        app.add_url_rule("/site", view_func=SiteController.method_as_view("index"))
+        assert client.get("/site").data == b"index"
+        assert client.get("/site").data == b"index"
+        assert len(calls) == 1
+
+    def test_decorators_run_for_cached_responses(self, app, client):
+        def token_required(fn):
+            @functools.wraps(fn)
+            def decorated(*args, **kwargs):
+                if request.headers.get("X-Token") != "secret":
+                    abort(401)
+                return fn(*args, **kwargs)
+
+            return decorated
+
+        class SecretController(Controller):
+            class Meta:
+                cache = True
+                decorators = [token_required]
+
+            def index(self):
+                return "top secret"
+
+        app.add_url_rule("/secret", view_func=SecretController.method_as_view("index"))
+        assert client.get("/secret").status_code == 401
+        r = client.get("/secret", headers={"X-Token": "secret"})
+        assert r.data == b"top secret"
+        assert client.get("/secret").status_code == 401
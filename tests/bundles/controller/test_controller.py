@@ -1,8 +1,12 @@
 import functools
 
+import pytest
+
 from flask import Blueprint
 
+from flask_unchained import injectable
 from flask_unchained.bundles.controller import Controller
+from flask_unchained.exceptions import ServiceUsageError
 
 
 bp = Blueprint("bp", __name__, url_prefix="/bp")
@@ -166,6 +170,80 @@ class TestControllerAttributes:
         assert view.__doc__ == "my_method docstring"
         assert view.__module__ == FooController.__module__
 
+    def test_method_as_view_creates_instance_per_request(self):
+        instances = []
+
+        class FooController(Controller):
+            def __init__(self):
+                instances.append(self)
+
+            def my_method(self):
+                return "response"
+
+        view = FooController.method_as_view("my_method")
+        assert view() == view() == "response"
+        assert len(instances) == 2
+
+    def test_stateless_method_as_view(self, app):
+        instances = []
+        decorated = []
+
+        def count_decorations(fn):
+            decorated.append(fn)
+            return fn
+
+        class FooController(Controller):
+            class Meta:
+                decorators = (count_decorations, first)
+                stateless = True
+
+            def __init__(self):
+                instances.append(self)
+
+            def my_method(self, *args):
+                return args
+
+        view = FooController.method_as_view("my_method")
+        assert view() == view() == ("first",)
+        assert len(instances) == 1
+        assert len(decorated) == 1
+
+        # instances are kept per app
+        assert dict(view.instances) == {app: instances[0]}
+
+    @pytest.mark.bundles(["tests._bundles.scoped_services_bundle"])
+    def test_stateless_requires_singleton_services(self, app):
+        from tests._bundles.scoped_services_bundle.services import (
+            RequestService,
+            SingletonService,
+        )
+
+        class SingletonController(Controller):
+            class Meta:
+                stateless = True
+
+            singleton_service: SingletonService = injectable
+
+            def my_method(self):
+                return self.singleton_service
+
+        class ScopedController(Controller):
+            class Meta:
+                stateless = True
+
+            request_service: RequestService = injectable
+
+            def my_method(self):
+                return self.request_service
+
+        with app.test_request_context():
+            view = SingletonController.method_as_view("my_method")
+            assert isinstance(view(), SingletonService)
+
+            view = ScopedController.method_as_view("my_method")
+            with pytest.raises(ServiceUsageError, match="request-scoped request_service"):
+                view()
+
     def test_render(self, app, templates):
         controller = DefaultController()
 
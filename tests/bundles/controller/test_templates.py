@@ -0,0 +1,67 @@
+import pytest
+
+from flask import Blueprint, render_template
+from jinja2 import TemplateNotFound
+
+
+@pytest.fixture()
+def template_folders(app, tmp_path):
+    """
+    Registers two blueprints with template folders, the first one overriding
+    (extending) the page template of the second.
+    """
+    folders = []
+    for name in ["override", "base"]:
+        folder = tmp_path / name
+        (folder / "site").mkdir(parents=True)
+        app.register_blueprint(Blueprint(name, __name__, template_folder=str(folder)))
+        folders.append(folder)
+
+    override, base = folders
+    (override / "site" / "page.html").write_text(
+        '{% extends "site/page.html" %}{% block content %}override{% endblock %}'
+    )
+    (base / "site" / "page.html").write_text("base: {% block content %}{% endblock %}")
+    app.jinja_env.loader.cache_clear()
+    return folders
+
+
+class TestUnchainedJinjaLoader:
+    def test_it_resolves_overrides(self, app, template_folders):
+        loader = app.jinja_env.loader
+
+        _, filename, _ = loader.get_source(app.jinja_env, "site/page.html")
+        assert filename == str(template_folders[0] / "site" / "page.html")
+
+        _, filename, _ = loader.get_source(app.jinja_env, "site/page.html__1__")
+        assert filename == str(template_folders[1] / "site" / "page.html")
+
+        with pytest.raises(TemplateNotFound):
+            loader.get_source(app.jinja_env, "site/page.html__2__")
+
+    def test_it_indexes_resolved_templates(self, app, template_folders):
+        loader = app.jinja_env.loader
+
+        with app.test_request_context():
+            assert render_template("site/page.html") == "base: override"
+            assert loader.cache_info() == (0, 2, 2)
+
+            assert render_template("site/page.html") == "base: override"
+            assert loader.cache_info() == (2, 2, 2)
+
+        loader.cache_clear()
+        assert loader.cache_info() == (0, 0, 0)
+
+    def test_it_invalidates_by_mtime_when_auto_reloading(self, app, template_folders):
+        app.jinja_env.auto_reload = True
+        loader = app.jinja_env.loader
+        _, base = template_folders
+
+        (base / "site" / "other.html").write_text("base")
+        assert loader.get_source(app.jinja_env, "site/other.html")[0] == "base"
+        assert loader.get_source(app.jinja_env, "site/other.html")[0] == "base"
+        assert loader.cache_info().hits == 1
+
+        (template_folders[0] / "site" / "other.html").write_text("override")
+        assert loader.get_source(app.jinja_env, "site/other.html")[0] == "override"
+        assert loader.cache_info().misses == 2
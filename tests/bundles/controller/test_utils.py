@@ -161,6 +161,39 @@ class TestUrlFor:
             with pytest.raises(BuildError):
                 url_for("delete", id=1, _cls=SiteResource)
 
+    def test_it_caches_urls_of_rules_without_variables(self, app):
+        app.add_url_rule("/about-us", endpoint="site.about_us")
+        with app.test_request_context():
+            assert url_for("site.about_us") == "/about-us"
+            assert url_for("site.about_us") == "/about-us"
+            assert url_for("site.about_us", _anchor="team") == "/about-us#team"
+            assert url_for("site.about_us", page=2) == "/about-us?page=2"
+            assert "site.about_us" in app.extensions["url_for_cache"].static_endpoints
+
+        with app.test_request_context(base_url="http://localhost/prefix"):
+            assert url_for("site.about_us") == "/prefix/about-us"
+
+    def test_it_does_not_cache_urls_with_url_defaults(self, app):
+        app.add_url_rule("/about-us", endpoint="site.about_us")
+        with app.test_request_context():
+            assert url_for("site.about_us") == "/about-us"
+
+        app.url_defaults(lambda endpoint, values: values.setdefault("lang", "en"))
+        with app.test_request_context():
+            assert url_for("site.about_us") == "/about-us?lang=en"
+
+    def test_it_clears_the_cache_when_rules_change(self, app):
+        class SiteController(Controller):
+            def about_us(self):
+                pass
+
+        with app.test_request_context():
+            with pytest.raises(BuildError):
+                url_for("about_us", _cls=SiteController)
+
+            app.add_url_rule("/about-us", endpoint="site_controller.about_us")
+            assert url_for("about_us", _cls=SiteController) == "/about-us"
+
 
 class TestJoin:
     def test_it_works_with_garbage(self):
@@ -1,5 +1,7 @@
 import pytest
 
+from sqlalchemy import event
+
 from flask_unchained import unchained
 
 
@@ -130,3 +132,16 @@ class TestSchema:
                     {"id": str(child.id), "name": child.name} for child in parent.children
                 ],
             )
+
+    def test_eager_loads_selected_relationships(self, graphql_client, db):
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(db.engine, "before_cursor_execute", before_cursor_execute)
+        result = graphql_client.execute(GET_PARENTS)
+        event.remove(db.engine, "before_cursor_execute", before_cursor_execute)
+
+        assert "errors" not in result, result["errors"]
+        assert len(statements) == 2  # the parents, and then all of their children
@@ -1,5 +1,7 @@
 import pytest
 
+from sqlalchemy import event
+from sqlalchemy.orm import selectinload
 from werkzeug.exceptions import NotFound
 
 from flask_unchained.bundles.controller import param_converter
@@ -34,6 +36,18 @@ def role(request):
     return RoleFactory(**kwargs)
 
 
+@pytest.fixture()
+def queries(db):
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", before_cursor_execute)
+    yield statements
+    event.remove(db.engine, "before_cursor_execute", before_cursor_execute)
+
+
 @pytest.mark.usefixtures("bundles", "app")
 @pytest.mark.bundles(["tests.bundles.sqlalchemy._bundles.vendor_one"])
 class TestParamConverter:
@@ -136,3 +150,67 @@ class TestParamConverter:
                 assert foo == 42
 
             method(id=user.id)
+
+    def test_it_uses_the_session_identity_map(self, user, queries):
+        from ._bundles.vendor_one.models import OneUser
+
+        user_id = user.id
+        queries.clear()
+
+        @param_converter(id=OneUser)
+        def method(one_user):
+            return one_user
+
+        assert method(id=user_id) is user
+        assert queries == []
+
+    def test_it_batches_lookups_of_the_same_model(self, db, user, queries):
+        from ._bundles.vendor_one.models import OneUser
+
+        other_user = OneUser(name="other")
+        db.session.add(other_user)
+        db.session.commit()
+        user_id, other_user_id = user.id, other_user.id
+        db.session.expunge_all()
+        queries.clear()
+
+        @param_converter(id=OneUser, one_user_id={"other": OneUser})
+        def method(one_user, other):
+            return one_user, other
+
+        one_user, other = method(id=user_id, one_user_id=other_user_id)
+        assert (one_user.id, other.id) == (user_id, other_user_id)
+        assert len(queries) == 1
+        assert " IN " in queries[0]
+
+    def test_it_reuses_instances_within_a_request(self, app, db, user, queries):
+        from ._bundles.vendor_one.models import OneUser
+
+        user_id = user.id
+        db.session.expunge_all()
+        queries.clear()
+
+        @param_converter(id=OneUser)
+        def method(one_user):
+            return one_user
+
+        with app.test_request_context(f"/?id={user_id}"):
+            assert method() is method()
+        assert len(queries) == 1
+
+    def test_options(self, db, user, role, queries):
+        from ._bundles.vendor_one.models import OneUser
+
+        user.roles.append(role)
+        db.session.commit()
+        user_id = user.id
+        db.session.expunge_all()
+        queries.clear()
+
+        @param_converter(id=OneUser, options=[selectinload(OneUser.user_roles)])
+        def method(one_user):
+            assert len(queries) == 2  # the user and its user_roles
+            return one_user.user_roles
+
+        assert len(method(id=user_id)) == 1
+        assert len(queries) == 2
@@ -0,0 +1,115 @@
+import logging
+
+import pytest
+
+from flask_unchained.bundles.sqlalchemy import QueryStats, record_queries
+from flask_unchained.bundles.sqlalchemy.query_stats import (
+    fingerprint,
+    register_query_listeners,
+)
+
+
+@pytest.fixture()
+def users(db):
+    from ._bundles.vendor_one.models import OneUser
+
+    users = [OneUser(name=f"user{i}") for i in range(3)]
+    db.session.add_all(users)
+    db.session.commit()
+    return users
+
+
+def test_fingerprint():
+    assert fingerprint(
+        "SELECT *\n  FROM one_user WHERE id IN (1, 2, 3) AND name = 'it''s' LIMIT 10"
+    ) == ("SELECT * FROM one_user WHERE id IN (...) AND name = ? LIMIT ?")
+    assert fingerprint("SELECT * FROM t1 WHERE a = %(a_1)s AND b = :b_1") == (
+        "SELECT * FROM t1 WHERE a = ? AND b = ?"
+    )
+    assert fingerprint("SELECT * FROM t WHERE id IN (?, ?)") == (
+        fingerprint("SELECT * FROM t WHERE id IN (?)")
+    )
+
+
+class TestQueryStats:
+    def test_record(self):
+        stats = QueryStats(max_slowest=2)
+        stats.record("SELECT * FROM a WHERE id = 1", 0.001)
+        stats.record("SELECT * FROM a WHERE id = 2", 0.003)
+        stats.record("SELECT * FROM b", 0.002)
+
+        assert stats.count == 3
+        assert stats.duration == pytest.approx(0.006)
+        assert stats.repeated == {"SELECT * FROM a WHERE id = ?": 2}
+        assert stats.slowest == [
+            (0.003, "SELECT * FROM a WHERE id = 2"),
+            (0.002, "SELECT * FROM b"),
+        ]
+        assert stats.to_dict()["duration_ms"] == 6.0
+        assert stats.to_dict()["distinct"] == 2
+
+    def test_slow_queries_get_logged(self, caplog):
+        stats = QueryStats(slow_threshold=0.5)
+        with caplog.at_level(logging.WARNING):
+            stats.record("SELECT 1", 0.1)
+            stats.record("SELECT 2", 0.6)
+        assert [r.getMessage() for r in caplog.records] == [
+            "Slow query (600.00ms): SELECT 2"
+        ]
+
+
+@pytest.mark.bundles(["tests.bundles.sqlalchemy._bundles.vendor_one"])
+class TestRecordQueries:
+    def test_record_queries(self, users):
+        from ._bundles.vendor_one.models import OneUser
+
+        register_query_listeners()
+        with record_queries() as outer:
+            OneUser.query.all()
+            with record_queries() as inner:
+                for user in users:
+                    OneUser.query.filter_by(name=user.name).one()
+        OneUser.query.all()
+
+        assert outer.count == 4
+        assert inner.count == 3
+        assert len(inner.fingerprints) == 1
+
+    def test_assert_max_queries(self, users, assert_max_queries):
+        from ._bundles.vendor_one.models import OneUser
+
+        with assert_max_queries(1) as stats:
+            OneUser.query.all()
+        assert stats.count == 1
+
+        with pytest.raises(pytest.fail.Exception, match="at most 1 queries"):
+            with assert_max_queries(1):
+                for user in users:
+                    OneUser.query.filter_by(name=user.name).one()
+
+    @pytest.mark.options(sqlalchemy_query_stats=True)
+    def test_request_stats(self, app, client, users, caplog):
+        from ._bundles.vendor_one.models import OneUser
+
+        names = [user.name for user in users]
+
+        def view():
+            return str(len([OneUser.query.filter_by(name=n).one() for n in names]))
+
+        app.add_url_rule("/users", view_func=view)
+        with caplog.at_level(logging.INFO):
+            r = client.get("/users")
+
+        assert "X-Query-Count" not in r.headers
+        record = [r for r in caplog.records if hasattr(r, "query_stats")][-1]
+        assert record.getMessage().startswith("GET /users 200 queries=3 distinct=1")
+        assert record.query_stats["count"] == 3
+
+    @pytest.mark.options(sqlalchemy_query_stats=True, sqlalchemy_query_stats_headers=True)
+    def test_response_headers(self, app, client, users):
+        from ._bundles.vendor_one.models import OneUser
+
+        app.add_url_rule("/users", view_func=lambda: str(OneUser.query.count()))
+        r = client.get("/users")
+        assert r.headers["X-Query-Count"] == "1"
+        assert r.headers["Server-Timing"].startswith("db;dur=")
@@ -1,6 +1,7 @@
 import pytest
 
-from flask_unchained import unchained
+from flask_unchained import Service, injectable, unchained
+from flask_unchained.exceptions import ServiceUsageError
 
 
 class TestRegisterServicesHook:
@@ -27,3 +28,105 @@ class TestRegisterServicesHook:
         assert isinstance(unchained.services.one_service, OneService)
         assert isinstance(unchained.services.two_service, TwoService)
         assert isinstance(unchained.services.funky_service, FunkyService)
+
+    @pytest.mark.bundles(["tests._bundles.services_bundle"])
+    @pytest.mark.options(services_lazy=True)
+    def test_lazy_services_get_instantiated_on_first_use(self):
+        from tests._bundles.services_bundle.services import FunkyService, TwoService
+
+        assert unchained.services.is_pending("funky_service")
+        assert unchained.services.is_pending("two_service")
+        assert "funky_service" in unchained.services
+
+        funky_service = unchained.services.funky_service
+        assert isinstance(funky_service, FunkyService)
+        assert isinstance(funky_service.two_service, TwoService)
+        assert not unchained.services.is_pending("two_service")
+        assert unchained.services.funky_service is funky_service
+
+    @pytest.mark.bundles(["tests._bundles.services_bundle"])
+    @pytest.mark.options(services_lazy=True)
+    def test_lazy_services_get_instantiated_when_injected(self):
+        from tests._bundles.services_bundle.services import OneService
+
+        @unchained.inject()
+        def fn(one_service: OneService = injectable):
+            return one_service
+
+        assert unchained.services.is_pending("one_service")
+        assert isinstance(fn(), OneService)
+        assert not unchained.services.is_pending("one_service")
+
+    @pytest.mark.bundles(["tests._bundles.services_bundle"])
+    @pytest.mark.options(services_lazy=True, services_eager=["two_service"])
+    def test_eager_services_get_instantiated_at_boot(self):
+        assert not unchained.services.is_pending("two_service")
+        assert not unchained.services.is_pending("one_service")
+        assert unchained.services.is_pending("funky_service")
+
+
+@pytest.mark.bundles(["tests._bundles.scoped_services_bundle"])
+class TestScopedServices:
+    def test_scope_meta_option(self):
+        from tests._bundles.scoped_services_bundle.services import (
+            AppContextService,
+            ExtendedRequestService,
+            SingletonService,
+        )
+
+        assert SingletonService.Meta.scope == "singleton"
+        assert AppContextService.Meta.scope == "app_context"
+        assert ExtendedRequestService.Meta.scope == "request"
+
+        with pytest.raises(ValueError) as e:
+
+            class Invalid(Service):
+                class Meta:
+                    scope = "session"
+
+        assert "The scope meta option must be one of" in str(e.value)
+
+    def test_app_context_scoped_services(self, app):
+        from tests._bundles.scoped_services_bundle.services import AppContextService
+
+        assert not unchained.services.is_built("app_context_service")
+        service = unchained.services.app_context_service
+        assert isinstance(service, AppContextService)
+        assert service.singleton_service is unchained.services.singleton_service
+        assert unchained.services.app_context_service is service
+
+        with app.app_context():
+            assert unchained.services.app_context_service is not service
+
+    def test_request_scoped_services(self, app):
+        from tests._bundles.scoped_services_bundle.services import RequestService
+
+        with app.test_request_context():
+            service = unchained.services.request_service
+            assert isinstance(service, RequestService)
+            assert unchained.services.request_service is service
+            assert service.app_context_service is unchained.services.app_context_service
+
+            @unchained.inject()
+            def fn(request_service=injectable):
+                return request_service
+
+            assert fn() is service
+
+        with app.test_request_context():
+            assert unchained.services.request_service is not service
+
+    def test_services_cannot_depend_on_shorter_lived_services(self):
+        from tests._bundles.scoped_services_bundle.services import RequestService
+
+        class Consumer(Service):
+            def __init__(self, request_service: RequestService = injectable):
+                pass
+
+        unchained._services_registry["consumer"] = Consumer
+        with pytest.raises(ServiceUsageError) as e:
+            unchained._check_service_scope("consumer", ["request_service"])
+        assert (
+            "The singleton-scoped consumer service cannot depend upon the "
+            "request-scoped request_service service." in str(e.value)
+        )
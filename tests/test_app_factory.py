@@ -1,7 +1,13 @@
 import pytest
 
+from jinja2.utils import LRUCache
+
+from flask_unchained import TEST, unchained
 from flask_unchained.app_factory import AppFactory, BundleNotFoundError
 from flask_unchained.bundles.controller import ControllerBundle
+from flask_unchained.bundles.mail import mail
+from flask_unchained.exceptions import FrozenConfigError
+from flask_unchained.flask_unchained import AttrDictFlaskConfig
 
 from ._bundles.app_bundle_in_module.bundle import AppBundleInModule
 from ._bundles.bundle_in_module.bundle import ModuleBundle
@@ -78,3 +84,95 @@ class TestLoadBundles:
             VendorBundle(),
             AppBundleInModule(),
         }
+
+
+class TestFreezeConfig:
+    def test_not_frozen_by_default(self, app):
+        assert app.config.frozen is None
+
+    @pytest.mark.bundles(["flask_unchained.bundles.mail"])
+    def test_create_app(self, bundles):
+        unchained._reset()
+        app = AppFactory().create_app(
+            TEST, bundles=bundles, _config_overrides={"FREEZE_CONFIG": True}
+        )
+        assert app.config.frozen.FREEZE_CONFIG is True
+        assert app.config.frozen["MAIL_SERVER"] == app.config.MAIL_SERVER
+
+    @pytest.mark.bundles(["flask_unchained.bundles.mail"])
+    def test_config_properties_bound(self, app):
+        frozen = AppFactory().freeze_config(app)
+        assert mail.server == app.config.MAIL_SERVER
+
+        # bound properties read from the snapshot, not from current_app
+        frozen._set("MAIL_SERVER", "snapshot.example.com")
+        assert mail.server == "snapshot.example.com"
+
+    @pytest.mark.bundles(["tests._bundles.scoped_services_bundle"])
+    @pytest.mark.options(freeze_config=True, services_lazy=True)
+    def test_skips_services_not_built_yet(self, app):
+        from tests._bundles.scoped_services_bundle.services import RequestService
+
+        assert app.config.frozen is not None
+        assert not unchained.services.is_built("singleton_service")
+        with app.test_request_context():
+            assert isinstance(unchained.services.request_service, RequestService)
+
+    def test_writes_warn_outside_of_production(self, app):
+        frozen = AppFactory().freeze_config(app)
+
+        with pytest.warns(UserWarning, match="MY_KEY"):
+            app.config.MY_KEY = "value"
+        assert frozen.MY_KEY == "value"
+
+        with pytest.warns(UserWarning, match="MY_KEY"):
+            del app.config["MY_KEY"]
+        assert "MY_KEY" not in frozen
+
+    def test_writes_raise_in_production(self):
+        config = AttrDictFlaskConfig(".", {"DEBUG": False, "TESTING": True})
+        config.freeze(raise_on_write=True)
+
+        with pytest.raises(FrozenConfigError):
+            config["DEBUG"] = True
+        with pytest.raises(FrozenConfigError):
+            config.DEBUG = True
+        with pytest.raises(FrozenConfigError):
+            config.update(DEBUG=True)
+        with pytest.raises(FrozenConfigError):
+            config.pop("TESTING")
+        assert config["DEBUG"] is False
+        assert config["TESTING"] is True
+
+
+@pytest.mark.bundles([
+    "flask_unchained.bundles.babel",
+    "flask_unchained.bundles.controller",
+    "tests.bundles.controller.fixtures.auto_route_app_bundle",
+])
+@pytest.mark.options(warmup_gc_freeze=False)
+class TestWarmup:
+    def test_warmup(self, app):
+        # the template cache is disabled in tests
+        app.jinja_env.cache = LRUCache(10)
+
+        report = AppFactory().warmup(app)
+        assert report["routes"] == len(app.view_functions)
+        assert report["templates"] == 3
+        assert report["catalogs"] == 1
+        assert "site/index.html" in [
+            template.name for template in app.jinja_env.cache.values()
+        ]
+
+    def test_warmup_without_template_cache(self, app):
+        assert AppFactory().warmup(app)["templates"] == 0
+
+    def test_domains_are_cached_per_app(self, app):
+        from flask_unchained.bundles.babel import _get_domain_by_name
+
+        assert app.extensions["babel_domains"] == {}
+        domain = _get_domain_by_name("flask_unchained.bundles.security", app)
+        assert _get_domain_by_name("flask_unchained.bundles.security", app) is domain
+        assert app.extensions["babel_domains"] == {
+            "flask_unchained.bundles.security": domain
+        }
@@ -0,0 +1,87 @@
+import tracemalloc
+
+import pytest
+
+from flask_unchained import TEST, AppFactory, unchained
+from flask_unchained.boot_profiler import BootProfiler, boot_profiler
+
+
+@pytest.fixture()
+def profiler():
+    boot_profiler.enable(trace_allocations=False)
+    yield boot_profiler
+    boot_profiler.disable()
+    boot_profiler.reset()
+
+
+class TestBootProfiler:
+    def test_disabled_by_default(self):
+        profiler = BootProfiler()
+        with profiler.profile("hook", "services"):
+            pass
+        assert profiler.records == []
+
+    def test_nested_import_time(self):
+        profiler = BootProfiler()
+        profiler.enable(trace_allocations=False)
+        with profiler.profile("hook", "services"):
+            with profiler.profile("import", "outer"):
+                with profiler.profile("import", "inner"):
+                    pass
+        profiler.disable()
+
+        inner, outer, hook = profiler.records
+        assert (inner.depth, outer.depth, hook.depth) == (2, 1, 0)
+        assert outer.import_time == outer.wall_time
+        assert hook.import_time == outer.wall_time
+
+    def test_disable_keeps_tracing_it_did_not_start(self):
+        tracemalloc.start()
+        try:
+            profiler = BootProfiler()
+            profiler.enable()
+            profiler.disable()
+            assert tracemalloc.is_tracing()
+        finally:
+            tracemalloc.stop()
+
+        profiler.enable()
+        assert tracemalloc.is_tracing()
+        profiler.disable()
+        assert not tracemalloc.is_tracing()
+
+    @pytest.mark.bundles(["tests._bundles.services_bundle"])
+    def test_create_app(self, profiler, bundles):
+        unchained._reset()
+        AppFactory().create_app(TEST, bundles=bundles)
+
+        categories = {record.category for record in profiler.records}
+        assert {"app", "bundle", "hook", "import"} <= categories
+        hook_names = {r.name for r in profiler.records if r.category == "hook"}
+        assert {"register_extensions", "services"} <= hook_names
+
+        trace = profiler.to_chrome_trace()
+        assert len(trace["traceEvents"]) == len(profiler.records)
+        assert {"name", "cat", "ph", "ts", "dur", "pid", "tid"} <= set(
+            trace["traceEvents"][0]
+        )
+
+    @pytest.mark.bundles(["tests._bundles.services_bundle"])
+    def test_create_app_disables_profiling(self, bundles, monkeypatch):
+        monkeypatch.setenv("UNCHAINED_BOOT_PROFILE", "true")
+        unchained._reset()
+        try:
+            AppFactory().create_app(TEST, bundles=bundles)
+
+            assert not boot_profiler.enabled
+            assert not tracemalloc.is_tracing()
+            num_records = len(boot_profiler.records)
+            assert num_records
+
+            # eg services instantiated per request
+            with boot_profiler.profile("service", "after_boot"):
+                pass
+            assert len(boot_profiler.records) == num_records
+        finally:
+            boot_profiler.disable()
+            boot_profiler.reset()
@@ -1,6 +1,11 @@
 import os
 
-from flask_unchained import Bundle
+from unittest import mock
+
+import pytest
+
+from flask_unchained import Bundle, unchained
+from flask_unchained.hooks.views_hook import ViewsHook
 
 from ._bundles.empty_bundle import EmptyBundle
 from ._bundles.myapp import MyAppBundle
@@ -123,3 +128,27 @@ class TestBundle:
         assert MyAppBundle()._static_folders == [MyAppBundle().static_folder]
         assert VendorBundle()._static_folders == []
         assert OverrideVendorBundle()._static_folders == [VendorBundle().static_folder]
+
+
+class TestBundleGraph:
+    @pytest.mark.bundles(["tests._bundles.override_vendor_bundle"])
+    def test_memoized_after_load_bundles(self, app):
+        graph = unchained.bundle_graph
+        bundle = app.unchained.bundles.vendor_bundle
+        assert OverrideVendorBundle in graph and VendorBundle in graph
+
+        # superclasses only get instantiated once
+        base = list(bundle._iter_class_hierarchy())[0]
+        assert list(bundle._iter_class_hierarchy())[0] is base
+        assert list(bundle._iter_class_hierarchy())[-1] is bundle
+
+        with mock.patch.object(
+            ViewsHook, "import_bundle_modules", side_effect=AssertionError
+        ):
+            assert bundle._has_views is True
+            assert bundle._blueprint_name == "vendor_bundle"
+
+    def test_reset_invalidates(self):
+        assert unchained.bundle_graph is not None
+        unchained._reset()
+        assert unchained.bundle_graph is None
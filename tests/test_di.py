@@ -1,6 +1,9 @@
+import inspect
+
 import pytest
 
 from flask_unchained import Service, injectable, unchained
+from flask_unchained.di import _InjectionPlan
 from flask_unchained.exceptions import ServiceUsageError
 
 
@@ -14,6 +17,61 @@ def test_injectable():
     assert "Foo was initialized without the fail parameter" in str(e.value)
 
 
+@pytest.mark.bundles(["tests._bundles.services_bundle"])
+class TestInjectionPlan:
+    def test_is_fast_path(self):
+        def fn(a, b=injectable, *args, c=injectable, **kwargs):
+            pass
+
+        plan = _InjectionPlan(inspect.signature(fn))
+        assert plan.is_fast_path((1,), {})
+        assert plan.is_fast_path((1, 2), {"c": 3})
+        assert plan.is_fast_path((), {"a": 1, "b": 2})
+        assert not plan.is_fast_path((1, 2, 3), {})
+        assert not plan.is_fast_path((1,), {"a": 1})
+        assert not plan.is_fast_path((1,), {"d": 4})
+
+    def test_only_missing_params_get_injected(self):
+        @unchained.inject()
+        def fn(a, one_service=injectable, two_service=injectable):
+            return a, one_service, two_service
+
+        sentinel = object()
+        one_service = unchained.services.one_service
+        two_service = unchained.services.two_service
+        assert fn(1) == (1, one_service, two_service)
+        assert fn(1, sentinel) == (1, sentinel, two_service)
+        assert fn(1, two_service=sentinel) == (1, one_service, sentinel)
+        assert fn(a=1, one_service=sentinel) == (1, sentinel, two_service)
+
+    def test_unusual_argument_shapes_fall_back_to_binding(self):
+        @unchained.inject("one_service")
+        def fn(*args, one_service=None, **kwargs):
+            return args, one_service, kwargs
+
+        args, one_service, kwargs = fn(1, 2, foo="bar")
+        assert args == (1, 2)
+        assert one_service is unchained.services.one_service
+        assert kwargs == {"foo": "bar"}
+
+    def test_missing_injectables_raise_on_both_paths(self):
+        @unchained.inject()
+        def fn(*args, not_a_service=injectable):
+            pass
+
+        with pytest.raises(ServiceUsageError) as e:
+            fn()
+        assert "fn was called without the not_a_service parameter" in str(e.value)
+
+        with pytest.raises(ServiceUsageError) as e:
+            fn(1, 2)
+        assert "fn was called without the not_a_service parameter" in str(e.value)
+
+        with pytest.raises(ServiceUsageError) as e:
+            fn(not_a_service=injectable)
+        assert "fn was called without the not_a_service parameter" in str(e.value)
+
+
 @pytest.mark.bundles(["tests._bundles.services_ext_bundle"])
 class TestInject:
     def test_services_named_correctly(self):
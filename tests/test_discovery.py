@@ -0,0 +1,106 @@
+import importlib
+import os
+import sys
+
+from unittest import mock
+
+import pytest
+
+from flask_unchained.discovery import DiscoveryIndex, _fingerprint
+
+
+@pytest.fixture()
+def package(tmp_path):
+    package_dir = tmp_path / "discovery_pkg"
+    package_dir.mkdir()
+    (package_dir / "__init__.py").write_text("")
+    (package_dir / "one.py").write_text("class One:\n    pass\n")
+    sys.path.insert(0, str(tmp_path))
+    yield importlib.import_module("discovery_pkg")
+    sys.path.remove(str(tmp_path))
+    for name in [x for x in sys.modules if x.startswith("discovery_pkg")]:
+        del sys.modules[name]
+
+
+class TestDiscoveryIndex:
+    def test_get_child_module_names(self):
+        hooks_pkg = importlib.import_module("flask_unchained.hooks")
+        single_module = importlib.import_module("flask_unchained.hooks.views_hook")
+
+        index = DiscoveryIndex()
+        names = index.get_child_module_names(hooks_pkg)
+        assert "flask_unchained.hooks.run_hooks_hook" in names
+        assert index.get_child_module_names(single_module) == []
+
+        with mock.patch("pkgutil.walk_packages") as walk_packages:
+            assert index.get_child_module_names(hooks_pkg) == names
+        walk_packages.assert_not_called()
+
+    def test_get_members(self, package):
+        one = importlib.import_module("discovery_pkg.one")
+
+        index = DiscoveryIndex()
+        members = index.get_members(one, lambda obj: isinstance(obj, type))
+        assert members == [("One", one.One)]
+
+        # the member names get indexed once per load of the module
+        with mock.patch("flask_unchained.discovery.dir", create=True) as dir_:
+            assert index.get_members(one, lambda obj: isinstance(obj, type)) == members
+        dir_.assert_not_called()
+
+        # replacing a member (in the same module) returns the new one
+        one.One = type("One", (), {})
+        assert index.get_members(one, lambda obj: isinstance(obj, type)) == [
+            ("One", one.One)
+        ]
+
+    def test_get_members_after_reload(self, package, tmp_path):
+        one = importlib.import_module("discovery_pkg.one")
+
+        index = DiscoveryIndex()
+        assert index.get_members(one, lambda obj: isinstance(obj, type)) == [
+            ("One", one.One)
+        ]
+
+        # a same-size edit, keeping the file's modification time
+        path = tmp_path / "discovery_pkg" / "one.py"
+        stat = path.stat()
+        path.write_text("class Two:\n    pass\n")
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        importlib.reload(one)
+
+        members = index.get_members(one, lambda obj: isinstance(obj, type))
+        assert members == [("One", one.One), ("Two", one.Two)]
+
+    def test_persisted_child_module_names(self, package, tmp_path):
+        cache_path = str(tmp_path / "discovery.json")
+
+        index = DiscoveryIndex()
+        index.load(cache_path)
+        assert index.get_child_module_names(package) == ["discovery_pkg.one"]
+        index.save(cache_path)
+        assert os.path.exists(cache_path)
+
+        # warm start: the package does not get walked again
+        index = DiscoveryIndex()
+        index.load(cache_path)
+        with mock.patch("pkgutil.walk_packages") as walk_packages:
+            assert index.get_child_module_names(package) == ["discovery_pkg.one"]
+        walk_packages.assert_not_called()
+
+        # so does a same-size edit keeping the file's modification time
+        fingerprint = _fingerprint(package.__path__)
+        path = tmp_path / "discovery_pkg" / "one.py"
+        stat = path.stat()
+        path.write_text("class Uno:\n    pass\n")
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert _fingerprint(package.__path__) != fingerprint
+
+        # changing the package's files invalidates the persisted names
+        (tmp_path / "discovery_pkg" / "two.py").write_text("")
+        index = DiscoveryIndex()
+        index.load(cache_path)
+        assert index.get_child_module_names(package) == [
+            "discovery_pkg.one",
+            "discovery_pkg.two",
+        ]
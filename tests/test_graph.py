@@ -0,0 +1,57 @@
+import pytest
+
+from flask_unchained.exceptions import CircularDependencyError
+from flask_unchained.graph import DependencyGraph
+
+
+class TestDependencyGraph:
+    def test_resolve_order(self):
+        dag = DependencyGraph("things")
+        dag.add_node("app", "app data")
+        dag.add_edge("app", "two")
+        dag.add_edge("app", "one")
+        dag.add_edge("two", "one")
+        dag.add_node("other")
+
+        assert dag.resolve_order() == ["one", "two", "other", "app"]
+        assert dag.dependencies("app") == ["two", "one"]
+        assert dag.get("app") == "app data"
+        assert dag.get("one") is None
+        assert "one" in dag and len(dag) == 4
+
+    def test_order_is_stable(self):
+        def make_dag():
+            dag = DependencyGraph("things")
+            for name in ["c", "a", "b", "d"]:
+                dag.add_node(name)
+            dag.add_edge("d", "a")
+            return dag
+
+        assert make_dag().resolve_order() == make_dag().resolve_order()
+
+    def test_resolved_order_invalidated_by_changes(self):
+        dag = DependencyGraph("things")
+        dag.add_edge("one", "two")
+        assert dag.resolve_order() == ["two", "one"]
+
+        dag.add_edge("two", "three")
+        assert dag.resolve_order() == ["three", "two", "one"]
+
+    def test_circular_dependency(self):
+        dag = DependencyGraph("things")
+        dag.add_edge("start", "one")
+        dag.add_edge("one", "two")
+        dag.add_edge("two", "three")
+        dag.add_edge("three", "one")
+
+        with pytest.raises(CircularDependencyError) as e:
+            dag.resolve_order()
+        assert str(e.value) == (
+            "Circular dependency detected between things: "
+            "one -> two, two -> three, three -> one"
+        )
+
+    def test_find_cycle_without_cycle(self):
+        dag = DependencyGraph("things")
+        dag.add_edge("one", "two")
+        assert dag.find_cycle() == []
@@ -0,0 +1,90 @@
+import importlib
+import sys
+
+from unittest import mock
+
+import pytest
+
+from flask_unchained import AppFactory, unchained
+from flask_unchained.hooks.run_hooks_hook import RunHooksHook
+from flask_unchained.preimport import PreimportFinder
+
+
+@pytest.fixture()
+def package(tmp_path):
+    package_dir = tmp_path / "preimport_pkg"
+    (package_dir / "views").mkdir(parents=True)
+    (package_dir / "__init__.py").write_text(
+        "from flask_unchained import Bundle\nclass PreimportBundle(Bundle):\n    pass\n"
+    )
+    (package_dir / "services.py").write_text("ORDER = []\n")
+    (package_dir / "views" / "__init__.py").write_text("")
+    (package_dir / "views" / "one.py").write_text(
+        "from preimport_pkg.services import ORDER\nORDER.append('one')\n"
+    )
+    (package_dir / "broken.py").write_text("def broken(:\n")
+    sys.path.insert(0, str(tmp_path))
+    yield importlib.import_module("preimport_pkg")
+    sys.path.remove(str(tmp_path))
+    for name in [x for x in sys.modules if x.startswith("preimport_pkg")]:
+        del sys.modules[name]
+
+
+class TestPreimportFinder:
+    def test_preimport(self, package):
+        finder = PreimportFinder()
+        result = finder.preimport(
+            ["preimport_pkg.services", "preimport_pkg.views", "preimport_pkg.missing"],
+            include_submodules=["preimport_pkg.views"],
+        )
+        assert result.module_names == [
+            "preimport_pkg.services",
+            "preimport_pkg.views",
+            "preimport_pkg.views.one",
+        ]
+        assert "preimport_pkg.services" not in sys.modules  # not executed yet
+
+        finder.install()
+        try:
+            with mock.patch("importlib.machinery.SourceFileLoader.get_code") as get_code:
+                one = importlib.import_module("preimport_pkg.views.one")
+            get_code.assert_not_called()
+        finally:
+            finder.uninstall()
+
+        assert package.services.ORDER == ["one"]
+        assert type(one.__loader__) is importlib.machinery.SourceFileLoader
+        assert one.__spec__.loader is one.__loader__
+
+    def test_errors_are_attributed_to_modules(self, package):
+        result = PreimportFinder().preimport(["preimport_pkg.broken"])
+        assert result.module_names == []
+        assert isinstance(result.errors["preimport_pkg.broken"], SyntaxError)
+
+
+class TestRunHooksHookPreimport:
+    def test_preimport_bundle_modules(self, app, package):
+        bundle = AppFactory.load_bundle("preimport_pkg")
+        hook = RunHooksHook(unchained)
+        hook_order = hook.resolve_hook_order(hook.collect_unchained_hooks())
+
+        finder = hook.preimport_bundle_modules(app, hook_order, [bundle])
+        try:
+            assert list(finder._specs) == [
+                "preimport_pkg.services",
+                "preimport_pkg.views",
+                "preimport_pkg.views.one",
+            ]
+        finally:
+            finder.uninstall()
+
+    def test_preimport_errors_get_logged(self, app, package, caplog, tmp_path):
+        (tmp_path / "preimport_pkg" / "managers.py").write_text("def broken(:\n")
+        bundle = AppFactory.load_bundle("preimport_pkg")
+        hook = RunHooksHook(unchained)
+        hook_order = hook.resolve_hook_order(hook.collect_unchained_hooks())
+
+        with caplog.at_level("DEBUG", logger=app.logger.name):
+            finder = hook.preimport_bundle_modules(app, hook_order, [bundle])
+        finder.uninstall()
+        assert "Could not preimport preimport_pkg.managers: SyntaxError" in caplog.text
@@ -2,7 +2,13 @@ import datetime
 
 import pytest
 
-from flask_unchained.utils import get_boolean_env, safe_import_module, utcnow
+from flask_unchained.exceptions import FrozenConfigError
+from flask_unchained.utils import (
+    FrozenConfig,
+    get_boolean_env,
+    safe_import_module,
+    utcnow,
+)
 
 
 def test_get_boolean_env(monkeypatch):
@@ -43,3 +49,20 @@ def test_utc_now():
     with pytest.raises(TypeError) as e:
         assert utcnow() <= datetime.datetime.utcnow()
     assert "can't compare offset-naive and offset-aware datetimes" in str(e.value)
+
+
+def test_frozen_config():
+    frozen = FrozenConfig.from_mapping({"DEBUG": True, "not-an-identifier": 1})
+    assert frozen.DEBUG is True
+    assert frozen["DEBUG"] is True
+    assert frozen["not-an-identifier"] == 1
+    assert frozen.get("MISSING", 42) == 42
+    assert "DEBUG" in frozen and len(frozen) == 2
+    assert not hasattr(frozen, "__dict__")
+
+    with pytest.raises(AttributeError):
+        frozen.MISSING
+    with pytest.raises(FrozenConfigError):
+        frozen.DEBUG = False
+    with pytest.raises(FrozenConfigError):
+        del frozen.DEBUG